@@ -1,3 +1,3 @@
-from .person import Person, PersonState
+from .person import Person, PersonBatch, PersonState
 
-__all__ = ["Person", "PersonState"]
+__all__ = ["Person", "PersonBatch", "PersonState"]
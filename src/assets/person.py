@@ -4,9 +4,15 @@ Author: Austin Delic (austin@austindelic.com)
 """
 
 from enum import StrEnum, auto
+from functools import cache
+from typing import override
+
+import numpy as np
+
 from src.animation import Animation, Frame, Line, Point, Segment
+from src.batch import BatchField, EntityBatch
 from src.clock import ClockProtocol
-from src.entity import EngineEntity, Size
+from src.entity import Bounds, EngineEntity, Size, compute_animation_bounds
 
 
 class PersonState(StrEnum):
@@ -234,10 +240,45 @@ def _frames() -> list[Frame]:
     return [contact, down, passing, up]
 
 
+@cache
+def _animation() -> tuple[Animation, Bounds]:
+    anim = Animation(_frames())
+    return anim, compute_animation_bounds(anim, 12)
+
+
+class PersonBatch(EntityBatch):
+    """
+    Moves every wandering guest at once. Guests with a `target` ride are
+    steered by the engine's `Navigator` instead.
+    """
+
+    fields = {"_x": float, "_y": float, "state": PersonState, "target": float}
+    params = ("_speed",)
+
+    @override
+    def update(self, clock: ClockProtocol) -> None:
+        a = self.arrays
+        wandering = (a["state"] == self.code("state", PersonState.WALKING)) & (
+            a["target"] < 0
+        )
+        if wandering.any():
+            step = np.where(wandering, a["_speed"] * clock.dt, 0.0)
+            a["_x"] += step
+            a["_y"] += step
+
+
 class Person(EngineEntity):
+    batch_type = PersonBatch
+
+    # Per-frame state; lives in PersonBatch arrays while batched
+    state = BatchField()
+    target = BatchField()  # navigator ride index (walking to or queueing); -1 wanders
+    _x = BatchField()
+    _y = BatchField()
+
     def __init__(self, position: Point) -> None:
-        # 1) immutable base geometry (animation fr:mes)
-        anim = Animation(_frames())
+        # 1) immutable base geometry (animation fr:mes), shared by every guest
+        anim, bounds = _animation()
 
         # 2) world pose (start at origin, scale down a bit)
         super().__init__(
@@ -245,15 +286,29 @@ class Person(EngineEntity):
             position=position,
             target_size=Size(1.75, 0.5, 0.4),
             fps=12,
+            bounds=bounds,
         )
 
         # 3) behaviour/state
         self.state: PersonState = PersonState.WALKING
+        self.target: float = -1.0
         self._speed = self.target_size.width  # units per second in world coords
 
+    @property
+    def position(self) -> Point:
+        return Point(self._x, self._y)
+
+    @position.setter
+    def position(self, value: Point) -> None:
+        self._x = value.x
+        self._y = value.y
+
+    @override
     def update(self, clock: ClockProtocol) -> None:
         # animation frame selection uses Eng ineEntity.fps (12 fps here)
         # motion uses real seconds so it’s frame-rate independent
+        if self.target >= 0:
+            return  # steered by the navigator
         if self.state is PersonState.WALKING:
             # reassign a NEW Point (Point is frozen/immutable)
             self.position = Point(
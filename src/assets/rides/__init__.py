@@ -1,4 +1,28 @@
+from .ride import Ride, RideAsset, RideOperation, RideSpec
+from .registry import (
+    RideType,
+    get_ride_type,
+    register_ride,
+    register_ride_type,
+    ride_type_names,
+)
 from .ferris_wheel import FerrisWheel, FerrisWheelState
 from .pirate_ship import PirateShip
+from .drop_tower import DropTower, TowerState
 
-__all__ = ["FerrisWheel", "FerrisWheelState", "PirateShip"]
+__all__ = [
+    "DropTower",
+    "FerrisWheel",
+    "FerrisWheelState",
+    "PirateShip",
+    "Ride",
+    "RideAsset",
+    "RideOperation",
+    "RideSpec",
+    "RideType",
+    "TowerState",
+    "get_ride_type",
+    "register_ride",
+    "register_ride_type",
+    "ride_type_names",
+]
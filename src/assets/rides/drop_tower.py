@@ -1,10 +1,18 @@
 # drow_tower.py
 import math
 from enum import Enum, StrEnum, auto
+from functools import cache
 from typing import override
-from src.animation import Animation, Frame, Line, Point, Fill, Segment
-from src.assets.rides.ride import Ride
+
+import numpy as np
+
+from src.animation import Frame, Line, Point, Fill, Segment
+from src.assets.rides.registry import register_ride
+from src.assets.rides.ride import Ride, RideAsset
+from src.batch import BatchField, EntityBatch
 from src.entity import Size
+from src.extrusion import ExtrusionTopology, extrusion_topology
+from src.lod import LOD_FULL, simplify_frame
 from src.clock import ClockProtocol
 
 
@@ -426,6 +434,25 @@ def _frames() -> list[Frame]:
     ]
 
 
+@cache
+def _posable_frame(lod: int) -> tuple[Frame, int]:
+    """Static parts followed by the seat parts, and the first seat draw."""
+    static = (
+        simplify_frame(_FRAME, lod)
+        + simplify_frame(_BASE_UPPER, lod)
+        + simplify_frame(_BASE_LOWER, lod)
+        + simplify_frame(_BANNER_ENDS, lod)
+        + simplify_frame(_BANNER_BASE, lod)
+        + simplify_frame(_BANNER_STRIPES, lod)
+    )
+    seat = [
+        draw
+        for part in (_SEAT_FRAME, _SEAT_BACKS, _SEAT_CAGE)
+        for draw in simplify_frame(part, lod)
+    ]
+    return static + seat, len(static)
+
+
 class TowerState(Enum):
     STOPPED = auto()
     ASCENDING = auto()
@@ -433,10 +460,108 @@ class TowerState(Enum):
     WAITING_BOTTOM = auto()
 
 
+class DropTowerBatch(EntityBatch):
+    """Runs the ascend/descend/wait state machine for every tower at once."""
+
+    fields = {
+        "_seat_y": float,
+        "_velocity": float,
+        "_wait_timer": float,
+        "state": TowerState,
+    }
+    params = (
+        "_min_height",
+        "_max_height",
+        "_gravity",
+        "_ascend_speed",
+        "_max_fall_speed",
+        "_ease_factor",
+        "_wait_time_bottom",
+    )
+
+    @override
+    def update(self, clock: ClockProtocol) -> None:
+        dt = clock.dt
+        a = self.arrays
+        seat_y, velocity, wait_timer, state = (
+            a["_seat_y"],
+            a["_velocity"],
+            a["_wait_timer"],
+            a["state"],
+        )
+        min_h, max_h = a["_min_height"], a["_max_height"]
+
+        ascending_code = self.code("state", TowerState.ASCENDING)
+        descending_code = self.code("state", TowerState.DESCENDING)
+        waiting_code = self.code("state", TowerState.WAITING_BOTTOM)
+
+        # Masks are taken up front so a tower changes state at most once per tick
+        ascending = state == ascending_code
+        descending = state == descending_code
+        waiting = state == waiting_code
+
+        if ascending.any():
+            ease = np.clip((max_h - seat_y) * a["_ease_factor"], 0.05, 1.0)
+            seat_y[ascending] += (a["_ascend_speed"] * dt * ease)[ascending]
+
+            top = ascending & (seat_y >= max_h)
+            seat_y[top] = max_h[top]
+            velocity[top] = 0.0
+            state[top] = descending_code
+
+        if descending.any():
+            velocity[descending] = np.maximum(
+                velocity[descending] + a["_gravity"][descending] * dt * 4.0,
+                a["_max_fall_speed"][descending],
+            )
+            seat_y[descending] += velocity[descending] * dt
+
+            easing = descending & (seat_y <= min_h + 0.25)
+            damping = np.clip(np.abs(seat_y - min_h) * 4.5, 0.15, 0.95)
+            velocity[easing] *= damping[easing]
+
+            bottom = descending & (seat_y <= min_h)
+            seat_y[bottom] = min_h[bottom]
+            velocity[bottom] = 0.0
+            wait_timer[bottom] = a["_wait_time_bottom"][bottom]
+            state[bottom] = waiting_code
+
+        if waiting.any():
+            wait_timer[waiting] -= dt
+            state[waiting & (wait_timer <= 0)] = ascending_code
+
+
+@cache
+def _asset() -> RideAsset:
+    return RideAsset.from_frames(_frames())
+
+
+@register_ride("DropTower", asset=_asset)
 class DropTower(Ride):
-    def __init__(self, position: Point) -> None:
-        anim = Animation(_frames())
-        super().__init__(animation=anim, position=position, size=Size(20, 10, 5))
+    batch_type = DropTowerBatch
+
+    # Per-frame state; lives in DropTowerBatch arrays while batched
+    state = BatchField()
+    _seat_y = BatchField()
+    _velocity = BatchField()
+    _wait_timer = BatchField()
+
+    def __init__(
+        self,
+        position: Point,
+        max_capacity: int = 10,
+        ride_time: float = 30.0,
+        asset: RideAsset | None = None,
+    ) -> None:
+        asset = _asset() if asset is None else asset
+        super().__init__(
+            animation=asset.animation,
+            position=position,
+            size=Size(20, 10, 5),
+            max_capacity=max_capacity,
+            ride_time=ride_time,
+            bounds=asset.bounds,
+        )
 
         self._pivot_local = Point(0.5, 0.5)
         self.state: TowerState = TowerState.STOPPED
@@ -500,30 +625,48 @@ class DropTower(Ride):
                 self.state = TowerState.ASCENDING
 
     @override
-    def get_frame(self, frame_clock: int, engine_fps: int = 24) -> Frame:
+    def get_frame(
+        self, frame_clock: int, engine_fps: int = 24, lod: int = LOD_FULL
+    ) -> Frame:
         """Return a frame where the seat is vertically translated."""
         base_frame = (
-            _FRAME
-            + _BASE_UPPER
-            + _BASE_LOWER
-            + _BANNER_ENDS
-            + _BANNER_BASE
-            + _BANNER_STRIPES
+            simplify_frame(_FRAME, lod)
+            + simplify_frame(_BASE_UPPER, lod)
+            + simplify_frame(_BASE_LOWER, lod)
+            + simplify_frame(_BANNER_ENDS, lod)
+            + simplify_frame(_BANNER_BASE, lod)
+            + simplify_frame(_BANNER_STRIPES, lod)
         )
 
+        seat_y = self._seat_y
         seat_parts: Frame = []
         for part in (_SEAT_FRAME, _SEAT_BACKS, _SEAT_CAGE):
-            for draw in part:
+            for draw in simplify_frame(part, lod):
                 if isinstance(draw, Segment):
-                    s = Point(draw.start.x, draw.start.y + self._seat_y)
-                    e = Point(draw.end.x, draw.end.y + self._seat_y)
+                    s = Point(draw.start.x, draw.start.y + seat_y)
+                    e = Point(draw.end.x, draw.end.y + seat_y)
                     seat_parts.append(Segment(s, e, draw.line))
                 elif isinstance(draw, Fill):
-                    pts = [Point(p.x, p.y + self._seat_y) for p in draw.points]
+                    pts = [Point(p.x, p.y + seat_y) for p in draw.points]
                     seat_parts.append(Fill(pts, draw.color, draw.alpha, draw.edgecolor))
 
         return base_frame + seat_parts
 
+    @override
+    def visual_key(self, frame_clock: int, engine_fps: int = 24) -> tuple:
+        return super().visual_key(frame_clock, engine_fps) + (self._seat_y,)
+
+    @override
+    def get_geometry(
+        self, frame_clock: int, engine_fps: int = 24, lod: int = LOD_FULL
+    ) -> tuple[ExtrusionTopology, np.ndarray]:
+        """Translates the seat part of the cached vertex array."""
+        frame, first_seat = _posable_frame(lod)
+        topology = extrusion_topology(frame)
+        local = topology.local.copy()
+        local[topology.offsets[first_seat] :, 1] += self._seat_y
+        return topology, local
+
     def toggle(self) -> None:
         """Toggle continuous motion on/off."""
         if self.state is TowerState.STOPPED:
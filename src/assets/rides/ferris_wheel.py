@@ -4,11 +4,13 @@ Author: Austin Delic (austin@austindelic.com)
 """
 
 from enum import StrEnum, auto
+from functools import cache
 from typing import override
 from src.entity import Size
-from src.animation import Animation, Frame, Line, Point, Segment
+from src.animation import Frame, Line, Point, Segment
 from src.clock import ClockProtocol
-from .ride import Ride
+from .registry import register_ride
+from .ride import Ride, RideAsset
 
 
 class FerrisWheelState(StrEnum):
@@ -106,17 +108,32 @@ def _frames() -> list[Frame]:
     return [base + hub]
 
 
+@cache
+def _asset() -> RideAsset:
+    return RideAsset.from_frames(_frames(), fps=12)
+
+
+@register_ride("FerrisWheel", asset=_asset)
 class FerrisWheel(Ride):
-    def __init__(self, position: Point) -> None:
-        # 1) immutable base geometry (animation frames)
-        anim = Animation(_frames())
+    def __init__(
+        self,
+        position: Point,
+        max_capacity: int = 10,
+        ride_time: float = 30.0,
+        asset: RideAsset | None = None,
+    ) -> None:
+        # 1) immutable base geometry (animation frames), shared per ride type
+        asset = _asset() if asset is None else asset
 
         # 2) world pose (start at origin, scale down a bit)
         super().__init__(
-            animation=anim,
+            animation=asset.animation,
             position=position,
             size=Size(10, 20, 5),
             fps=12,
+            max_capacity=max_capacity,
+            ride_time=ride_time,
+            bounds=asset.bounds,
         )
 
         # 3) behaviour/state
@@ -1,13 +1,20 @@
 # pirate_ship.py
 import math
 from enum import StrEnum, auto
+from functools import cache
 from typing import override
-from src.animation import Animation, Draw, Frame, Line, Point, Segment, Fill
-from src.assets.rides.ride import Ride
+
+import numpy as np
+
+from src.animation import Draw, Frame, Line, Point, Segment, Fill
+from src.assets.rides.registry import register_ride
+from src.assets.rides.ride import Ride, RideAsset
+from src.batch import BatchField, EntityBatch
 from src.entity import EngineEntity, Size
+from src.extrusion import ExtrusionTopology, extrusion_topology
+from src.lod import LOD_FULL, simplify_frame
 from src.clock import ClockProtocol
 
-
 # Original hull points (0..1) and pivot in that space
 _FRAME: Frame = [
     Segment(
@@ -84,25 +91,78 @@ def _frames() -> list[Frame]:
     return [_FRAME + _BASE + _HULL + _HULL_DETAILS + _CORE]
 
 
+@cache
+def _posable_frame(lod: int) -> tuple[Frame, int]:
+    """Static parts followed by the swinging parts, and the first swinging draw."""
+    static = simplify_frame(_FRAME, lod) + simplify_frame(_BASE, lod)
+    swinging = [
+        draw
+        for part in (_HULL, _HULL_DETAILS, _CORE)
+        for draw in simplify_frame(part, lod)
+    ]
+    return static + swinging, len(static)
+
+
 class ShipState(StrEnum):
     STOPPED = auto()
     RUNNING = auto()
 
 
+class PirateShipBatch(EntityBatch):
+    """Computes the swing angle of every ship in one vectorised step."""
+
+    fields = {"pose_rotation": float, "state": ShipState}
+    params = ("_period_s", "_amp_rad", "_swing_phase")
+
+    @override
+    def update(self, clock: ClockProtocol) -> None:
+        a = self.arrays
+        running = a["state"] == self.code("state", ShipState.RUNNING)
+        phase = 2 * np.pi * (clock.time / a["_period_s"]) + a["_swing_phase"]
+        a["pose_rotation"][:] = np.where(running, a["_amp_rad"] * np.sin(phase), 0.0)
+
+
+@cache
+def _asset() -> RideAsset:
+    return RideAsset.from_frames(_frames())
+
+
+@register_ride("PirateShip", asset=_asset)
 class PirateShip(Ride):
-    def __init__(self, position: Point) -> None:
-        anim = Animation(_frames())
-        super().__init__(animation=anim, position=position, size=Size(20, 10, 5))
+    batch_type = PirateShipBatch
+
+    # Per-frame state; lives in PirateShipBatch arrays while batched
+    state = BatchField()
+    pose_rotation = BatchField()
+
+    def __init__(
+        self,
+        position: Point,
+        max_capacity: int = 10,
+        ride_time: float = 30.0,
+        asset: RideAsset | None = None,
+    ) -> None:
+        asset = _asset() if asset is None else asset
+        super().__init__(
+            animation=asset.animation,
+            position=position,
+            size=Size(20, 10, 5),
+            max_capacity=max_capacity,
+            ride_time=ride_time,
+            bounds=asset.bounds,
+        )
         self._pivot_local = Point(0.5313, 0.7204)  # local model pivot now at origin
+        self.pivot = self._pivot_local
         self._period_s = 2.0
         self._amp_rad = math.radians(20)
+        self._swing_phase = math.pi / 6
         self.state: ShipState = ShipState.RUNNING
+        self.pose_rotation: float = 0.0
 
     @override
     def update(self, clock: ClockProtocol) -> None:
-        self.pivot = self._pivot_local
         if self.state is ShipState.RUNNING:
-            phase = 2 * math.pi * (clock.time / self._period_s)
+            phase = 2 * math.pi * (clock.time / self._period_s) + self._swing_phase
             self.pose_rotation = self._amp_rad * math.sin(phase)
         else:
             self.pose_rotation = 0.0
@@ -117,27 +177,23 @@ class PirateShip(Ride):
         )
 
     @override
-    def get_frame(self, frame_clock: int, engine_fps: int = 24) -> Frame:
+    def get_frame(
+        self, frame_clock: int, engine_fps: int = 24, lod: int = LOD_FULL
+    ) -> Frame:
         """Rebuilds and rotates the dynamic parts of the pirate ship each frame."""
         # Base static parts stay fixed
         frame = []
-        frame.extend(_FRAME)
-        frame.extend(_BASE)
-
-        # Time-based rotation for moving sections
-        t = frame_clock / engine_fps
-        if self.state is ShipState.RUNNING:
-            phase = 2 * math.pi * (t / self._period_s)
-            angle = self._amp_rad * math.sin(phase + math.pi / 6)
-        else:
-            angle = 0.0
+        frame.extend(simplify_frame(_FRAME, lod))
+        frame.extend(simplify_frame(_BASE, lod))
 
+        # Rotation for moving sections comes from update() (or the batch)
+        angle = self.pose_rotation
         cos_a, sin_a = math.cos(angle), math.sin(angle)
         pivot = self._pivot_local
 
         # Rotate and append hull parts
         for part in (_HULL, _HULL_DETAILS, _CORE):
-            for draw in part:
+            for draw in simplify_frame(part, lod):
                 if isinstance(draw, Segment):
                     s = self._rotate_point(draw.start, pivot, cos_a, sin_a)
                     e = self._rotate_point(draw.end, pivot, cos_a, sin_a)
@@ -152,6 +208,29 @@ class PirateShip(Ride):
 
         return frame
 
+    @override
+    def visual_key(self, frame_clock: int, engine_fps: int = 24) -> tuple:
+        return super().visual_key(frame_clock, engine_fps) + (self.pose_rotation,)
+
+    @override
+    def get_geometry(
+        self, frame_clock: int, engine_fps: int = 24, lod: int = LOD_FULL
+    ) -> tuple[ExtrusionTopology, np.ndarray]:
+        """Rotates the swinging part of the cached vertex array about the pivot."""
+        frame, first_swinging = _posable_frame(lod)
+        topology = extrusion_topology(frame)
+        local = topology.local.copy()
+
+        angle = self.pose_rotation
+        if angle:
+            cos_a, sin_a = math.cos(angle), math.sin(angle)
+            pivot = np.array([self._pivot_local.x, self._pivot_local.y])
+            swinging = local[topology.offsets[first_swinging] :] - pivot
+            local[topology.offsets[first_swinging] :] = (
+                swinging @ np.array([[cos_a, sin_a], [-sin_a, cos_a]]) + pivot
+            )
+        return topology, local
+
     def toggle(self) -> None:
         self.state = (
             ShipState.RUNNING if self.state is ShipState.STOPPED else ShipState.STOPPED
@@ -0,0 +1,76 @@
+"""
+Ride-type registry. Ride classes register a factory, a loader for their shared
+asset and optionally a bulk constructor; scenarios build rides by type name.
+"""
+
+from dataclasses import dataclass, field
+from typing import Callable, Sequence, TypeVar
+
+from .ride import Ride, RideAsset, RideSpec
+
+type RideFactory = Callable[[RideSpec, RideAsset], Ride]
+type BulkRideFactory = Callable[[Sequence[RideSpec], RideAsset], list[Ride]]
+
+R = TypeVar("R", bound=type[Ride])
+
+
+@dataclass(slots=True)
+class RideType:
+    name: str
+    factory: RideFactory
+    load_asset: Callable[[], RideAsset]
+    bulk_factory: BulkRideFactory | None = None
+    _asset: RideAsset | None = field(default=None, repr=False)
+
+    @property
+    def asset(self) -> RideAsset:
+        """Shared geometry, loaded on first use."""
+        if self._asset is None:
+            self._asset = self.load_asset()
+        return self._asset
+
+    def create(self, spec: RideSpec) -> Ride:
+        return self.factory(spec, self.asset)
+
+    def create_many(self, specs: Sequence[RideSpec]) -> list[Ride]:
+        if self.bulk_factory is not None:
+            return self.bulk_factory(specs, self.asset)
+        asset = self.asset
+        return [self.factory(spec, asset) for spec in specs]
+
+
+_REGISTRY: dict[str, RideType] = {}
+
+
+def register_ride_type(
+    name: str,
+    factory: RideFactory,
+    asset: Callable[[], RideAsset],
+    bulk: BulkRideFactory | None = None,
+) -> RideType:
+    if name in _REGISTRY:
+        raise ValueError(f"Ride type {name!r} is already registered")
+    ride_type = RideType(name, factory, asset, bulk)
+    _REGISTRY[name] = ride_type
+    return ride_type
+
+
+def register_ride(name: str, asset: Callable[[], RideAsset]) -> Callable[[R], R]:
+    """Class decorator: registers `Ride.from_spec` and `Ride.bulk` under `name`."""
+
+    def decorator(cls: R) -> R:
+        register_ride_type(name, cls.from_spec, asset, cls.bulk)
+        return cls
+
+    return decorator
+
+
+def get_ride_type(name: str) -> RideType:
+    try:
+        return _REGISTRY[name]
+    except KeyError:
+        raise ValueError(f"Invalid ride type {name!r}") from None
+
+
+def ride_type_names() -> tuple[str, ...]:
+    return tuple(_REGISTRY)
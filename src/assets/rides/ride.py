@@ -1,7 +1,34 @@
+import copy
+from collections import deque
 from dataclasses import dataclass
-from src.entity import EngineEntity
-from src.animation import Animation, Point
+from typing import Any, Callable, Self, Sequence
+
+from src.entity import Bounds, EngineEntity, compute_animation_bounds
+from src.animation import Animation, Frame, Point
 from src.entity import Size
+from src.events import EventScheduler
+
+
+@dataclass(slots=True)
+class RideSpec:
+    """Per-instance construction data for one ride."""
+
+    position: Point
+    max_capacity: int = 10
+    ride_time: float = 30.0
+
+
+@dataclass(slots=True)
+class RideAsset:
+    """Geometry shared by every instance of one ride type."""
+
+    animation: Animation
+    bounds: Bounds
+
+    @classmethod
+    def from_frames(cls, frames: list[Frame], fps: int = 24) -> "RideAsset":
+        animation = Animation(frames)
+        return cls(animation, compute_animation_bounds(animation, fps))
 
 
 class Ride(EngineEntity):
@@ -12,11 +39,114 @@ class Ride(EngineEntity):
         size: Size = Size(10, 10, 10),
         fps: int = 24,
         max_capacity: int = 10,
+        ride_time: float = 30.0,
+        bounds: Bounds | None = None,
     ) -> None:
         self.max_capacity = max_capacity
+        self.ride_time = ride_time
         super().__init__(
             animation,
             position=position,
             target_size=size,
             fps=fps,
+            bounds=bounds,
+        )
+
+    @classmethod
+    def from_spec(cls, spec: RideSpec, asset: RideAsset) -> Self:
+        return cls(
+            spec.position,
+            max_capacity=spec.max_capacity,
+            ride_time=spec.ride_time,
+            asset=asset,
         )
+
+    @classmethod
+    def bulk(cls, specs: Sequence[RideSpec], asset: RideAsset) -> list[Self]:
+        """
+        Create many rides of this type at once. One prototype is constructed;
+        the rest are shallow copies that share its geometry and only differ in
+        their per-instance fields.
+        """
+        if not specs:
+            return []
+        prototype = cls.from_spec(specs[0], asset)
+        rides = [prototype]
+        for spec in specs[1:]:
+            ride = copy.copy(prototype)
+            ride.position = spec.position
+            ride.max_capacity = spec.max_capacity
+            ride.ride_time = spec.ride_time
+            rides.append(ride)
+        return rides
+
+    def operation(
+        self,
+        scheduler: EventScheduler,
+        on_unload: Callable[[list[Any]], None] | None = None,
+    ) -> "RideOperation":
+        """Event-driven variant of this ride for capacity studies."""
+        return RideOperation(self, scheduler, on_unload)
+
+
+class RideOperation:
+    """
+    A ride as a queue served in cycles: board up to `max_capacity` waiting
+    guests, run for `ride_time`, unload, repeat while anyone is waiting.
+    Only those event times are simulated; there is no per-frame motion.
+    """
+
+    def __init__(
+        self,
+        ride: Ride,
+        scheduler: EventScheduler,
+        on_unload: Callable[[list[Any]], None] | None = None,
+    ) -> None:
+        self.ride = ride
+        self.scheduler = scheduler
+        self.on_unload = on_unload
+        self.queue: deque[tuple[Any, float]] = deque()  # (guest, arrival time)
+        self.running = False
+
+        # Stats
+        self.riders = 0
+        self.cycles = 0
+        self.total_wait = 0.0
+        self.max_queue = 0
+        self.busy_time = 0.0
+
+    def arrive(self, guest: Any) -> None:
+        """A guest joins the queue; boards at once if the ride is idle."""
+        self.queue.append((guest, self.scheduler.now))
+        self.max_queue = max(self.max_queue, len(self.queue))
+        if not self.running:
+            self._board()
+
+    def _board(self) -> None:
+        capacity = self.ride.max_capacity
+        if not self.queue or capacity <= 0:
+            return
+        now = self.scheduler.now
+        boarding = [self.queue.popleft() for _ in range(min(capacity, len(self.queue)))]
+        self.total_wait += sum(now - arrived for _, arrived in boarding)
+        self.riders += len(boarding)
+        self.cycles += 1
+        self.running = True
+        guests = [guest for guest, _ in boarding]
+        self.scheduler.schedule_in(self.ride.ride_time, lambda: self._unload(guests))
+
+    def _unload(self, guests: list[Any]) -> None:
+        self.busy_time += self.ride.ride_time
+        self.running = False
+        if self.on_unload is not None:
+            self.on_unload(guests)
+        self._board()
+
+    @property
+    def mean_wait(self) -> float:
+        return self.total_wait / self.riders if self.riders else 0.0
+
+    def utilisation(self, elapsed: float) -> float:
+        """Share of seat-time used: riders x ride_time over capacity x elapsed."""
+        seats = self.ride.max_capacity * elapsed
+        return self.riders * self.ride.ride_time / seats if seats > 0 else 0.0
@@ -0,0 +1,168 @@
+"""
+Batched (structure-of-arrays) entity updates.
+
+An entity class opts in by setting ``batch_type`` to an `EntityBatch`
+subclass and declaring its per-frame state as `BatchField`s. While the
+engine holds a batch for that class, the state of every instance lives in
+NumPy arrays and `EntityBatch.update` advances all of them in one step;
+reading or writing the attributes on an instance goes through the arrays.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from enum import Enum
+from typing import TYPE_CHECKING, Any, ClassVar, Sequence
+
+import numpy as np
+
+from .clock import ClockProtocol
+
+if TYPE_CHECKING:
+    from .entity import EngineEntity
+
+
+class BatchField:
+    """Instance attribute stored in the owning batch's array while bound."""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, obj: Any, objtype: type | None = None) -> Any:
+        if obj is None:
+            return self
+        batch = obj.__dict__.get("_batch")
+        if batch is not None:
+            return batch.get(self.name, obj._batch_index)
+        try:
+            return obj.__dict__[self.name]
+        except KeyError:
+            raise AttributeError(self.name) from None
+
+    def __set__(self, obj: Any, value: Any) -> None:
+        batch = obj.__dict__.get("_batch")
+        if batch is not None:
+            batch.set(self.name, obj._batch_index, value)
+        else:
+            obj.__dict__[self.name] = value
+
+
+class EntityBatch(ABC):
+    """
+    State of all entities of one type, advanced together. Subclasses
+    implement `update`.
+
+    `fields` maps each `BatchField` name to its Python type (float or an
+    Enum; enums are stored as member indices). `params` names per-instance
+    constants gathered once when the batch is built.
+    """
+
+    fields: ClassVar[dict[str, type]] = {}
+    params: ClassVar[tuple[str, ...]] = ()
+
+    def __init__(self, entities: Sequence[EngineEntity]) -> None:
+        self.entities = list(entities)
+        self.arrays: dict[str, np.ndarray] = {}
+        self._members: dict[str, list[Enum]] = {}
+
+        for name, kind in self.fields.items():
+            values = [e.__dict__[name] for e in self.entities]
+            if issubclass(kind, Enum):
+                members = list(kind)
+                index = {m: i for i, m in enumerate(members)}
+                self._members[name] = members
+                self.arrays[name] = np.array([index[v] for v in values], dtype=np.int8)
+            else:
+                self.arrays[name] = np.array(values, dtype=np.float64)
+
+        for name in self.params:
+            self.arrays[name] = np.array(
+                [getattr(e, name) for e in self.entities], dtype=np.float64
+            )
+
+        for i, e in enumerate(self.entities):
+            e._batch_index = i
+            e._batch = self
+
+    def __len__(self) -> int:
+        return len(self.entities)
+
+    def code(self, name: str, member: Enum) -> int:
+        """Array value used for `member` in the enum field `name`."""
+        return self._members[name].index(member)
+
+    def get(self, name: str, index: int) -> Any:
+        value = self.arrays[name][index]
+        members = self._members.get(name)
+        return members[value] if members is not None else float(value)
+
+    def set(self, name: str, index: int, value: Any) -> None:
+        members = self._members.get(name)
+        self.arrays[name][index] = (
+            members.index(value) if members is not None else value
+        )
+
+    def detach(self, entity: EngineEntity, index: int) -> None:
+        """Copy slot `index` onto `entity` and unbind it from the batch."""
+        values = {name: self.get(name, index) for name in self.fields}
+        entity.__dict__.pop("_batch", None)
+        entity.__dict__.pop("_batch_index", None)
+        entity.__dict__.update(values)
+
+    def release(self) -> None:
+        """Copy state back onto the instances and unbind them."""
+        for i, e in enumerate(self.entities):
+            self.detach(e, i)
+
+    @abstractmethod
+    def update(self, clock: ClockProtocol) -> None:
+        """Advance every entity in the batch by one tick."""
+
+
+class BatchScheduler:
+    """
+    Splits the engine's entities into per-type batches and scalar updates.
+    Groups are rebuilt only when the entity list changes.
+    """
+
+    def __init__(self) -> None:
+        self._snapshot: list[EngineEntity] = []
+        self._batches: list[EntityBatch] = []
+        self._scalar: list[EngineEntity] = []
+
+    @property
+    def batches(self) -> list[EntityBatch]:
+        return self._batches
+
+    def sync(self, entities: list[EngineEntity]) -> None:
+        # List equality falls back to identity for entities, so this is a C loop
+        if entities == self._snapshot:
+            return
+        self.release()
+
+        groups: dict[type, list[EngineEntity]] = defaultdict(list)
+        scalar: list[EngineEntity] = []
+        for e in entities:
+            if type(e).batch_type is not None:
+                groups[type(e)].append(e)
+            else:
+                scalar.append(e)
+
+        self._batches = [cls.batch_type(group) for cls, group in groups.items()]
+        self._scalar = scalar
+        self._snapshot = list(entities)
+
+    def release(self) -> None:
+        for batch in self._batches:
+            batch.release()
+        self._batches = []
+        self._scalar = []
+        self._snapshot = []
+
+    def update(self, entities: list[EngineEntity], clock: ClockProtocol) -> None:
+        self.sync(entities)
+        for batch in self._batches:
+            batch.update(clock)
+        for e in self._scalar:
+            e.update(clock)
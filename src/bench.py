@@ -0,0 +1,287 @@
+"""
+Performance regression benchmarks.
+
+Times the engine's hot operations (ride construction, animation bounds,
+per-frame ride geometry, projection, a headless run and a full Agg frame)
+and compares each case's median against a stored baseline. A case fails
+when it is more than its tolerance slower than the baseline; the runner
+then exits non-zero.
+
+    python -m src.bench              # compare against benchmarks/baseline.json
+    python -m src.bench --update     # re-record the baseline on this machine
+
+Baselines are machine-specific: record one on the machine that checks it.
+"""
+
+from __future__ import annotations
+
+import gc
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+
+import click
+import matplotlib
+
+matplotlib.use("Agg")  # the frame benchmark renders off-screen
+
+from .animation import Point
+from .assets.rides import RideSpec, get_ride_type, ride_type_names
+from .clock import FixedStepClock
+from .engine import Engine
+from .generator import generate_scenario
+
+DEFAULT_BASELINE = Path("benchmarks/baseline.json")
+DEFAULT_TOLERANCE = 0.5  # fraction slower than the baseline before failing
+MICRO_TOLERANCE = 1.0  # microsecond cases jitter far more between runs
+MIN_RUN_TIME = 0.2  # s per repeat; cheap cases loop until they reach it
+
+type Timed = Callable[[], object]
+
+
+@dataclass(frozen=True, slots=True)
+class Benchmark:
+    name: str
+    setup: Callable[[], Timed]  # called before every repeat, untimed
+    repeat: int = 5
+    loops: int = 0  # calls per repeat; 0 calibrates, stateful cases need 1
+    tolerance: float = DEFAULT_TOLERANCE
+
+
+@dataclass(frozen=True, slots=True)
+class Result:
+    name: str
+    median: float  # per-call seconds; the figure compared against baselines
+    best: float
+    loops: int
+
+
+# ---------- Cases ----------
+# Every case runs on the same small generated park so results are comparable
+_PARK = dict(rides_per_type=8, layout="grid", seed=0, spacing=2.0, guests=400)
+_STEPS = 1000
+_STEP_DT = 1.0 / 60.0
+
+
+def _ride(name: str, steps: int = 0):
+    """One ride of type `name`, stepped into the middle of its cycle."""
+    ride = get_ride_type(name).create(RideSpec(Point(0.0, 0.0)))
+    clock = FixedStepClock(_STEP_DT)
+    for _ in range(steps):
+        clock.tick()
+        ride.update(clock)
+    return ride
+
+
+def _construct(name: str) -> Callable[[], Timed]:
+    ride_type = get_ride_type(name)
+    _ = ride_type.asset  # shared geometry loads once, outside the timing
+    return lambda: lambda: ride_type.create(RideSpec(Point(0.0, 0.0)))
+
+
+def _bounds(name: str) -> Callable[[], Timed]:
+    return lambda: _ride(name)._compute_animation_bounds
+
+
+def _get_frame(name: str) -> Callable[[], Timed]:
+    def setup() -> Timed:
+        ride = _ride(name, steps=120)
+        return lambda: ride.get_frame(120)
+
+    return setup
+
+
+def _engine(headless: bool = True) -> Engine:
+    return Engine(generate_scenario(**_PARK).build(), headless=headless)
+
+
+def _projection() -> Timed:
+    engine = _engine()
+    engine.scene_layers()  # fill the per-tick geometry cache; time projection only
+    return engine.scene_layers
+
+
+def _headless_run(navigate: bool) -> Callable[[], Timed]:
+    def setup() -> Timed:
+        engine = _engine()
+        if navigate:
+            engine.enable_navigation().assign_random(
+                engine.entities[len(engine.rides) :], random.Random(0)
+            )
+            engine.enable_crowd()
+        return lambda: engine.advance_to(_STEPS * _STEP_DT - 1e-9, _STEP_DT)
+
+    return setup
+
+
+def _agg_frame() -> Timed:
+    engine = _engine(headless=False)
+    return lambda: engine._draw_scene(force=True)
+
+
+def benchmarks() -> list[Benchmark]:
+    micro = dict(repeat=7, tolerance=MICRO_TOLERANCE)
+    cases = [
+        Benchmark(f"construct[{n}]", _construct(n), **micro) for n in ride_type_names()
+    ]
+    cases += [
+        Benchmark(f"animation_bounds[{n}]", _bounds(n), **micro)
+        for n in ride_type_names()
+    ]
+    cases += [
+        Benchmark("get_frame[PirateShip]", _get_frame("PirateShip"), **micro),
+        Benchmark("get_frame[DropTower]", _get_frame("DropTower"), **micro),
+        Benchmark("projection", _projection),
+        Benchmark(f"headless_{_STEPS}_steps", _headless_run(False), loops=1),
+        Benchmark(f"headless_{_STEPS}_steps_crowd", _headless_run(True), loops=1),
+        Benchmark("agg_frame", _agg_frame),
+    ]
+    return cases
+
+
+# ---------- Timing ----------
+def run_benchmark(bench: Benchmark) -> Result:
+    """Median and best per-call time over `bench.repeat` timed repeats."""
+    loops = bench.loops
+    times = []
+    for _ in range(bench.repeat):
+        fn = bench.setup()
+        if not loops:
+            # Cheap cases are timed over many calls; a slow one's first call counts
+            once = _time(fn, 1)
+            loops = max(1, min(100_000, round(MIN_RUN_TIME / max(once, 1e-9))))
+            if loops == 1:
+                times.append(once)
+                continue
+            fn = bench.setup()
+        times.append(_time(fn, loops))
+    return Result(bench.name, statistics.median(times), min(times), loops)
+
+
+def _time(fn: Timed, loops: int) -> float:
+    """Seconds per call of `fn`, with the garbage collector held off."""
+    gc.collect()
+    gc.disable()
+    try:
+        started = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        return (time.perf_counter() - started) / loops
+    finally:
+        gc.enable()
+
+
+# ---------- Baselines ----------
+def load_baseline(path: str | Path) -> dict[str, float]:
+    data = json.loads(Path(path).read_text(encoding="utf-8"))
+    return {name: entry["median"] for name, entry in data["results"].items()}
+
+
+def save_baseline(path: str | Path, results: list[Result]) -> None:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = {
+        "python": platform.python_version(),
+        "machine": " ".join(
+            filter(None, (platform.system(), platform.machine(), platform.processor()))
+        ),
+        "results": {
+            r.name: {"median": r.median, "best": r.best, "loops": r.loops}
+            for r in results
+        },
+    }
+    path.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+
+
+def compare(
+    result: Result, baseline: float | None, tolerance: float
+) -> tuple[str, float | None]:
+    """("ok" | "REGRESSED" | "faster" | "new", ratio to the baseline)."""
+    if baseline is None:
+        return "new", None
+    ratio = result.median / baseline
+    if ratio > 1.0 + tolerance:
+        return "REGRESSED", ratio
+    if ratio < 1.0 / (1.0 + tolerance):
+        return "faster", ratio
+    return "ok", ratio
+
+
+def _format_time(seconds: float) -> str:
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.3g} {unit}"
+    return f"{seconds / 1e-9:.3g} ns"
+
+
+@click.command()
+@click.option(
+    "--baseline",
+    "baseline_path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=DEFAULT_BASELINE,
+    show_default=True,
+    help="Baseline JSON to compare against (or write with --update).",
+)
+@click.option("--update", is_flag=True, help="Record the results as the new baseline.")
+@click.option("-k", "pattern", help="Only run cases whose name contains this.")
+@click.option(
+    "--tolerance",
+    type=click.FloatRange(min=0.0),
+    help=(
+        "Override every case's allowed slowdown (default "
+        f"{DEFAULT_TOLERANCE:.0%}, {MICRO_TOLERANCE:.0%} for microsecond cases)."
+    ),
+)
+def main(
+    baseline_path: Path, update: bool, pattern: str | None, tolerance: float | None
+) -> None:
+    """Time the engine's hot paths and fail on regressions against a baseline."""
+    cases = [b for b in benchmarks() if pattern is None or pattern in b.name]
+    baseline = {}
+    if not update:
+        if not baseline_path.exists():
+            raise click.UsageError(
+                f"No baseline at {baseline_path}; record one with --update"
+            )
+        baseline = load_baseline(baseline_path)
+
+    results = []
+    regressions = []
+    for bench in cases:
+        result = run_benchmark(bench)
+        results.append(result)
+        if update:
+            click.echo(f"{bench.name:<40} {_format_time(result.median):>10}")
+            continue
+        allowed = bench.tolerance if tolerance is None else tolerance
+        status, ratio = compare(result, baseline.get(bench.name), allowed)
+        change = f"{ratio:6.2f}x" if ratio is not None else "      -"
+        click.echo(
+            f"{bench.name:<40} {_format_time(result.median):>10} {change} {status}"
+        )
+        if status == "REGRESSED":
+            regressions.append(
+                f"{bench.name} ({ratio:.2f}x, allowed {1 + allowed:.2f}x)"
+            )
+
+    if update:
+        save_baseline(baseline_path, results)
+        click.echo(f"Wrote {len(results)} results to {baseline_path}")
+        return
+    if regressions:
+        click.echo(f"\n❌ {len(regressions)} regression(s):", err=True)
+        for line in regressions:
+            click.echo(f"  {line}", err=True)
+        sys.exit(1)
+    click.echo(f"\n✅ {len(results)} benchmark(s) within tolerance")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,13 +2,26 @@ from .animation import Point
 
 
 class Camera:
-    position: Point = Point(0.0, -10)
-    height: float = 1.0  # m
-    zoom: float = 1.0
-    x_movement_speed: float = 0.5
-    y_movement_speed: float = x_movement_speed
-    render_distance_scale: float = 1
-    horizon_speed: float = 1
+    speed_change_rate: float = 10.0  # factor/s while "a"/"d" is held
+    max_input_dt: float = 0.1  # s; longer gaps (idle waits) don't jump the camera
+
+    def __init__(
+        self,
+        position: Point | None = None,
+        height: float = 1.0,  # m
+        zoom: float = 1.0,
+        movement_speed: float = 12.0,  # units/s
+        render_distance_scale: float = 1,
+        horizon_speed: float = 1,
+    ) -> None:
+        # Every camera owns its state, so several can view one simulation
+        self.position = Point(0.0, -10) if position is None else position
+        self.height = height
+        self.zoom = zoom
+        self.x_movement_speed = movement_speed
+        self.y_movement_speed = movement_speed
+        self.render_distance_scale = render_distance_scale
+        self.horizon_speed = horizon_speed
 
     def move(self, dx: float, dy: float) -> None:
         """Move camera position by delta."""
@@ -21,6 +34,17 @@ class Camera:
     def set_zoom(self, zoom: float) -> None:
         self.zoom = max(1e-6, zoom)
 
+    def pose(self) -> tuple[float, ...]:
+        """Everything that affects projection; equal poses project identically."""
+        return (
+            self.position.x,
+            self.position.y,
+            self.height,
+            self.zoom,
+            self.render_distance_scale,
+            self.horizon_speed,
+        )
+
     # ---------- New movement logic ---------- #
     def update_from_input(self, keys_down: set[str], dt: float) -> None:
         """
@@ -28,19 +52,24 @@ class Camera:
         - Up increases _depth_scale (move forward into scene)
         - Down decreases _depth_scale (move backward)
         - Left/Right pan across grid
+        Movement and speed changes are per second, scaled by `dt`.
         """
+        dt = min(max(dt, 0.0), self.max_input_dt)
+        step_x = self.x_movement_speed * dt
+        step_y = self.y_movement_speed * dt
+
         # Forward/backward movement (Up/Down)
         if "up" in keys_down:
-            self.position.y += self.y_movement_speed
+            self.position.y += step_y
         if "down" in keys_down:
-            self.position.y -= self.y_movement_speed
+            self.position.y -= step_y
         if "left" in keys_down:
-            self.position.x -= self.x_movement_speed
+            self.position.x -= step_x
         if "right" in keys_down:
-            self.position.x += self.x_movement_speed
+            self.position.x += step_x
         if "a" in keys_down:
-            self.x_movement_speed *= 0.9
-            self.y_movement_speed *= 0.9
+            self.x_movement_speed /= self.speed_change_rate**dt
+            self.y_movement_speed /= self.speed_change_rate**dt
         if "d" in keys_down:
-            self.x_movement_speed *= 1.1
-            self.y_movement_speed *= 1.1
+            self.x_movement_speed *= self.speed_change_rate**dt
+            self.y_movement_speed *= self.speed_change_rate**dt
@@ -1,12 +1,17 @@
+import random
+import time
+
 import click
 from click_option_group import optgroup, RequiredMutuallyExclusiveOptionGroup
 from typing import Optional
 
-import json
-
 from .animation import Animation, Point, Segment
+from .discrete import ParkSimulation
 from .assets.person import Person
-from .scenario import RulesModel, ScenarioModel
+from .log import configure_logging
+from .replay import InputLog
+from .loader import ScenarioLoadError, load_scenario, validate_scenario
+from .scenario import RulesModel, Scenario, ScenarioModel
 from .engine import Engine
 from .spawner import SpawnerEntity
 
@@ -25,11 +30,142 @@ from .spawner import SpawnerEntity
     "--file",
     "input_file_name",
     type=click.Path(exists=True, dir_okay=False, path_type=str),
-    help="file",
+    help="file (.json, or .jsonl for streamed large layouts)",
+)
+@click.option(
+    "--validate-only",
+    is_flag=True,
+    help="Validate the scenario file record by record and exit without running.",
+)
+@click.option(
+    "--async-sim",
+    is_flag=True,
+    help="Run the simulation on its own thread; the window renders the latest state.",
+)
+@click.option(
+    "--sim-rate",
+    type=click.FloatRange(min=1.0),
+    default=60.0,
+    show_default=True,
+    help="Simulation steps per second with --async-sim.",
+)
+@click.option(
+    "--export",
+    "export_path",
+    type=click.Path(dir_okay=False, writable=True, path_type=str),
+    help="Write one frame (.svg, .pdf or .png) without opening a window.",
+)
+@click.option(
+    "--at",
+    "export_time",
+    type=click.FloatRange(min=0.0),
+    default=0.0,
+    show_default=True,
+    help="Simulated time in seconds to advance to before --export.",
+)
+@click.option(
+    "--map",
+    "show_map",
+    is_flag=True,
+    help="Add a top-down park map with a crowd-density heatmap.",
+)
+@click.option(
+    "--simulate-hours",
+    type=click.FloatRange(min=0.0, min_open=True),
+    help="Run an event-driven capacity study for this many park hours and exit.",
+)
+@click.option(
+    "--seed",
+    type=int,
+    default=0,
+    show_default=True,
+    help="Random seed for guest arrivals and ride choices.",
+)
+@click.option(
+    "--navigate",
+    is_flag=True,
+    help="Send each guest to a random ride (--seed) along precomputed flow fields.",
+)
+@click.option(
+    "--crowd",
+    is_flag=True,
+    help="Keep guests apart and out of ride footprints (spatial-hash separation).",
+)
+@click.option(
+    "--telemetry",
+    "telemetry_path",
+    type=click.Path(dir_okay=False, writable=True, path_type=str),
+    help="Stream per-tick metrics (guests, ride queues, step time) to this .npz file.",
+)
+@click.option(
+    "--metrics-port",
+    type=click.IntRange(min=0, max=65535),
+    help="Serve live metrics on http://127.0.0.1:PORT/metrics while running.",
+)
+@click.option(
+    "--log-level",
+    type=click.Choice(["DEBUG", "INFO", "WARNING", "ERROR"], case_sensitive=False),
+    default="INFO",
+    show_default=True,
+    help="Minimum level of engine log events (written to stderr).",
+)
+@click.option(
+    "--log-json",
+    is_flag=True,
+    help="Write log events as one JSON object per line.",
+)
+@click.option(
+    "--fixed-step",
+    is_flag=True,
+    help="Advance every frame by 1/target_fps instead of the measured frame time.",
+)
+@click.option(
+    "--record",
+    "record_path",
+    type=click.Path(dir_okay=False, writable=True, path_type=str),
+    help="Record frame times and key presses of this session to an .npz log.",
+)
+@click.option(
+    "--replay",
+    "replay_path",
+    type=click.Path(exists=True, dir_okay=False, path_type=str),
+    help="Replay a session recorded with --record (its seed and settings win).",
+)
+@click.option(
+    "--time-scale",
+    type=click.FloatRange(min=0.0, max=100.0, min_open=True),
+    default=1.0,
+    show_default=True,
+    help="Simulated seconds per real second (change live with [ and ]).",
 )
-def cli(interactive_mode: bool, input_file_name: Optional[str]):
+def cli(
+    interactive_mode: bool,
+    input_file_name: Optional[str],
+    validate_only: bool,
+    async_sim: bool,
+    sim_rate: float,
+    export_path: Optional[str],
+    export_time: float,
+    show_map: bool,
+    simulate_hours: Optional[float],
+    seed: int,
+    navigate: bool,
+    crowd: bool,
+    telemetry_path: Optional[str],
+    metrics_port: Optional[int],
+    log_level: str,
+    log_json: bool,
+    fixed_step: bool,
+    record_path: Optional[str],
+    replay_path: Optional[str],
+    time_scale: float,
+):
     """need to add better description..."""
-    model: ScenarioModel
+    configure_logging(log_level.upper(), as_json=log_json)
+    scenario: Scenario
+    if validate_only and not input_file_name:
+        raise click.UsageError("--validate-only requires --file")
+
     if interactive_mode:
         # TODO: interactive mode
         click.echo("🧭 Interactive scenario setup")
@@ -45,24 +181,116 @@ def cli(interactive_mode: bool, input_file_name: Optional[str]):
             rules=RulesModel(max_guests=max_guests, spawn_rate=spawn_rate),
             rides=[],
         )
+        scenario = model.build()
+
+    elif input_file_name and validate_only:
+        click.echo(f"🔎 Validating scenario file: {input_file_name}")
+        report = validate_scenario(input_file_name)
+        for message in report.errors:
+            click.echo(f"  ✗ {message}", err=True)
+        if not report.ok:
+            raise click.ClickException(
+                f"{report.error_count} validation error(s) in {input_file_name}"
+            )
+        click.echo(
+            f"✅ {report.name!r} is valid: {report.rides} rides, {report.guests} guests"
+        )
+        return
 
     elif input_file_name:
         click.echo(f"📂 Loading scenario from file: {input_file_name}")
-        with open(input_file_name, "r") as f:
-            data = json.load(f)
-
-        model = ScenarioModel.model_validate(data)
+        try:
+            scenario = load_scenario(input_file_name)
+        except ScenarioLoadError as exc:
+            raise click.ClickException(str(exc)) from exc
 
     else:
         raise click.UsageError("You must provide either --interactive or --file")
 
-    scenario = model.build()
     click.echo("\n✅ Scenario loaded successfully!")
+    replay: InputLog | None = None
+    if replay_path:
+        if async_sim or record_path:
+            raise click.UsageError(
+                "--replay can't be combined with --async-sim/--record"
+            )
+        replay = InputLog.load(replay_path)
+        settings = replay.settings
+        seed = settings.get("seed", seed)
+        navigate = settings.get("navigate", navigate)
+        crowd = settings.get("crowd", crowd)
+        time_scale = settings.get("time_scale", time_scale)
+        click.echo(f"⏯  Replaying {replay.frames} frames ({replay.duration:.1f}s)")
+    elif record_path and async_sim:
+        raise click.UsageError("--record needs the synchronous loop (no --async-sim)")
+
+    if simulate_hours is not None:
+        started = time.perf_counter()
+        report = ParkSimulation(scenario, seed=seed).run(simulate_hours * 3600.0)
+        for line in report.lines():
+            click.echo(line)
+        click.echo(f"⏱  took {time.perf_counter() - started:.2f}s")
+        return
+
+    if export_path:
+        headless = Engine(scenario, headless=True)
+        if navigate:
+            headless.enable_navigation().assign_random(
+                scenario.guests, random.Random(seed)
+            )
+        if crowd:
+            headless.enable_crowd()
+        try:
+            if telemetry_path:
+                headless.record_telemetry(telemetry_path)
+            headless.advance_to(export_time)
+            headless.stop_telemetry()
+            headless.export_frame(export_path)
+        except (OSError, ValueError, RuntimeError) as exc:
+            raise click.ClickException(str(exc)) from exc
+        click.echo(f"🖼  Wrote t={headless.clock.time:.2f}s to {export_path}")
+        return
+
     engine: Engine = Engine(scenario)
+    if show_map:
+        engine.add_map_view()
+    if navigate:
+        engine.enable_navigation().assign_random(scenario.guests, random.Random(seed))
+    if crowd:
+        engine.enable_crowd()
+    if time_scale != 1.0:
+        engine.set_time_scale(time_scale)
     # spawner = SpawnerEntity(
     #     engine=engine,
     #     spawn_rate=1.5,
     #     max_entities=5,
     # )
     # engine.entities.append(spawner)
-    engine.run()
+    if telemetry_path:
+        engine.record_telemetry(telemetry_path)
+    if metrics_port is not None:
+        try:
+            server = engine.serve_metrics(metrics_port)
+        except OSError as exc:
+            raise click.ClickException(f"Metrics server: {exc}") from exc
+        host, port = server.address
+        click.echo(f"📈 Live metrics at http://{host}:{port}/metrics")
+    if record_path:
+        engine.record_input(
+            seed=seed, navigate=navigate, crowd=crowd, time_scale=time_scale
+        )
+    try:
+        engine.run(
+            async_sim=async_sim,
+            sim_rate=sim_rate,
+            fixed_step=fixed_step,
+            replay=replay,
+        )
+    finally:
+        engine.stop_metrics()
+        engine.stop_telemetry()
+        if record_path and engine.recorder is not None:
+            engine.recorder.log.save(record_path)
+            click.echo(
+                f"⏺  Recorded {engine.recorder.log.frames} frames to {record_path}"
+            )
@@ -3,7 +3,7 @@ File: time.py
 Author: Austin Delic (austin@austindelic.com)
 """
 
-from typing import Protocol
+from typing import Protocol, Sequence
 from time import perf_counter
 
 
@@ -44,3 +44,89 @@ class Clock(ClockProtocol):
     @property
     def frame(self) -> int:
         return self._frame
+
+
+class SimClock(ClockProtocol):
+    """Simulation time advanced explicitly, e.g. scaled or in fixed sub-steps."""
+
+    def __init__(self) -> None:
+        self._time = 0.0
+        self._dt = 0.0
+        self._frame = 0
+
+    def advance(self, dt: float) -> None:
+        self._dt = dt
+        self._time += dt
+        self._frame += 1
+
+    def tick(self) -> None:
+        self.advance(self._dt)
+
+    @property
+    def time(self) -> float:
+        return self._time
+
+    @property
+    def dt(self) -> float:
+        return self._dt
+
+    @property
+    def frame(self) -> int:
+        return self._frame
+
+
+class FixedStepClock(ClockProtocol):
+    """Advances by a constant dt per tick, independent of wall time."""
+
+    def __init__(self, dt: float) -> None:
+        self._dt = dt
+        self._time = 0.0
+        self._frame = 0
+
+    def tick(self) -> None:
+        self._frame += 1
+        self._time = self._frame * self._dt
+
+    @property
+    def time(self) -> float:
+        return self._time
+
+    @property
+    def dt(self) -> float:
+        return self._dt
+
+    @property
+    def frame(self) -> int:
+        return self._frame
+
+
+class ReplayClock(ClockProtocol):
+    """Replays recorded frame durations, one per tick; 0 once they run out."""
+
+    def __init__(self, dts: Sequence[float]) -> None:
+        self._dts = dts
+        self._time = 0.0
+        self._dt = 0.0
+        self._frame = 0
+
+    def tick(self) -> None:
+        self._dt = self._dts[self._frame] if self._frame < len(self._dts) else 0.0
+        self._time += self._dt
+        self._frame += 1
+
+    @property
+    def finished(self) -> bool:
+        """True once ticked past the last recorded frame."""
+        return self._frame > len(self._dts)
+
+    @property
+    def time(self) -> float:
+        return self._time
+
+    @property
+    def dt(self) -> float:
+        return self._dt
+
+    @property
+    def frame(self) -> int:
+        return self._frame
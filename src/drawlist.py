@@ -0,0 +1,87 @@
+"""
+Projected draw lists.
+
+A `DrawLayer` collects the already-projected lines and polygons of one
+painter's layer as NumPy arrays. Colours are style ids into
+`styles.STYLES`. Renderers consume layers; nothing here knows about
+matplotlib.
+"""
+
+from __future__ import annotations
+
+from typing import Sequence
+
+import numpy as np
+
+from .styles import STYLES
+
+
+class DrawLayer:
+    """Lines and polygons of one layer, in viewport coordinates."""
+
+    __slots__ = (
+        "segments",
+        "line_widths",
+        "line_styles",
+        "polygons",
+        "face_styles",
+        "edge_styles",
+    )
+
+    def __init__(self) -> None:
+        # Lines are appended in chunks of shape (n, 2, 2)
+        self.segments: list[np.ndarray] = []
+        self.line_widths: list[np.ndarray] = []
+        self.line_styles: list[np.ndarray] = []
+        # Polygons are appended one (k, 2) array each; style ids in chunks
+        self.polygons: list[np.ndarray] = []
+        self.face_styles: list[np.ndarray] = []
+        self.edge_styles: list[np.ndarray] = []
+
+    def add_segments(
+        self, segments: np.ndarray, widths: np.ndarray, styles: np.ndarray
+    ) -> None:
+        if len(segments):
+            self.segments.append(segments)
+            self.line_widths.append(widths)
+            self.line_styles.append(styles)
+
+    def add_polygons(
+        self,
+        polygons: Sequence[np.ndarray],
+        face_styles: np.ndarray,
+        edge_styles: np.ndarray,
+    ) -> None:
+        if len(polygons):
+            self.polygons.extend(polygons)
+            self.face_styles.append(face_styles)
+            self.edge_styles.append(edge_styles)
+
+    def line_arrays(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(segments (N, 2, 2), widths (N,), rgba (N, 4)) for every line."""
+        if not self.segments:
+            return np.empty((0, 2, 2)), np.empty(0), np.empty((0, 4))
+        styles = np.concatenate(self.line_styles)
+        return (
+            np.concatenate(self.segments),
+            np.concatenate(self.line_widths),
+            STYLES.rgba[styles],
+        )
+
+    def polygon_colors(self) -> tuple[np.ndarray, np.ndarray]:
+        """(face rgba (M, 4), edge rgba (M, 4)) for every polygon."""
+        if not self.polygons:
+            return np.empty((0, 4)), np.empty((0, 4))
+        rgba = STYLES.rgba
+        return (
+            rgba[np.concatenate(self.face_styles)],
+            rgba[np.concatenate(self.edge_styles)],
+        )
+
+    @property
+    def num_lines(self) -> int:
+        return sum(len(s) for s in self.segments)
+
+    @property
+    def num_polygons(self) -> int:
+        return len(self.polygons)
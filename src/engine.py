@@ -1,17 +1,59 @@
 from __future__ import annotations
 
+import logging
+import threading
 import time
-from typing import Protocol
+from pathlib import Path
+from typing import Iterable, Protocol
 
 import matplotlib.pyplot as plt
-from matplotlib.collections import LineCollection, PatchCollection
-from matplotlib.patches import Polygon
+import numpy as np
+from matplotlib.axes import Axes
+from matplotlib.collections import LineCollection, PolyCollection
 
 from src.scenario import Scenario
-from .animation import Fill, Frame, Line, Point, Segment
+from .assets import PersonBatch
+from .assets.rides import Ride
+from .animation import Point
+from .batch import BatchScheduler
 from .camera import Camera
-from .clock import Clock, ClockProtocol
+from .camera_path import CameraPath
+from .clock import Clock, ClockProtocol, FixedStepClock, ReplayClock, SimClock
+from .crowd import CrowdSeparation
+from .drawlist import DrawLayer
 from .entity import EngineEntity
+from .extrusion import extrusion_topology
+from .log import event
+from .lod import LOD_BILLBOARD, LOD_FULL, billboard_frame, select_lod
+from .metrics import DEFAULT_PORT, MetricsBuffer, MetricsServer, RideMetrics
+from .navigation import Navigator
+from .pacing import FramePacer, RenderQuality
+from .raster import RasterRenderer
+from .replay import PRESS, RELEASE, InputLog, InputRecorder
+from .snapshot import SceneSnapshot, SnapshotBuffer
+from .telemetry import TelemetryRecorder
+from .vector import PAGE_SIZE, VECTOR_SUFFIXES, write_vector
+from .topdown import TopDownMap, map_inputs
+from .viewport import Viewport, grid_shape
+
+log = logging.getLogger(__name__)
+
+DEFAULT_SIM_RATE = 60.0  # Hz, simulation steps per second in async mode
+
+# Time warp: simulated seconds per real second, stepped through with "[" / "]"
+TIME_SCALES = (0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 20.0, 50.0, 100.0)
+MAX_TIME_SCALE = TIME_SCALES[-1]
+
+
+def _split_rides(
+    entities: Iterable[EngineEntity],
+) -> tuple[list[EngineEntity], list[EngineEntity]]:
+    """(rides, everything else); the map draws the rest as guests."""
+    rides: list[EngineEntity] = []
+    guests: list[EngineEntity] = []
+    for entity in entities:
+        (rides if isinstance(entity, Ride) else guests).append(entity)
+    return rides, guests
 
 
 class EngineProtocol(Protocol):
@@ -19,15 +61,22 @@ class EngineProtocol(Protocol):
     clock: ClockProtocol
 
     def add_engine_objects(self, engine_objects: list[EngineEntity]) -> None: ...
-    def _update_all(self) -> None: ...
-    def _draw_scene(self) -> None: ...
-    def run(self, fps_target: int | None = None) -> None: ...
+    def _update_all(self, clock: ClockProtocol | None = None) -> None: ...
+    def _draw_scene(
+        self, force: bool = False, snapshot: SceneSnapshot | None = None
+    ) -> bool: ...
+    def run(
+        self,
+        fps_target: int | None = None,
+        async_sim: bool = False,
+        sim_rate: float | None = None,
+    ) -> None: ...
 
 
 class Engine(EngineProtocol):
-    def __init__(self, scenario: Scenario) -> None:
+    def __init__(self, scenario: Scenario, headless: bool = False) -> None:
         self.rides = scenario.rides
-        self.entities: list[EngineEntity] = scenario.rides
+        self.entities: list[EngineEntity] = scenario.rides + scenario.guests
         self.background: EngineEntity = scenario.background
 
         # Viewport
@@ -39,49 +88,299 @@ class Engine(EngineProtocol):
         self.fps_target = scenario.rules.target_fps
         self.clock = Clock()
         self.camera = Camera()
-
-        # Matplotlib
-        self.fig, self.ax = plt.subplots()
-        self.ax.set_aspect("equal", adjustable="box")
-        self.ax.set_xlim(0, self.xlim)
-        self.ax.set_ylim(0, self.ylim)
-        self.ax.set_facecolor("white")
-        self.fig.canvas.mpl_connect("key_press_event", self._on_key_press)
-        self.fig.canvas.mpl_connect("key_release_event", self._on_key_release)
-
-        # Input
+        self.camera_path = scenario.camera_path  # overrides keyboard control
+
+        # Matplotlib (headless engines only export frames and never open one)
+        self.headless = headless
+        if not headless:
+            self.fig, self.ax = plt.subplots()
+            self._setup_axes(self.ax)
+            self.fig.canvas.mpl_connect("key_press_event", self._on_key_press)
+            self.fig.canvas.mpl_connect("key_release_event", self._on_key_release)
+            self.fig.canvas.mpl_connect("resize_event", self._on_resize)
+
+        # Views; the first one is driven by the keyboard (or the scenario path)
+        self.viewports: list[Viewport] = [
+            Viewport(self.camera, None if headless else self.ax, name="main")
+        ]
+        for view in scenario.viewports:
+            self.add_viewport(view.camera, view.camera_path, view.name).map = view.map
+
+        # Input; key events are queued and applied at the start of the next frame,
+        # which is also where a recording stamps them and a replay feeds them
         self._keys_down: set[str] = set()
+        self._pending_keys: list[tuple[int, str]] = []
+        self.recorder: InputRecorder | None = None
+        self._replay_events: dict[int, list[tuple[int, str]]] | None = None
+
+        # Per-type batched updates
+        self._scheduler = BatchScheduler()
+
+        # Level of detail; lod_bias > 1 switches to coarser levels sooner
+        self.lod_enabled = True
+        self.lod_bias = 1.0
+        self._camera_moving = False  # of the view being projected
+        self.side_walls = True  # extruded back plane and side walls
+
+        # Frame pacing; under load the pacer lowers lod_bias/side_walls
+        self.adaptive_quality = True
+        self.pacer: FramePacer | None = None
+
+        # Dirty tracking: idle frames skip drawing; the loop then waits for input
+        self.idle_poll_interval = 0.25  # s between simulation steps while idle
+        self._force_redraw = True
+        self._drawn_entities: list[EngineEntity] = []
+
+        # Async mode: a simulation thread steps `sim_clock` at a fixed rate and
+        # publishes snapshots; the GUI thread only renders the latest one. The
+        # window loop steps a SimClock instead (time warp advances it directly)
+        self.sim_clock: SimClock | FixedStepClock = SimClock()
+        self.snapshots = SnapshotBuffer()
+        self._drawn_seq = 0
+
+        # Time warp: above 1x the simulation runs in fixed `warp_step` sub-steps
+        # and only the state after the last one is drawn; slow motion steps by
+        # the scaled frame time, so every frame still moves. Only the thread that
+        # steps the simulation touches `time_scale`/`_warp_debt`; other threads
+        # hand a new scale over through `_pending_time_scale`
+        self.time_scale = 1.0
+        self.warp_step = 1.0 / 30.0  # s of simulated time per sub-step
+        self.max_sub_steps = 240  # per frame; beyond this simulated time is dropped
+        self._warp_debt = 0.0
+        self._pending_time_scale: float | None = None
+        self._time_scale_lock = threading.Lock()
+
+        # Guest navigation; None leaves every guest wandering on its own
+        self.navigation: Navigator | None = None
+        self.crowd: CrowdSeparation | None = None  # guests keep apart when set
+
+        # Per-tick metrics streamed to disk; see record_telemetry()
+        self.telemetry: TelemetryRecorder | None = None
+
+        # Live metrics for serve_metrics(), republished every `metrics_interval`
+        self.metrics = MetricsBuffer()
+        self.metrics_server: MetricsServer | None = None
+        self.metrics_interval = 0.5  # s of wall time
+        self._metrics_due = 0.0
+
+        # Entity geometry fetched this tick, shared by every view's projection
+        self._geometry_cache: dict[tuple[int, int], tuple] = {}
+        self._geometry_frame = -1
 
         # Misc
         self.cull_pad_frac = 0.05
-        self._fps_print_every = 30
+        self._fps_log_every = 30
         self._frame_counter = 0
 
+    # ---------- Viewports ----------
+    def add_viewport(
+        self,
+        camera: Camera | None = None,
+        camera_path: CameraPath | None = None,
+        name: str = "",
+    ) -> Viewport:
+        """Add a view of the same simulation; the window is re-tiled into a grid."""
+        viewport = Viewport(
+            Camera() if camera is None else camera, None, camera_path, name
+        )
+        self.viewports.append(viewport)
+        if not self.headless:
+            rows, cols = grid_shape(len(self.viewports))
+            grid = self.fig.add_gridspec(rows, cols)
+            for index, view in enumerate(self.viewports):
+                if view.ax is None:
+                    view.ax = self.fig.add_subplot(grid[index])
+                    self._setup_axes(view.ax)
+                else:
+                    view.ax.set_subplotspec(grid[index])
+        self._force_redraw = True
+        return viewport
+
+    def add_map_view(
+        self, resolution: int = 256, half_life: float | None = 60.0, name: str = "map"
+    ) -> Viewport:
+        """Add a top-down map of the whole park with a crowd-density heatmap."""
+        viewport = self.add_viewport(name=name)
+        viewport.map = TopDownMap.fit(
+            self.entities, resolution=resolution, half_life=half_life
+        )
+        return viewport
+
+    def enable_navigation(self, cell_size: float = 1.0) -> Navigator:
+        """Steer guests that have a `target` ride along cached flow fields."""
+        self.navigation = Navigator(self.rides, cell_size)
+        return self.navigation
+
+    def enable_crowd(self, spacing: float = 0.5) -> CrowdSeparation:
+        """Keep guests `spacing` apart and out of ride footprints each tick."""
+        self.crowd = CrowdSeparation(spacing)
+        return self.crowd
+
+    def record_telemetry(
+        self, path: str | Path, chunk_size: int = 4096
+    ) -> TelemetryRecorder:
+        """Write guest count, ride queues and step time for every tick to `path`."""
+        self.stop_telemetry()
+        self.telemetry = TelemetryRecorder(
+            path,
+            [type(r).__name__ for r in self.rides],
+            [r.max_capacity for r in self.rides],
+            chunk_size,
+        )
+        return self.telemetry
+
+    def stop_telemetry(self) -> None:
+        """Flush and close the telemetry file, if one is being written."""
+        if self.telemetry is not None:
+            telemetry, self.telemetry = self.telemetry, None
+            telemetry.close()
+
+    def serve_metrics(self, port: int = DEFAULT_PORT) -> MetricsServer:
+        """Serve live metrics on http://127.0.0.1:`port`/metrics (and /stream)."""
+        self.stop_metrics()
+        self.metrics_server = MetricsServer(self.metrics, port).start()
+        return self.metrics_server
+
+    def stop_metrics(self) -> None:
+        if self.metrics_server is not None:
+            server, self.metrics_server = self.metrics_server, None
+            server.stop()
+
+    def _setup_axes(self, ax: Axes) -> None:
+        ax.set_aspect("equal", adjustable="box")
+        ax.set_xlim(0, self.xlim)
+        ax.set_ylim(0, self.ylim)
+        ax.set_facecolor("white")
+
     # ---------- Input Handling ----------
     def add_engine_objects(self, engine_objects: list[EngineEntity]) -> None:
         self.entities.extend(engine_objects)
 
     def _depth_key(self, e: EngineEntity) -> float:
-        return e.position.y - self.camera.position.y  # farther back => larger
+        # farther back => larger; the order is the same for every camera
+        return e.position.y - self.camera.position.y
 
     def _on_key_press(self, event):
         k = (event.key or "").lower()
         if k == "escape":
             plt.close(self.fig)
             return
-        self._keys_down.add(k)
+        if self._replay_events is None:  # live input is ignored during a replay
+            self._pending_keys.append((PRESS, k))
+        self.fig.canvas.stop_event_loop()  # wake an idle wait
 
     def _on_key_release(self, event):
-        k = (event.key or "").lower()
-        self._keys_down.discard(k)
+        if self._replay_events is None:
+            self._pending_keys.append((RELEASE, (event.key or "").lower()))
+
+    def _apply_key(self, kind: int, k: str) -> None:
+        if kind == RELEASE:
+            self._keys_down.discard(k)
+            return
+        if k in ("[", "]"):
+            self._step_time_scale(1 if k == "]" else -1)
+        elif k == "\\":
+            self.set_time_scale(1.0)
+        self._keys_down.add(k)
+
+    def _begin_input_frame(self) -> None:
+        """Apply this frame's input: queued live keys, or the replayed ones."""
+        if self._replay_events is not None:
+            keys = self._replay_events.pop(self.clock.frame, [])
+        else:
+            keys, self._pending_keys = self._pending_keys, []
+        if self.recorder is not None:
+            self.recorder.frame(self.clock.dt)
+        for kind, k in keys:
+            if self.recorder is not None:
+                self.recorder.key(kind, k)
+            self._apply_key(kind, k)
+
+    def _on_resize(self, event):
+        self._force_redraw = True
+
+    # ---------- Time warp ----------
+    def set_time_scale(self, scale: float) -> None:
+        """
+        Simulated seconds per real second, clamped to (0, MAX_TIME_SCALE].
+        Safe from any thread; takes effect at the simulation's next step.
+        """
+        if scale <= 0:
+            raise ValueError("Time scale must be positive")
+        scale = min(float(scale), MAX_TIME_SCALE)
+        with self._time_scale_lock:
+            self._pending_time_scale = scale
+        event(log, "Time scale", scale=scale)
+
+    def _apply_time_scale(self) -> None:
+        """Adopt a requested scale; called only by the thread that steps."""
+        if self._pending_time_scale is None:
+            return
+        with self._time_scale_lock:
+            scale, self._pending_time_scale = self._pending_time_scale, None
+        if scale is not None:
+            self.time_scale = scale
+            self._warp_debt = 0.0
+
+    def _step_time_scale(self, direction: int) -> None:
+        current = self._pending_time_scale or self.time_scale
+        faster = [s for s in TIME_SCALES if s > current]
+        slower = [s for s in TIME_SCALES if s < current]
+        if direction > 0 and faster:
+            self.set_time_scale(faster[0])
+        elif direction < 0 and slower:
+            self.set_time_scale(slower[-1])
+
+    def _warp_steps(self, sim_seconds: float, step: float) -> int:
+        """Whole `step`s owed after adding `sim_seconds`; the remainder carries over."""
+        self._warp_debt += sim_seconds
+        steps = int(self._warp_debt // step)
+        if steps > self.max_sub_steps:
+            # Can't keep up: drop simulated time instead of spiralling
+            steps = self.max_sub_steps
+            self._warp_debt = 0.0
+        else:
+            self._warp_debt -= steps * step
+        return steps
+
+    def _step_simulation(self, wall_dt: float) -> None:
+        """Advance the window's simulation by `wall_dt` real seconds."""
+        clock = self.sim_clock
+        if not isinstance(clock, SimClock):
+            raise RuntimeError("The window loop steps the simulation on a SimClock")
+        self._apply_time_scale()
+        if self.time_scale == 1.0:
+            clock.advance(wall_dt)
+            self._update_all(clock)
+            return
+        scaled_dt = wall_dt * self.time_scale
+        step = min(self.warp_step, scaled_dt)
+        if step <= 0:
+            return
+        for _ in range(self._warp_steps(scaled_dt, step)):
+            clock.advance(step)
+            self._update_all(clock)
 
     # ---------- Projection helpers (high-level) ----------
-    def _project_entity_frames(self, entity: EngineEntity) -> tuple[Frame, Frame]:
+    def _project_entity_frames(
+        self,
+        entity: EngineEntity,
+        back: DrawLayer | None = None,
+        front: DrawLayer | None = None,
+        frame_clock: int | None = None,
+        camera: Camera | None = None,
+    ) -> tuple[DrawLayer, DrawLayer]:
         """
-        Returns (back_and_sides, front) frames for the entity.
-        Back/sides are drawn first, then front on top (seal).
+        Projects the entity into (back_and_sides, front) layers, appending to
+        the given layers when passed. Back/sides are drawn first, then front on
+        top (seal). Extrusion topology comes from the per-frame cache, so only
+        the vertex array is projected here.
         """
-        frame = entity.get_frame(self.clock.frame, self.fps_target)
+        back = DrawLayer() if back is None else back
+        front = DrawLayer() if front is None else front
+        if frame_clock is None:
+            frame_clock = self.clock.frame
+        camera = self.camera if camera is None else camera
 
         EPS = 1e-6
         HEIGHT_SCALE_FACTOR = 1.0
@@ -92,221 +391,165 @@ class Engine(EngineProtocol):
         ymin, ymax = 0.0, float(self.ylim)
 
         pos = entity.position
-        cam_x = self.camera.position.x * WORLD_X_FACTOR
-        cam_y = self.camera.position.y
+        cam_x = camera.position.x * WORLD_X_FACTOR
+        cam_y = camera.position.y
         horizon_y = self.centre.y
         centre_x = self.centre.x
 
         # Early reject: object behind camera
         distance = pos.y - cam_y
         if distance <= EPS:
-            return ([], [])
+            return (back, front)
 
         def _project_ground_y(dist: float) -> float:
-            return horizon_y - (self.camera.horizon_speed / max(dist, EPS))
+            return horizon_y - (camera.horizon_speed / max(dist, EPS))
 
         def _perspective_scale(dist: float) -> float:
-            return (self.camera.render_distance_scale * 10.0) / max(dist, EPS)
+            return (camera.render_distance_scale * 10.0) / max(dist, EPS)
 
         # Cache constant ratios for this entity
         ent_h = max(EPS, float(entity.target_size.height))
-        cam_h = max(EPS, float(self.camera.height) * (HEIGHT_SCALE_FACTOR * 10.0))
+        cam_h = max(EPS, float(camera.height) * (HEIGHT_SCALE_FACTOR * 10.0))
         height_ratio = ent_h / cam_h
 
-        def _project_point(local_x: float, local_y: float, entity_y: float) -> Point:
-            dist = entity_y - cam_y
-            if dist <= EPS:
-                # offscreen/behind, return sentinel outside viewport for culling
-                return Point(-1e9, -1e9)
+        lod = self._select_lod(entity, _perspective_scale(distance) * height_ratio)
+        if lod == LOD_BILLBOARD:
+            topology = extrusion_topology(
+                billboard_frame(entity.animation, entity.bounds)
+            )
+            local = topology.local
+        else:
+            topology, local = self._geometry(entity, frame_clock, lod)
+        if not len(local):
+            return (back, front)
+        extrude = lod < LOD_BILLBOARD and self.side_walls
+
+        def _project_plane(dist: float) -> np.ndarray:
             base_scale = _perspective_scale(dist)
-            shape_scale = base_scale * height_ratio
             world_x = (pos.x * WORLD_X_FACTOR - cam_x) * base_scale
-            return Point(
-                centre_x + world_x + local_x * shape_scale,
-                _project_ground_y(dist) + local_y * shape_scale,
-            )
-
-        def _in_view(p: Point) -> bool:
-            return (xmin - PAD) <= p.x <= (xmax + PAD) and (ymin - PAD) <= p.y <= (
-                ymax + PAD
-            )
+            offset = (centre_x + world_x, _project_ground_y(dist))
+            return local * (base_scale * height_ratio) + offset
 
         depth = getattr(entity.size, "depth", 0.1)
-
-        back_and_sides: Frame = []
-        front: Frame = []
-
-        for draw in frame:
-            if isinstance(draw, Segment):
-                s_front = _project_point(draw.start.x, draw.start.y, pos.y)
-                e_front = _project_point(draw.end.x, draw.end.y, pos.y)
-                s_back = _project_point(draw.start.x, draw.start.y, pos.y + depth)
-                e_back = _project_point(draw.end.x, draw.end.y, pos.y + depth)
-
-                # Back edge
-                if _in_view(s_back) or _in_view(e_back):
-                    back_and_sides.append(
-                        Segment(
-                            start=s_back,
-                            end=e_back,
-                            line=Line(
-                                color=draw.line.color,
-                                weight=draw.line.weight * 0.8,
-                                style=draw.line.style,
-                                marker=draw.line.marker,
-                                alpha=draw.line.alpha * 0.6,
-                            ),
-                        )
-                    )
-                # Side connectors
-                if _in_view(s_front) or _in_view(s_back):
-                    back_and_sides.append(
-                        Segment(
-                            start=s_front,
-                            end=s_back,
-                            line=Line(
-                                color=draw.line.color,
-                                weight=draw.line.weight * 0.6,
-                                style=":",
-                                marker="",
-                                alpha=draw.line.alpha * 0.5,
-                            ),
-                        )
-                    )
-                if _in_view(e_front) or _in_view(e_back):
-                    back_and_sides.append(
-                        Segment(
-                            start=e_front,
-                            end=e_back,
-                            line=Line(
-                                color=draw.line.color,
-                                weight=draw.line.weight * 0.6,
-                                style=":",
-                                marker="",
-                                alpha=draw.line.alpha * 0.5,
-                            ),
-                        )
-                    )
-                # Front edge
-                if _in_view(s_front) or _in_view(e_front):
-                    front.append(Segment(start=s_front, end=e_front, line=draw.line))
-
-            elif isinstance(draw, Fill):
-                front_pts = [_project_point(p.x, p.y, pos.y) for p in draw.points]
-                back_pts = [
-                    _project_point(p.x, p.y, pos.y + depth) for p in draw.points
-                ]
-
-                # Back face
-                back_and_sides.append(
-                    Fill(
-                        points=back_pts,
-                        color=draw.color,
-                        alpha=draw.alpha * 0.6,
-                        edgecolor=draw.edgecolor,
-                    )
-                )
-
-                # Side walls (quads)
-                n = len(draw.points)
-                for i in range(n):
-                    p1f, p2f = front_pts[i], front_pts[(i + 1) % n]
-                    p1b, p2b = back_pts[i], back_pts[(i + 1) % n]
-                    if any((_in_view(p) for p in (p1f, p2f, p1b, p2b))):
-                        back_and_sides.append(
-                            Fill(
-                                points=[p1f, p2f, p2b, p1b],
-                                color=draw.color,
-                                alpha=draw.alpha * 0.4,
-                                edgecolor=draw.edgecolor,
-                            )
-                        )
-
-                # Front face
-                front.append(
-                    Fill(
-                        points=front_pts,
-                        color=draw.color,
-                        alpha=draw.alpha,
-                        edgecolor=draw.edgecolor,
-                    )
-                )
-
-        return (back_and_sides, front)
+        points = _project_plane(distance)
+        if extrude:
+            back_dist = distance + depth
+            if back_dist > EPS:
+                back_points = _project_plane(back_dist)
+            else:
+                # offscreen/behind, sentinel outside viewport for culling
+                back_points = np.full_like(points, -1e9)
+            points = np.concatenate([points, back_points])
+
+        px, py = points[:, 0], points[:, 1]
+        in_view = (
+            (px >= xmin - PAD)
+            & (px <= xmax + PAD)
+            & (py >= ymin - PAD)
+            & (py <= ymax + PAD)
+        )
+        topology.emit(points, in_view, back, front, extrude)
+        return (back, front)
+
+    def _geometry(self, entity: EngineEntity, frame_clock: int, lod: int) -> tuple:
+        """`entity.get_geometry`, fetched once per tick and reused by every view."""
+        if frame_clock != self._geometry_frame:
+            self._geometry_cache.clear()
+            self._geometry_frame = frame_clock
+        key = (id(entity), lod)
+        geometry = self._geometry_cache.get(key)
+        if geometry is None:
+            geometry = entity.get_geometry(frame_clock, self.fps_target, lod)
+            self._geometry_cache[key] = geometry
+        return geometry
+
+    def _select_lod(self, entity: EngineEntity, shape_scale: float) -> int:
+        """Level of detail from the entity's projected size on screen."""
+        if not self.lod_enabled:
+            return LOD_FULL
+        extent = max(entity.bounds.width, entity.bounds.height)
+        return select_lod(shape_scale * extent, self._camera_moving, self.lod_bias)
+
+    # ---------- Dirty tracking ----------
+    def _views_changed(self) -> list[bool]:
+        """Per viewport: True when a redraw was forced or its camera moved."""
+        forced = self._force_redraw
+        self._force_redraw = False
+        return [view.pose_changed() or forced for view in self.viewports]
+
+    def _entities_changed(self, frame: int) -> bool:
+        """True when the entity set or any entity's look changed since last asked."""
+        changed = False
+
+        # List equality falls back to identity for entities (a C loop)
+        if self.entities != self._drawn_entities:
+            self._drawn_entities = list(self.entities)
+            changed = True
+
+        # Every entity refreshes its key, so no short-circuiting here
+        fps = self.fps_target
+        dirty = [e.changed_since_last_frame(frame, fps) for e in self.entities]
+        if self.background and self.background.changed_since_last_frame(frame, fps):
+            changed = True
+        return changed or any(dirty)
 
     # ---------- Batched drawing ----------
-    def _draw_scene(self):
-        self.ax.cla()
-        self.ax.set_xlim(0, self.xlim)
-        self.ax.set_ylim(0, self.ylim)
-        self.ax.set_aspect("equal", adjustable="box")
-
-        # Update camera from input once per frame
-        self.camera.update_from_input(self._keys_down, self.clock.dt)
-
-        # --- Accumulators for batched drawing ---
-        lines_back = []  # list of ((x0,y0),(x1,y1))
-        lw_back = []  # linewidths
-        lc_back = []  # colors
-        la_back = []  # alphas
-        polys_back = []  # list of Nx2 arrays for PatchCollection
-        pc_face_back = []  # facecolors (rgba or color str)
-        pc_edge_back = []  # edgecolors
-        pa_back = []  # alphas
-
-        lines_front, lw_front, lc_front, la_front = [], [], [], []
-        polys_front, pc_face_front, pc_edge_front, pa_front = [], [], [], []
+    def _draw_scene(
+        self, force: bool = False, snapshot: SceneSnapshot | None = None
+    ) -> bool:
+        """
+        Redraw if anything visible changed (or `force`); returns whether it drew.
+        With a `snapshot`, draws its entities instead of the live ones.
+        """
+        moved = self._views_changed()
+        if snapshot is None:
+            changed = self._entities_changed(self.clock.frame)
+            entities, background = self.entities, self.background
+            frame = self.clock.frame
+        else:
+            changed = snapshot.seq != self._drawn_seq
+            self._drawn_seq = snapshot.seq
+            entities, background = snapshot.entities, snapshot.background
+            frame = snapshot.frame
+
+        # Only views whose camera moved are redrawn, unless the scene changed
+        dirty = [
+            view
+            for view, view_moved in zip(self.viewports, moved)
+            if view_moved or changed or force
+        ]
+        if not dirty:
+            return False
+
+        # Depth order doesn't depend on the camera, so sort once for all views
+        entities = self._depth_sorted(entities)
+        for view in dirty:
+            self._draw_viewport(view, entities, background, frame)
 
-        # Background (no transform, drawn in its own small batch)
-        if self.background:
-            bg_frame = self.background.get_frame(self.clock.frame, self.fps_target)
-            for draw in bg_frame:
-                if isinstance(draw, Segment):
-                    lines_back.append(
-                        [(draw.start.x, draw.start.y), (draw.end.x, draw.end.y)]
-                    )
-                    lw_back.append(draw.line.weight)
-                    lc_back.append(draw.line.color)
-                    la_back.append(draw.line.alpha)
-                elif isinstance(draw, Fill):
-                    polys_back.append([(p.x, p.y) for p in draw.points])
-                    pc_face_back.append(draw.color)
-                    pc_edge_back.append(draw.edgecolor or draw.color)
-                    pa_back.append(draw.alpha)
-
-        # Entities back-to-front (farther first)
-        for entity in sorted(self.entities, key=self._depth_key, reverse=True):
-            back_and_sides, front = self._project_entity_frames(entity)
-
-            # --- back & sides
-            for draw in back_and_sides:
-                if isinstance(draw, Segment):
-                    lines_back.append(
-                        [(draw.start.x, draw.start.y), (draw.end.x, draw.end.y)]
-                    )
-                    lw_back.append(draw.line.weight)
-                    lc_back.append(draw.line.color)
-                    la_back.append(draw.line.alpha)
-                else:  # Fill
-                    polys_back.append([(p.x, p.y) for p in draw.points])
-                    pc_face_back.append(draw.color)
-                    pc_edge_back.append(draw.edgecolor or draw.color)
-                    pa_back.append(draw.alpha)
-
-            # --- front
-            for draw in front:
-                if isinstance(draw, Segment):
-                    lines_front.append(
-                        [(draw.start.x, draw.start.y), (draw.end.x, draw.end.y)]
-                    )
-                    lw_front.append(draw.line.weight)
-                    lc_front.append(draw.line.color)
-                    la_front.append(draw.line.alpha)
-                else:  # Fill
-                    polys_front.append([(p.x, p.y) for p in draw.points])
-                    pc_face_front.append(draw.color)
-                    pc_edge_front.append(draw.edgecolor or draw.color)
-                    pa_front.append(draw.alpha)
+        # One draw call
+        self.fig.canvas.draw_idle()
+        self.fig.canvas.flush_events()
+        return True
+
+    def _draw_viewport(
+        self,
+        view: Viewport,
+        entities: list[EngineEntity],
+        background: EngineEntity | None,
+        frame: int,
+    ) -> None:
+        """Re-project the (depth-sorted) scene for one view into its axes."""
+        if view.map is not None:
+            self._draw_map(view, entities)
+            return
+        ax = view.ax
+        ax.cla()
+        ax.set_xlim(0, self.xlim)
+        ax.set_ylim(0, self.ylim)
+        ax.set_aspect("equal", adjustable="box")
+
+        self._camera_moving = view.moving
+        back, front = self._build_layers(entities, background, frame, view.camera)
 
         # --- Explicit painter's algorithm control ---
         Z_BACK_FILL = 1.0
@@ -314,81 +557,394 @@ class Engine(EngineProtocol):
         Z_FRONT_FILL = 1.2
         Z_FRONT_LINES = 1.3
 
-        # BACK FILLS
-        if polys_back:
-            pc_back = PatchCollection(
-                [Polygon(p, closed=True) for p in polys_back], match_original=True
+        self._add_layer(ax, back, Z_BACK_FILL, Z_BACK_LINES)
+        self._add_layer(ax, front, Z_FRONT_FILL, Z_FRONT_LINES)
+
+    def _draw_map(self, view: Viewport, entities: Iterable[EngineEntity]) -> None:
+        """Render the top-down map into the view's single image artist."""
+        rides, guests = _split_rides(entities)
+        image = view.map.render(*map_inputs(rides, guests))
+        if view.image is None:
+            view.ax.cla()
+            view.ax.set_axis_off()
+            view.image = view.ax.imshow(
+                image,
+                origin="lower",
+                extent=view.map.extent,
+                interpolation="nearest",
             )
-            pc_back.set_facecolor(pc_face_back)
-            pc_back.set_edgecolor(pc_edge_back)
-            pc_back.set_zorder(Z_BACK_FILL)
-            if len(set(pa_back)) == 1:
-                pc_back.set_alpha(pa_back[0])
-            self.ax.add_collection(pc_back, autolim=False)
-
-        # BACK SEGMENTS
-        if lines_back:
-            lc_back = LineCollection(lines_back, linewidths=lw_back, colors=lc_back)
-            lc_back.set_zorder(Z_BACK_LINES)  # <- override auto zorder
-            if len(set(la_back)) == 1:
-                lc_back.set_alpha(la_back[0])
-            self.ax.add_collection(lc_back, autolim=False)
-
-        # FRONT FILLS
-        if polys_front:
-            pc_front = PatchCollection(
-                [Polygon(p, closed=True) for p in polys_front], match_original=True
+        else:
+            view.image.set_data(image)
+
+    def _update_camera(self, sim_time: float) -> None:
+        """Follow the scripted paths at `sim_time`; the main view else the held keys."""
+        if self.camera_path is not None:
+            self.camera_path.apply(self.camera, sim_time)
+        else:
+            self.camera.update_from_input(self._keys_down, self.clock.dt)
+        for view in self.viewports[1:]:
+            if view.camera_path is not None:
+                view.camera_path.apply(view.camera, sim_time)
+
+    def _depth_sorted(self, entities: Iterable[EngineEntity]) -> list[EngineEntity]:
+        """Back-to-front (farther first); the same order for every camera."""
+        return sorted(entities, key=self._depth_key, reverse=True)
+
+    def _build_layers(
+        self,
+        entities: Iterable[EngineEntity],
+        background: EngineEntity | None,
+        frame: int,
+        camera: Camera | None = None,
+    ) -> tuple[DrawLayer, DrawLayer]:
+        """
+        Project the scene as seen by `camera` into (back, front) layers;
+        `entities` must already be depth-sorted (`_depth_sorted`).
+        """
+        back = DrawLayer()
+        front = DrawLayer()
+
+        # Background (no transform, drawn in its own small batch)
+        if background:
+            bg_frame = background.get_frame(frame, self.fps_target)
+            bg = extrusion_topology(bg_frame)
+            bg.emit(bg.local, np.ones(len(bg.local), dtype=bool), back, back, False)
+
+        for entity in entities:
+            self._project_entity_frames(entity, back, front, frame, camera)
+        return back, front
+
+    def scene_layers(
+        self, snapshot: SceneSnapshot | None = None, camera: Camera | None = None
+    ) -> tuple[DrawLayer, DrawLayer]:
+        """Projected layers of the live scene, or of `snapshot` when given."""
+        return self.render_views([camera], snapshot)[0]
+
+    def render_views(
+        self,
+        cameras: Iterable[Camera] | None = None,
+        snapshot: SceneSnapshot | None = None,
+    ) -> list[tuple[DrawLayer, DrawLayer]]:
+        """
+        Layers for each camera (default: every viewport's) from one simulation
+        state; entity geometry is fetched once and only projection repeats.
+        """
+        if cameras is None:
+            cameras = [view.camera for view in self.viewports if view.map is None]
+        if snapshot is None:
+            entities, background = self.entities, self.background
+            frame = self.clock.frame
+        else:
+            entities, background = snapshot.entities, snapshot.background
+            frame = snapshot.frame
+
+        # Depth order doesn't depend on the camera, so sort once for all of them
+        entities = self._depth_sorted(entities)
+        return [
+            self._build_layers(entities, background, frame, camera)
+            for camera in cameras
+        ]
+
+    def render_raster(
+        self,
+        width: int,
+        height: int,
+        snapshot: SceneSnapshot | None = None,
+        camera: Camera | None = None,
+    ) -> np.ndarray:
+        """Rasterize the scene with NumPy instead of matplotlib; returns RGBA."""
+        renderer = RasterRenderer(width, height, self.xlim, self.ylim)
+        return renderer.render(self.scene_layers(snapshot, camera))
+
+    def export_frame(self, path: str | Path, camera: Camera | None = None) -> None:
+        """Write the current scene to `path`: SVG/PDF as vectors, else a raster image."""
+        if camera is None and self.camera_path is not None:
+            self.camera_path.apply(self.camera, self.sim_clock.time)
+        layers = self.scene_layers(camera=camera)
+        if Path(path).suffix.lower() in VECTOR_SUFFIXES:
+            write_vector(path, layers, self.xlim, self.ylim)
+            return
+        scale = PAGE_SIZE / max(self.xlim, self.ylim)
+        width, height = round(self.xlim * scale), round(self.ylim * scale)
+        RasterRenderer(width, height, self.xlim, self.ylim).save(str(path), layers)
+
+    def _add_layer(
+        self, ax: Axes, layer: DrawLayer, z_fill: float, z_lines: float
+    ) -> None:
+        """Hand one layer to matplotlib as a PolyCollection and a LineCollection."""
+        if layer.polygons:
+            faces, edges = layer.polygon_colors()
+            pc = PolyCollection(
+                layer.polygons, closed=True, facecolors=faces, edgecolors=edges
             )
-            pc_front.set_facecolor(pc_face_front)
-            pc_front.set_edgecolor(pc_edge_front)
-            pc_front.set_zorder(Z_FRONT_FILL)
-            if len(set(pa_front)) == 1:
-                pc_front.set_alpha(pa_front[0])
-            self.ax.add_collection(pc_front, autolim=False)
-
-        # FRONT SEGMENTS
-        if lines_front:
-            lc_front = LineCollection(lines_front, linewidths=lw_front, colors=lc_front)
-            lc_front.set_zorder(Z_FRONT_LINES)  # <- override auto zorder
-            if len(set(la_front)) == 1:
-                lc_front.set_alpha(la_front[0])
-            self.ax.add_collection(lc_front, autolim=False)
+            pc.set_zorder(z_fill)
+            ax.add_collection(pc, autolim=False)
 
-        # One draw call
-        self.fig.canvas.draw_idle()
-        self.fig.canvas.flush_events()
+        segments, widths, colors = layer.line_arrays()
+        if len(segments):
+            lc = LineCollection(segments, linewidths=widths, colors=colors)
+            lc.set_zorder(z_lines)  # <- override auto zorder
+            ax.add_collection(lc, autolim=False)
 
     # ---------- Update Cycle ----------
-    def _update_all(self):
+    def _update_all(self, clock: ClockProtocol | None = None):
+        started = time.perf_counter()
+        clock = self.clock if clock is None else clock
         if self.background:
-            self.background.update(self.clock)
-        for obj in self.entities:
-            obj.update(self.clock)
+            self.background.update(clock)
+        self._scheduler.update(self.entities, clock)
+        if self.navigation is not None or self.crowd is not None:
+            self._move_guests(clock)
+
+        maps = [view.map for view in self.viewports if view.map is not None]
+        if maps:
+            positions = self._guest_positions()
+            for park_map in maps:
+                park_map.accumulate(positions, clock.dt)
+
+        if self.telemetry is None and self.metrics_server is None:
+            return
+        step_time = time.perf_counter() - started
+        guests, queues = self._guest_counts()
+        if self.telemetry is not None:
+            self.telemetry.record(clock.time, step_time, guests, queues)
+        if self.metrics_server is not None and started >= self._metrics_due:
+            self._metrics_due = started + self.metrics_interval
+            self._publish_metrics(clock, step_time, guests, queues)
+
+    def _guest_counts(self) -> tuple[int, np.ndarray]:
+        """Number of guests, and how many are queueing at each ride."""
+        guests = 0
+        queues = np.zeros(len(self.rides), dtype=np.int64)
+        for batch in self._scheduler.batches:
+            if isinstance(batch, PersonBatch):
+                guests += len(batch)
+                if self.navigation is not None:
+                    queues += self.navigation.queue_lengths(batch)
+        return guests, queues
+
+    def _publish_metrics(
+        self, clock: ClockProtocol, step_time: float, guests: int, queues: np.ndarray
+    ) -> None:
+        pacer = self.pacer
+        self.metrics.publish(
+            sim_time=clock.time,
+            frame=clock.frame,
+            fps=pacer.fps if pacer else 0.0,
+            frame_ms=pacer.frame_cost * 1000 if pacer else 0.0,
+            quality=pacer.quality if pacer else 0,
+            time_scale=self.time_scale,
+            entities=len(self.entities),
+            guests=guests,
+            step_ms=step_time * 1000,
+            rides=tuple(
+                RideMetrics(
+                    type(ride).__name__,
+                    getattr(getattr(ride, "state", None), "name", ""),
+                    int(queue),
+                    ride.max_capacity,
+                )
+                for ride, queue in zip(self.rides, queues)
+            ),
+        )
+
+    def _move_guests(self, clock: ClockProtocol) -> None:
+        """Navigation, then crowd separation, on every batch of guests."""
+        footprints = None
+        for batch in self._scheduler.batches:
+            if not isinstance(batch, PersonBatch):
+                continue
+            if self.navigation is not None:
+                self.navigation.steer(batch, clock.dt)
+            if self.crowd is not None:
+                if footprints is None:
+                    footprints, _ = map_inputs(self.rides, ())
+                self.crowd.apply(batch.arrays["_x"], batch.arrays["_y"], footprints)
+
+    def _guest_positions(self) -> np.ndarray:
+        """(M, 2) positions of every batched guest, straight from the batch arrays."""
+        positions = [
+            np.stack([batch.arrays["_x"], batch.arrays["_y"]], axis=1)
+            for batch in self._scheduler.batches
+            if isinstance(batch, PersonBatch)
+        ]
+        return np.concatenate(positions) if positions else np.empty((0, 2))
+
+    def advance_to(self, sim_time: float, dt: float | None = None) -> None:
+        """Step the simulation under a fixed-step clock until `sim_time` seconds."""
+        if not isinstance(self.clock, FixedStepClock):
+            if dt is None:
+                dt = 1.0 / (self.fps_target or DEFAULT_SIM_RATE)
+            self.clock = FixedStepClock(dt)
+            self.sim_clock = self.clock
+        while self.clock.time < sim_time:
+            self.clock.tick()
+            self._update_all()
+
+    # ---------- Simulation thread ----------
+    def _publish_snapshot(self, force: bool = False) -> None:
+        """Publish detached copies of the scene if its look changed."""
+        if not self._entities_changed(self.sim_clock.frame) and not force:
+            return
+        background = self.background.snapshot() if self.background else None
+        self.snapshots.publish(
+            self.sim_clock.frame,
+            self.sim_clock.time,
+            tuple(e.snapshot() for e in self.entities),
+            background,
+        )
+
+    def _simulation_loop(self, stop: threading.Event) -> None:
+        """
+        Step the simulation at `sim_clock.dt` until `stop` is set. Time warp
+        runs several steps per wall-clock step and publishes only the last.
+        """
+        step = self.sim_clock.dt
+        next_step = time.perf_counter()
+        while not stop.is_set():
+            self._apply_time_scale()
+            for _ in range(self._warp_steps(step * self.time_scale, step)):
+                self.sim_clock.tick()
+                self._update_all(self.sim_clock)
+            self._publish_snapshot()
+
+            next_step += step
+            delay = next_step - time.perf_counter()
+            if delay > 0:
+                stop.wait(delay)
+            else:
+                # Overloaded: run late rather than bursting to catch up
+                next_step = time.perf_counter()
 
     # ---------- Run Loop ----------
-    def run(self, fps_target: int | None = None):
+    def run(
+        self,
+        fps_target: int | None = None,
+        async_sim: bool = False,
+        sim_rate: float | None = None,
+        fixed_step: bool = False,
+        replay: InputLog | None = None,
+    ):
+        """
+        Open the window loop. `fixed_step` advances every frame by 1/fps_target
+        regardless of wall time; `replay` plays back a recorded session.
+        """
+        if self.headless:
+            raise RuntimeError("A headless engine has no window to run in")
         if fps_target is not None:
             self.fps_target = fps_target
-        target_dt = 1.0 / self.fps_target
+        if async_sim:
+            if replay is not None or self.recorder is not None:
+                raise ValueError("Input recording and replay need the synchronous loop")
+            self._run_async(DEFAULT_SIM_RATE if sim_rate is None else sim_rate)
+            return
+        if replay is not None:
+            self._start_replay(replay)
+        elif fixed_step:
+            self.clock = FixedStepClock(1.0 / (self.fps_target or DEFAULT_SIM_RATE))
+        self.sim_clock = SimClock()
+        pacer = self.pacer = FramePacer(self.fps_target)
         plt.ion()
         while plt.fignum_exists(self.fig.number):
-            frame_start = time.perf_counter()
+            pacer.begin()
             self.clock.tick()
+            if isinstance(self.clock, ReplayClock) and self.clock.finished:
+                break
+            self._begin_input_frame()
+            self._update_camera(self.sim_clock.time)
+
+            if pacer.should_render():
+                if not self._draw_scene():
+                    # Idle: nothing visible changed, so wait for input (a key
+                    # press stops the event loop early) before stepping again
+                    self._step_simulation(self.clock.dt)
+                    self.fig.canvas.start_event_loop(self.idle_poll_interval)
+                    pacer.resync()
+                    continue
+            else:
+                # Overloaded: step the simulation but skip drawing this frame
+                self.fig.canvas.flush_events()
+            self._step_simulation(self.clock.dt)
+            self._end_frame(pacer)
+
+    # ---------- Recording / replay ----------
+    def record_input(self, **settings) -> InputRecorder:
+        """
+        Log frame times and key events of the next `run`. `settings` (seed,
+        time scale, ...) are stored with the log for whoever replays it.
+        """
+        self.recorder = InputRecorder(**settings)
+        return self.recorder
+
+    def _start_replay(self, replay: InputLog) -> None:
+        self.clock = ReplayClock(replay.dts)
+        self._replay_events = replay.events_by_frame()
+        self._keys_down.clear()
+        self._pending_keys.clear()
+
+    def replay_headless(self, replay: InputLog) -> None:
+        """Play a recorded session through the simulation and cameras, undrawn."""
+        self._start_replay(replay)
+        self.sim_clock = SimClock()
+        for _ in range(replay.frames):
+            self.clock.tick()
+            self._begin_input_frame()
+            self._update_camera(self.sim_clock.time)
+            self._step_simulation(self.clock.dt)
+
+    def _run_async(self, sim_rate: float) -> None:
+        """Render the latest snapshot while a separate thread runs the simulation."""
+        self.sim_clock = FixedStepClock(1.0 / sim_rate)
+        self._publish_snapshot(force=True)
+
+        stop = threading.Event()
+        simulation = threading.Thread(
+            target=self._simulation_loop, args=(stop,), name="simulation", daemon=True
+        )
+        pacer = self.pacer = FramePacer(self.fps_target)
+        plt.ion()
+        simulation.start()
+        try:
+            while plt.fignum_exists(self.fig.number):
+                pacer.begin()
+                self.clock.tick()
+                self._begin_input_frame()
+                snapshot = self.snapshots.latest()
+                self._update_camera(snapshot.time)
+                if not pacer.should_render():
+                    self.fig.canvas.flush_events()
+                elif not self._draw_scene(snapshot=snapshot):
+                    # Nothing new to show; keep the GUI responsive until next frame
+                    self.fig.canvas.start_event_loop(pacer.target_dt or 1e-3)
+                    pacer.resync()
+                    continue
+                self._end_frame(pacer)
+        finally:
+            stop.set()
+            simulation.join()
+
+    def _end_frame(self, pacer: FramePacer) -> None:
+        """Adapt render quality, report FPS and wait out the rest of the frame."""
+        wait = pacer.finish()
+        if self.adaptive_quality:
+            self._apply_quality(pacer.render_quality)
+
+        self._frame_counter += 1
+        if self._frame_counter % self._fps_log_every == 0:
+            event(
+                log,
+                "Frame stats",
+                fps=pacer.fps,
+                frame_ms=pacer.frame_cost * 1000,
+                quality=pacer.quality,
+            )
 
-            self._draw_scene()
-            self._update_all()
-
-            # Soft sync
-            elapsed = time.perf_counter() - frame_start
-            sleep_for = target_dt - elapsed
-            if sleep_for > 0:
-                time.sleep(sleep_for)
-
-            self._frame_counter += 1
-            if self._frame_counter % self._fps_print_every == 0:
-                actual = time.perf_counter() - frame_start
-                if actual > 0:
-                    print(f"FPS: {1.0 / actual:.2f}")
-
-            plt.pause(1e-6)
+        # Waiting inside the GUI event loop keeps input and redraws flowing
+        if wait > 0:
+            self.fig.canvas.start_event_loop(wait)
 
+    def _apply_quality(self, quality: RenderQuality) -> None:
+        if (self.lod_bias, self.side_walls) != (quality.lod_bias, quality.side_walls):
+            self.lod_bias = quality.lod_bias
+            self.side_walls = quality.side_walls
+            self._force_redraw = True
@@ -1,19 +1,26 @@
+import copy
 from dataclasses import dataclass
-from typing import Iterable
+from typing import ClassVar, Iterable
+
+import numpy as np
+
 from .animation import Segment, Point, Animation, Frame, Fill
+from .batch import EntityBatch
 from .clock import ClockProtocol
+from .extrusion import ExtrusionTopology, extrusion_topology
+from .lod import LOD_FULL, simplify_frame
 
 EPS = 1e-9
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Size:
     height: float
     width: float
     depth: float
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Bounds:
     min_x: float
     max_x: float
@@ -39,53 +46,61 @@ def _iter_points(frame: Frame) -> Iterable[Point]:
                 yield p
 
 
+def compute_animation_bounds(animation: Animation, fps: int = 24) -> Bounds:
+    pts_x, pts_y = [], []
+
+    # Try the most informative source first
+    frames = getattr(animation, "frames", None)
+
+    if frames is not None:
+        for fr in frames:
+            for p in _iter_points(fr):
+                pts_x.append(p.x)
+                pts_y.append(p.y)
+    else:
+        # Fallback: sample a reasonable number of frames
+        # Try to use a known frame count if exposed; else sample 60 steps
+        n = getattr(animation, "num_frames", None) or 60
+        for i in range(n):
+            fr = animation.get_current_frame(i, fps, fps)
+            for p in _iter_points(fr):
+                pts_x.append(p.x)
+                pts_y.append(p.y)
+
+    if not pts_x:
+        # Degenerate bbox; treat as unit box
+        return Bounds(0.0, 1.0, 0.0, 1.0)
+
+    return Bounds(min(pts_x), max(pts_x), min(pts_y), max(pts_y))
+
+
 class EngineEntity:
     """Model + view glue: holds pose and renders transformed geometry."""
 
+    # Set to an EntityBatch subclass to have the engine update all instances at once
+    batch_type: ClassVar[type[EntityBatch] | None] = None
+
     def __init__(
         self,
         animation: Animation,
         position: Point = Point(0.0, 0.0),
         target_size: Size = Size(1, 1, 1),
         fps: int = 24,
+        bounds: Bounds | None = None,
     ) -> None:
         self.position = position
         self.target_size = target_size
         self.animation = animation
         self.fps = fps
 
-        # Derived at construction:
-        self.bounds = self._compute_animation_bounds()
+        # Derived at construction (or shared, when the caller already knows it):
+        self.bounds = self._compute_animation_bounds() if bounds is None else bounds
         self.size = self._calc_size_from_target()  # metres per normalised unit
         # Optional: offset that recentres the animation bbox min corner at (0,0)
         self.norm_offset = Point(-self.bounds.min_x, -self.bounds.min_y)
 
     def _compute_animation_bounds(self) -> Bounds:
-        pts_x, pts_y = [], []
-
-        # Try the most informative source first
-        frames = getattr(self.animation, "frames", None)
-
-        if frames is not None:
-            for fr in frames:
-                for p in _iter_points(fr):
-                    pts_x.append(p.x)
-                    pts_y.append(p.y)
-        else:
-            # Fallback: sample a reasonable number of frames
-            # Try to use a known frame count if exposed; else sample 60 steps
-            n = getattr(self.animation, "num_frames", None) or 60
-            for i in range(n):
-                fr = self.animation.get_current_frame(i, self.fps, self.fps)
-                for p in _iter_points(fr):
-                    pts_x.append(p.x)
-                    pts_y.append(p.y)
-
-        if not pts_x:
-            # Degenerate bbox; treat as unit box
-            return Bounds(0.0, 1.0, 0.0, 1.0)
-
-        return Bounds(min(pts_x), max(pts_x), min(pts_y), max(pts_y))
+        return compute_animation_bounds(self.animation, self.fps)
 
     def _calc_size_from_target(self) -> Size:
         w = self.bounds.width if self.bounds.width > EPS else 1.0
@@ -96,8 +111,42 @@ class EngineEntity:
             depth=self.target_size.depth,  # passthrough for now
         )
 
-    def get_frame(self, frame_clock: int, engine_fps: int = 24) -> Frame:
-        return self.animation.get_current_frame(frame_clock, self.fps, engine_fps)
+    def get_frame(
+        self, frame_clock: int, engine_fps: int = 24, lod: int = LOD_FULL
+    ) -> Frame:
+        frame = self.animation.get_current_frame(frame_clock, self.fps, engine_fps)
+        return simplify_frame(frame, lod)
+
+    def get_geometry(
+        self, frame_clock: int, engine_fps: int = 24, lod: int = LOD_FULL
+    ) -> tuple[ExtrusionTopology, np.ndarray]:
+        """
+        Cached extrusion topology of the current frame plus its local vertices.
+        Entities that pose their geometry per tick override this to transform
+        the vertex array instead of rebuilding drawables.
+        """
+        topology = extrusion_topology(self.get_frame(frame_clock, engine_fps, lod))
+        return topology, topology.local
+
+    def snapshot(self) -> "EngineEntity":
+        """Detached shallow copy of the current pose, safe to draw on another thread."""
+        snap = copy.copy(self)
+        batch = self.__dict__.get("_batch")
+        if batch is not None:
+            batch.detach(snap, self._batch_index)
+        return snap
+
+    # ---------- Dirty tracking ----------
+    def visual_key(self, frame_clock: int, engine_fps: int = 24) -> tuple:
+        """Everything that affects how the entity looks; equal keys draw the same."""
+        index = self.animation._get_index(frame_clock, self.fps, engine_fps)
+        return (self.position.x, self.position.y, index)
+
+    def changed_since_last_frame(self, frame_clock: int, engine_fps: int = 24) -> bool:
+        key = self.visual_key(frame_clock, engine_fps)
+        changed = key != getattr(self, "_last_visual_key", None)
+        self._last_visual_key = key
+        return changed
 
     # ---------- Behaviour ----------
     def update(self, clock: ClockProtocol) -> None:
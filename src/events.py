@@ -0,0 +1,82 @@
+"""
+Discrete-event scheduling.
+
+`EventScheduler` keeps a heap of timestamped actions and jumps simulated
+time straight from one event to the next, instead of integrating every
+frame. Ties run in scheduling order, so runs are deterministic.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+from dataclasses import dataclass, field
+from typing import Callable
+
+type Action = Callable[[], None]
+
+
+@dataclass(order=True, slots=True)
+class Event:
+    time: float
+    seq: int
+    action: Action = field(compare=False)
+    cancelled: bool = field(default=False, compare=False)
+
+
+class EventScheduler:
+    """Priority queue of events over simulated time (seconds)."""
+
+    def __init__(self, start: float = 0.0) -> None:
+        self.now = start
+        self.processed = 0
+        self._queue: list[Event] = []
+        self._seq = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    def schedule(self, time: float, action: Action) -> Event:
+        """Run `action` at absolute simulated `time`."""
+        if time < self.now:
+            raise ValueError(f"Cannot schedule at {time} before now ({self.now})")
+        event = Event(time, next(self._seq), action)
+        heapq.heappush(self._queue, event)
+        return event
+
+    def schedule_in(self, delay: float, action: Action) -> Event:
+        return self.schedule(self.now + max(0.0, delay), action)
+
+    @staticmethod
+    def cancel(event: Event) -> None:
+        """Lazily drop a pending event; it is skipped when popped."""
+        event.cancelled = True
+
+    def peek_time(self) -> float | None:
+        return self._queue[0].time if self._queue else None
+
+    def step(self) -> bool:
+        """Run the next event; False when the queue is empty."""
+        while self._queue:
+            event = heapq.heappop(self._queue)
+            if event.cancelled:
+                continue
+            self.now = event.time
+            event.action()
+            self.processed += 1
+            return True
+        return False
+
+    def run_until(self, end: float) -> int:
+        """Run every event up to and including `end`; returns how many ran."""
+        start = self.processed
+        queue = self._queue
+        while queue and queue[0].time <= end:
+            event = heapq.heappop(queue)
+            if event.cancelled:
+                continue
+            self.now = event.time
+            event.action()
+            self.processed += 1
+        self.now = max(self.now, end)
+        return self.processed - start
@@ -0,0 +1,234 @@
+"""
+Extrusion topology cache.
+
+Every drawable is extruded into a back copy plus side walls. Which vertices
+pair up, and the derived back/side styles, depend only on the asset frame, so
+they are computed once per frame and cached, with colours resolved into the
+shared style table. Per-frame work is projecting the vertex array and
+gathering through the precomputed index buffers.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+
+import numpy as np
+
+from .animation import Fill, Frame, Segment
+from .drawlist import DrawLayer
+from .styles import STYLES
+
+# Style of extruded copies relative to the front drawable
+BACK_LINE_WEIGHT, BACK_LINE_ALPHA = 0.8, 0.6
+SIDE_LINE_WEIGHT, SIDE_LINE_ALPHA = 0.6, 0.5
+BACK_FILL_ALPHA = 0.6
+SIDE_FILL_ALPHA = 0.4
+
+_CACHE_SIZE = 4096
+
+
+@dataclass(slots=True, eq=False)
+class ExtrusionTopology:
+    """
+    Index buffers for one frame. `local` holds the frame's vertices draw by
+    draw (`offsets[i]` is the first vertex of draw i). Index buffers address
+    the stacked projection ``[front (V); back (V)]``.
+    """
+
+    local: np.ndarray  # (V, 2)
+    offsets: np.ndarray  # (D + 1,)
+
+    # Lines: back edges + side connectors, then front edges; colours are style ids
+    back_pairs: np.ndarray  # (3S, 2)
+    back_widths: np.ndarray
+    back_styles: np.ndarray
+    front_pairs: np.ndarray  # (S, 2)
+    front_widths: np.ndarray
+    front_styles: np.ndarray
+
+    # Fills: faces are vertex ranges, side walls are quads
+    fill_ranges: list[tuple[int, int]]
+    front_faces: np.ndarray  # (F,) style ids, front alpha
+    front_edges: np.ndarray
+    quads: np.ndarray  # (Q, 4)
+
+    # Back layer polygons in painter order: each fill's back face, then its
+    # side walls. Entries < F are back faces, the rest are quads (Q offset F)
+    back_order: np.ndarray  # (F + Q,)
+    back_order_faces: np.ndarray  # style ids, back or side alpha
+    back_order_edges: np.ndarray
+
+    @property
+    def num_vertices(self) -> int:
+        return len(self.local)
+
+    def emit(
+        self,
+        points: np.ndarray,
+        in_view: np.ndarray,
+        back: DrawLayer,
+        front: DrawLayer,
+        extrude: bool = True,
+    ) -> None:
+        """
+        Append projected primitives to the layers. `points`/`in_view` hold the
+        front plane and, when extruding, the back plane stacked after it.
+        """
+        v = self.num_vertices
+
+        if extrude and len(self.back_pairs):
+            visible = in_view[self.back_pairs].any(axis=1)
+            back.add_segments(
+                points[self.back_pairs[visible]],
+                self.back_widths[visible],
+                self.back_styles[visible],
+            )
+
+        if self.fill_ranges and extrude:
+            f = len(self.fill_ranges)
+            keep = np.ones(f + len(self.quads), dtype=bool)
+            keep[f:] = in_view[self.quads].any(axis=1)  # back faces always draw
+            keep = keep[self.back_order]
+            back_points, quad_points = points[v:], points[self.quads]
+            ranges = self.fill_ranges
+            back.add_polygons(
+                [
+                    (
+                        back_points[ranges[k][0] : ranges[k][1]]
+                        if k < f
+                        else quad_points[k - f]
+                    )
+                    for k in self.back_order[keep].tolist()
+                ],
+                self.back_order_faces[keep],
+                self.back_order_edges[keep],
+            )
+
+        if self.fill_ranges:
+            front.add_polygons(
+                [points[a:b] for a, b in self.fill_ranges],
+                self.front_faces,
+                self.front_edges,
+            )
+
+        if len(self.front_pairs):
+            visible = in_view[self.front_pairs].any(axis=1)
+            front.add_segments(
+                points[self.front_pairs[visible]],
+                self.front_widths[visible],
+                self.front_styles[visible],
+            )
+
+
+def _build(frame: Frame) -> ExtrusionTopology:
+    coords: list[tuple[float, float]] = []
+    offsets = [0]
+    segments: list[tuple[int, Segment]] = []
+    fills: list[tuple[int, Fill]] = []
+
+    for draw in frame:
+        start = len(coords)
+        if isinstance(draw, Segment):
+            coords.append((draw.start.x, draw.start.y))
+            coords.append((draw.end.x, draw.end.y))
+            segments.append((start, draw))
+        elif isinstance(draw, Fill):
+            coords.extend((p.x, p.y) for p in draw.points)
+            fills.append((start, draw))
+        offsets.append(len(coords))
+
+    v = len(coords)
+    local = np.array(coords, dtype=np.float64).reshape(-1, 2)
+
+    # --- lines
+    a = np.array([s for s, _ in segments], dtype=np.intp)
+    b = a + 1
+    lines = [d.line for _, d in segments]
+    weights = np.array([ln.weight for ln in lines], dtype=np.float64)
+    colors = [ln.color for ln in lines]
+    alphas = [ln.alpha for ln in lines]
+
+    back_pairs = np.concatenate(
+        [
+            np.stack([v + a, v + b], axis=1),  # back edge
+            np.stack([a, v + a], axis=1),  # start connector
+            np.stack([b, v + b], axis=1),  # end connector
+        ]
+    ).reshape(-1, 2)
+    side_widths = weights * SIDE_LINE_WEIGHT
+    back_widths = np.concatenate([weights * BACK_LINE_WEIGHT, side_widths, side_widths])
+    side_styles = STYLES.intern_many(colors, [x * SIDE_LINE_ALPHA for x in alphas])
+    back_styles = np.concatenate(
+        [
+            STYLES.intern_many(colors, [x * BACK_LINE_ALPHA for x in alphas]),
+            side_styles,
+            side_styles,
+        ]
+    )
+
+    # --- fills
+    fill_ranges = [(s, s + len(d.points)) for s, d in fills]
+    faces = [d.color for _, d in fills]
+    edges = [d.edgecolor or d.color for _, d in fills]
+    fill_alphas = [d.alpha for _, d in fills]
+
+    quads: list[tuple[int, int, int, int]] = []
+    quad_fill: list[int] = []
+    order: list[int] = []
+    f = len(fill_ranges)
+    for index, (s, e) in enumerate(fill_ranges):
+        order.append(index)
+        n = e - s
+        for i in range(n):
+            p1, p2 = s + i, s + (i + 1) % n
+            order.append(f + len(quads))
+            quads.append((p1, p2, v + p2, v + p1))
+            quad_fill.append(index)
+    owners = np.array(quad_fill, dtype=np.intp)
+    back_order = np.array(order, dtype=np.intp)
+
+    def _fill_styles(colors: list[str], factor: float) -> np.ndarray:
+        return STYLES.intern_many(colors, [x * factor for x in fill_alphas])
+
+    def _back_styles(colors: list[str]) -> np.ndarray:
+        """Back face styles followed by side wall styles, in `back_order`."""
+        sides = _fill_styles(colors, SIDE_FILL_ALPHA)
+        styles = np.concatenate([_fill_styles(colors, BACK_FILL_ALPHA), sides[owners]])
+        return styles[back_order]
+
+    return ExtrusionTopology(
+        local=local,
+        offsets=np.array(offsets, dtype=np.intp),
+        back_pairs=back_pairs,
+        back_widths=back_widths,
+        back_styles=back_styles,
+        front_pairs=np.stack([a, b], axis=1).reshape(-1, 2),
+        front_widths=weights,
+        front_styles=STYLES.intern_many(colors, alphas),
+        fill_ranges=fill_ranges,
+        front_faces=_fill_styles(faces, 1.0),
+        front_edges=_fill_styles(edges, 1.0),
+        quads=np.array(quads, dtype=np.intp).reshape(-1, 4),
+        back_order=back_order,
+        back_order_faces=_back_styles(faces),
+        back_order_edges=_back_styles(edges),
+    )
+
+
+# Keyed by id(); the frame is kept alive next to its topology
+_TOPOLOGIES: OrderedDict[int, tuple[Frame, ExtrusionTopology]] = OrderedDict()
+
+
+def extrusion_topology(frame: Frame) -> ExtrusionTopology:
+    """Cached topology for `frame`; meant for long-lived asset frames."""
+    key = id(frame)
+    cached = _TOPOLOGIES.get(key)
+    if cached is not None:
+        _TOPOLOGIES.move_to_end(key)
+        return cached[1]
+    topology = _build(frame)
+    _TOPOLOGIES[key] = (frame, topology)
+    if len(_TOPOLOGIES) > _CACHE_SIZE:
+        _TOPOLOGIES.popitem(last=False)
+    return topology
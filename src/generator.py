@@ -0,0 +1,274 @@
+"""
+Procedural scenario generator for scale testing.
+
+Emits valid `ScenarioModel` files of any size: `rides_per_type` rides of
+every registered ride type, laid out on a grid or scattered (seeded) over
+non-overlapping slots, plus guests placed on open ground and rules tuned
+for heavy load. `PRESETS` aim at one engine stage each.
+
+    python -m src.generator culling -o examples/culling.jsonl
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import random
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Literal
+
+import click
+import numpy as np
+
+from .animation import Point
+from .assets.rides import RideSpec, get_ride_type, ride_type_names
+from .loader import JSON_LINES_SUFFIXES
+from .scenario import (
+    GuestModel,
+    MapPositionModel,
+    RideModel,
+    RulesModel,
+    ScenarioModel,
+)
+from .topdown import footprint
+
+type Layout = Literal["grid", "random"]
+
+
+@dataclass(frozen=True, slots=True)
+class GeneratorPreset:
+    description: str
+    rides_per_type: int
+    layout: Layout = "grid"
+    spacing: float = 10.0  # m of open ground between neighbouring footprints
+    guests: int = 0
+    max_guests: int = 10_000
+    spawn_rate: float = 0.1  # s between arrivals
+    target_fps: int = 60
+    max_capacity: int = 40
+    ride_time: float = 90.0
+
+
+PRESETS: dict[str, GeneratorPreset] = {
+    "culling": GeneratorPreset(
+        "Hundreds of rides spread far apart; nearly all are off-screen.",
+        rides_per_type=200,
+        spacing=60.0,
+    ),
+    "depth": GeneratorPreset(
+        "Tightly packed rides and guests scattered at many depths to sort.",
+        rides_per_type=150,
+        layout="random",
+        spacing=1.0,
+        guests=5_000,
+    ),
+    "projection": GeneratorPreset(
+        "A dense grid of rides close together, so most are in view at once.",
+        rides_per_type=100,
+        spacing=2.0,
+    ),
+    "spawning": GeneratorPreset(
+        "A handful of rides with a huge crowd and arrivals every few ms.",
+        rides_per_type=4,
+        guests=20_000,
+        max_guests=100_000,
+        spawn_rate=0.005,
+    ),
+    "stress": GeneratorPreset(
+        "Everything at once: many rides, a random layout and a big crowd.",
+        rides_per_type=500,
+        layout="random",
+        spacing=5.0,
+        guests=50_000,
+        max_guests=200_000,
+        spawn_rate=0.005,
+    ),
+}
+
+
+def _footprint_sizes(types: list[str]) -> dict[str, tuple[float, float]]:
+    """(width, depth) on the ground of each ride type."""
+    sizes = {}
+    for name in types:
+        xmin, xmax, ymin, ymax = footprint(
+            get_ride_type(name).create(RideSpec(Point(0.0, 0.0)))
+        )
+        sizes[name] = (xmax - xmin, ymax - ymin)
+    return sizes
+
+
+def _slots(count: int, layout: Layout, rng: random.Random) -> list[tuple[int, int]]:
+    """(column, row) slots for `count` rides; random picks from twice the area."""
+    if layout == "grid":
+        cols = max(1, math.ceil(math.sqrt(count)))
+        return [(i % cols, i // cols) for i in range(count)]
+    cols = max(1, math.ceil(math.sqrt(2 * count)))
+    cells = rng.sample(range(cols * cols), count)
+    return [(c % cols, c // cols) for c in cells]
+
+
+def generate_scenario(
+    rides_per_type: int,
+    layout: Layout = "grid",
+    seed: int = 0,
+    spacing: float = 10.0,
+    guests: int = 0,
+    name: str | None = None,
+    max_guests: int = 10_000,
+    spawn_rate: float = 0.1,
+    target_fps: int = 60,
+    max_capacity: int = 40,
+    ride_time: float = 90.0,
+) -> ScenarioModel:
+    """A park with `rides_per_type` of every registered ride type."""
+    if rides_per_type < 0 or guests < 0:
+        raise ValueError("rides_per_type and guests must not be negative")
+    rng = random.Random(seed)
+    types = list(ride_type_names())
+    sizes = _footprint_sizes(types)
+    cell_w = max(w for w, _ in sizes.values()) + spacing
+    cell_d = max(d for _, d in sizes.values()) + spacing
+
+    # Interleave the types so each region of the park has a mix of them
+    kinds = [t for _ in range(rides_per_type) for t in types]
+    rides = []
+    for kind, (col, row) in zip(kinds, _slots(len(kinds), layout, rng)):
+        width, depth = sizes[kind]
+        x, y = col * cell_w, row * cell_d
+        if layout == "random":  # jitter inside the slot's spare room
+            x += rng.uniform(0.0, cell_w - width - spacing / 2)
+            y += rng.uniform(0.0, cell_d - depth - spacing / 2)
+        rides.append(
+            RideModel(
+                type=kind,
+                position=MapPositionModel(x=round(x, 3), y=round(y, 3)),
+                max_capacity=max_capacity,
+                ride_time=ride_time,
+            )
+        )
+
+    return ScenarioModel(
+        name=name or f"Generated {len(rides)} rides ({layout}, seed {seed})",
+        background="Day",
+        rules=RulesModel(
+            max_guests=max_guests, spawn_rate=spawn_rate, target_fps=target_fps
+        ),
+        rides=rides,
+        guests=_place_guests(rides, sizes, guests, seed),
+    )
+
+
+def _place_guests(
+    rides: list[RideModel],
+    sizes: dict[str, tuple[float, float]],
+    count: int,
+    seed: int,
+) -> list[GuestModel]:
+    """`count` guests at seeded random spots in the park, off every footprint."""
+    if not count:
+        return []
+    boxes = np.array(
+        [
+            (r.position.x, r.position.x + sizes[r.type][0])
+            + (r.position.y, r.position.y + sizes[r.type][1])
+            for r in rides
+        ]
+    ).reshape(-1, 4)
+    if len(boxes):
+        xmin, ymin = boxes[:, 0].min(), boxes[:, 2].min()
+        xmax, ymax = boxes[:, 1].max(), boxes[:, 3].max()
+    else:
+        xmin, ymin, xmax, ymax = 0.0, 0.0, 50.0, 50.0
+
+    rng = np.random.default_rng(seed)
+    placed = np.empty((0, 2))
+    for _ in range(100):  # rejection sampling; open ground is rarely scarce
+        need = count - len(placed)
+        if need <= 0:
+            break
+        points = rng.uniform((xmin, ymin), (xmax, ymax), size=(2 * need, 2))
+        blocked = np.zeros(len(points), dtype=bool)
+        for box in boxes:
+            blocked |= (
+                (points[:, 0] >= box[0])
+                & (points[:, 0] < box[1])
+                & (points[:, 1] >= box[2])
+                & (points[:, 1] < box[3])
+            )
+        placed = np.concatenate([placed, points[~blocked][:need]])
+    return [
+        GuestModel(position=MapPositionModel(x=round(x, 3), y=round(y, 3)))
+        for x, y in placed
+    ]
+
+
+def write_scenario(model: ScenarioModel, path: str | Path) -> None:
+    """Write a scenario as JSON Lines (streamed loader layout) or plain JSON."""
+    path = Path(path)
+    if path.suffix.lower() not in JSON_LINES_SUFFIXES:
+        path.write_text(model.model_dump_json(indent=2), encoding="utf-8")
+        return
+    header = model.model_dump(
+        mode="json", exclude={"rides", "guests"}, exclude_none=True
+    )
+    with path.open("w", encoding="utf-8") as out:
+        out.write(json.dumps(header) + "\n")
+        for record in (*model.rides, *model.guests):
+            out.write(record.model_dump_json() + "\n")
+
+
+@click.command()
+@click.argument("preset", type=click.Choice(sorted(PRESETS)))
+@click.option(
+    "-o",
+    "--output",
+    type=click.Path(dir_okay=False, writable=True, path_type=str),
+    required=True,
+    help="Scenario file to write (.json, or .jsonl for large layouts).",
+)
+@click.option("--seed", type=int, default=0, show_default=True)
+@click.option("--rides-per-type", type=click.IntRange(min=0), help="Override.")
+@click.option("--guests", type=click.IntRange(min=0), help="Override.")
+@click.option("--layout", type=click.Choice(["grid", "random"]), help="Override.")
+def main(
+    preset: str,
+    output: str,
+    seed: int,
+    rides_per_type: int | None,
+    guests: int | None,
+    layout: Layout | None,
+) -> None:
+    """Write a generated scenario from a PRESET."""
+    chosen = PRESETS[preset]
+    overrides = {
+        key: value
+        for key, value in (
+            ("rides_per_type", rides_per_type),
+            ("guests", guests),
+            ("layout", layout),
+        )
+        if value is not None
+    }
+    chosen = replace(chosen, **overrides)
+    model = generate_scenario(
+        chosen.rides_per_type,
+        chosen.layout,
+        seed,
+        chosen.spacing,
+        chosen.guests,
+        name=f"{preset} preset (seed {seed})",
+        max_guests=chosen.max_guests,
+        spawn_rate=chosen.spawn_rate,
+        target_fps=chosen.target_fps,
+        max_capacity=chosen.max_capacity,
+        ride_time=chosen.ride_time,
+    )
+    write_scenario(model, output)
+    click.echo(
+        f"Wrote {len(model.rides)} rides and {len(model.guests)} guests to {output}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,285 @@
+"""
+Streaming scenario loader.
+
+Large park layouts are read record by record instead of through a single
+``json.load``. Two layouts are understood:
+
+* JSON Lines (``.jsonl`` / ``.ndjson``): the first line holds the scenario
+  header (``name``, ``background``, ``rules``), every following line is one
+  ride or one guest (``"type": "Guest"``).
+* Plain scenario JSON (any other suffix): the usual ``ScenarioModel`` file,
+  read in fixed-size chunks so ``rides``/``guests`` entries are decoded and
+  validated one at a time.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, Any, Iterator, Literal
+
+from pydantic import ValidationError
+
+from .scenario import GUEST_TYPE, GuestModel, RideModel, Scenario, ScenarioModel
+
+JSON_LINES_SUFFIXES = (".jsonl", ".ndjson")
+DEFAULT_CHUNK_SIZE = 1 << 16
+MAX_REPORTED_ERRORS = 50
+
+# A buffer ending in one of these may have been cut mid-token
+_LITERALS = ("true", "false", "null", "NaN", "Infinity", "-Infinity")
+_NUMBER_TAIL = re.compile(r"[0-9.eE+-]*")
+
+type RecordKind = Literal["header", "ride", "guest"]
+type Record = tuple[RecordKind, str, Any]  # (kind, location, raw payload)
+
+_STREAMED_KEYS: dict[str, RecordKind] = {"rides": "ride", "guests": "guest"}
+
+
+class ScenarioLoadError(ValueError):
+    """Raised when a scenario file cannot be parsed or fails validation."""
+
+
+@dataclass(slots=True)
+class ValidationReport:
+    name: str | None = None
+    rides: int = 0
+    guests: int = 0
+    error_count: int = 0
+    errors: list[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return self.error_count == 0
+
+    def add_error(self, message: str) -> None:
+        self.error_count += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append(message)
+
+
+# ---------- Record sources ---------- #
+class _ChunkedJSONReader:
+    """Reads one JSON document in chunks, decoding single values on demand."""
+
+    def __init__(self, f: IO[str], chunk_size: int) -> None:
+        self._f = f
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._buf = ""
+        self._pos = 0
+        self._offset = 0  # characters dropped from the front of the buffer
+        self._eof = False
+
+    def _fill(self) -> bool:
+        if self._eof:
+            return False
+        chunk = self._f.read(self._chunk_size)
+        if not chunk:
+            self._eof = True
+            return False
+        self._offset += self._pos
+        self._buf = self._buf[self._pos :] + chunk
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Next non-whitespace character, or "" at end of input."""
+        while True:
+            buf, n = self._buf, len(self._buf)
+            while self._pos < n and buf[self._pos] in " \t\r\n":
+                self._pos += 1
+            if self._pos < n:
+                return buf[self._pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, token: str) -> None:
+        found = self.peek()
+        if found != token:
+            raise ScenarioLoadError(
+                f"Invalid scenario JSON: expected {token!r}, found {found or 'EOF'!r}"
+            )
+        self._pos += 1
+
+    def value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                obj, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError as exc:
+                # Only a value cut off by the end of the buffer is worth another
+                # chunk; anything else is malformed and would stay malformed
+                if self._truncated(exc) and self._fill():
+                    continue
+                raise ScenarioLoadError(
+                    f"Invalid scenario JSON at offset {self._offset + exc.pos}: "
+                    f"{exc.msg}"
+                ) from exc
+            # A number touching the buffer edge may continue in the next chunk
+            if self._cut(end) and self._fill():
+                continue
+            self._pos = end
+            return obj
+
+    def _truncated(self, exc: json.JSONDecodeError) -> bool:
+        """Whether decoding failed because the buffer ended mid-value."""
+        if exc.msg.startswith("Unterminated string"):
+            return True
+        if "escape" in exc.msg:  # \uXXXX or a surrogate pair cut short
+            return len(self._buf) - exc.pos <= 12
+        return self._cut(exc.pos)
+
+    def _cut(self, pos: int) -> bool:
+        """Whether the buffer from `pos` on could be the start of a split token."""
+        rest = self._buf[pos:]
+        return _NUMBER_TAIL.fullmatch(rest) is not None or any(
+            literal.startswith(rest) for literal in _LITERALS
+        )
+
+    def next_item(self, close: str) -> bool:
+        """Consume the separator after a member; False once `close` is reached."""
+        token = self.peek()
+        if token == ",":
+            self._pos += 1
+            return True
+        if token != close:
+            self.expect(close)
+        return False
+
+
+def _iter_json_records(f: IO[str], chunk_size: int) -> Iterator[Record]:
+    reader = _ChunkedJSONReader(f, chunk_size)
+    header: dict[str, Any] = {}
+
+    reader.expect("{")
+    more = reader.peek() != "}"
+    while more:
+        key = reader.value()
+        if not isinstance(key, str):
+            raise ScenarioLoadError(
+                "Invalid scenario JSON: object keys must be strings"
+            )
+        reader.expect(":")
+
+        kind = _STREAMED_KEYS.get(key)
+        if kind is None:
+            header[key] = reader.value()
+        else:
+            reader.expect("[")
+            index = 0
+            has_items = reader.peek() != "]"
+            while has_items:
+                yield kind, f"{key}[{index}]", reader.value()
+                index += 1
+                has_items = reader.next_item("]")
+            reader.expect("]")
+        more = reader.next_item("}")
+    reader.expect("}")
+
+    yield "header", "header", header
+
+
+def _iter_json_lines_records(f: IO[str]) -> Iterator[Record]:
+    seen_header = False
+    for lineno, line in enumerate(f, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        location = f"line {lineno}"
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as exc:
+            raise ScenarioLoadError(f"{location}: invalid JSON ({exc.msg})") from exc
+
+        if not seen_header:
+            seen_header = True
+            yield "header", location, record
+        elif isinstance(record, dict) and record.get("type") == GUEST_TYPE:
+            yield "guest", location, record
+        else:
+            yield "ride", location, record
+
+    if not seen_header:
+        raise ScenarioLoadError("Scenario file is empty")
+
+
+def iter_records(
+    path: str | Path, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[Record]:
+    """Yield raw (kind, location, payload) records from a scenario file."""
+    path = Path(path)
+    with path.open("r") as f:
+        if path.suffix.lower() in JSON_LINES_SUFFIXES:
+            yield from _iter_json_lines_records(f)
+        else:
+            yield from _iter_json_records(f, chunk_size)
+
+
+# ---------- Validation / build ---------- #
+def _validate_header(payload: Any) -> ScenarioModel:
+    if not isinstance(payload, dict):
+        raise ScenarioLoadError("Scenario header must be a JSON object")
+    fields = {k: v for k, v in payload.items() if k not in _STREAMED_KEYS}
+    return ScenarioModel.model_validate(fields)
+
+
+def _format_validation_error(location: str, exc: ValidationError) -> list[str]:
+    messages = []
+    for err in exc.errors():
+        field_path = ".".join(str(part) for part in err["loc"])
+        suffix = f".{field_path}" if field_path else ""
+        messages.append(f"{location}{suffix}: {err['msg']}")
+    return messages
+
+
+def validate_scenario(
+    path: str | Path, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> ValidationReport:
+    """Validate every record without building any entities."""
+    report = ValidationReport()
+    try:
+        for kind, location, payload in iter_records(path, chunk_size):
+            try:
+                if kind == "header":
+                    report.name = _validate_header(payload).name
+                elif kind == "ride":
+                    RideModel.model_validate(payload)
+                    report.rides += 1
+                else:
+                    GuestModel.model_validate(payload)
+                    report.guests += 1
+            except ValidationError as exc:
+                for message in _format_validation_error(location, exc):
+                    report.add_error(message)
+    except ScenarioLoadError as exc:
+        report.add_error(str(exc))
+    return report
+
+
+def load_scenario(path: str | Path, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Scenario:
+    """Stream, validate and build a scenario; rides are built per type in bulk."""
+    header: ScenarioModel | None = None
+    rides: list[RideModel] = []
+    guests: list[GuestModel] = []
+
+    for kind, location, payload in iter_records(path, chunk_size):
+        try:
+            if kind == "header":
+                header = _validate_header(payload)
+            elif kind == "ride":
+                rides.append(RideModel.model_validate(payload))
+            else:
+                guests.append(GuestModel.model_validate(payload))
+        except ValidationError as exc:
+            messages = _format_validation_error(location, exc)
+            raise ScenarioLoadError("; ".join(messages)) from exc
+
+    if header is None:
+        raise ScenarioLoadError("Scenario header is missing")
+
+    # Records are already validated; skip a second pass over the full lists
+    model = header.model_copy(update={"rides": rides, "guests": guests})
+    return model.build()
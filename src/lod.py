@@ -0,0 +1,187 @@
+"""
+Level-of-detail geometry.
+
+Simplified versions of asset frames are derived once and cached:
+
+* ``LOD_FULL``      - the original frame
+* ``LOD_REDUCED``   - polylines and polygons decimated (Ramer-Douglas-Peucker)
+* ``LOD_COARSE``    - heavier decimation; fills of one style merged into a hull
+* ``LOD_BILLBOARD`` - a single box over the entity bounds
+
+`select_lod` picks a level from the projected screen size of an entity.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING
+
+from .animation import Animation, Fill, Frame, Line, Point, Segment
+
+if TYPE_CHECKING:
+    from .entity import Bounds
+
+LOD_FULL = 0
+LOD_REDUCED = 1
+LOD_COARSE = 2
+LOD_BILLBOARD = 3
+
+# Decimation tolerance per level, in normalised asset units
+_TOLERANCES = {LOD_REDUCED: 0.01, LOD_COARSE: 0.035}
+
+# Minimum projected size (viewport units, 0..1) needed to use each level
+LOD_THRESHOLDS = {LOD_FULL: 0.12, LOD_REDUCED: 0.04, LOD_COARSE: 0.012}
+
+# Thresholds are scaled by this while the camera moves, trading detail for speed
+MOVING_LOD_BIAS = 1.75
+
+
+def select_lod(screen_size: float, moving: bool = False, bias: float = 1.0) -> int:
+    """Pick the most detailed level whose threshold `screen_size` reaches."""
+    scale = bias * (MOVING_LOD_BIAS if moving else 1.0)
+    for level in (LOD_FULL, LOD_REDUCED, LOD_COARSE):
+        if screen_size >= LOD_THRESHOLDS[level] * scale:
+            return level
+    return LOD_BILLBOARD
+
+
+# ---------- Geometry helpers ---------- #
+def _point_line_distance(p: Point, a: Point, b: Point) -> float:
+    dx, dy = b.x - a.x, b.y - a.y
+    length = math.hypot(dx, dy)
+    if length == 0.0:
+        return math.hypot(p.x - a.x, p.y - a.y)
+    return abs(dy * p.x - dx * p.y + b.x * a.y - b.y * a.x) / length
+
+
+def _decimate(points: list[Point], tolerance: float) -> list[Point]:
+    """Iterative Ramer-Douglas-Peucker; always keeps both end points."""
+    if len(points) < 3:
+        return list(points)
+    keep = [False] * len(points)
+    keep[0] = keep[-1] = True
+    stack = [(0, len(points) - 1)]
+    while stack:
+        first, last = stack.pop()
+        worst, worst_dist = -1, tolerance
+        for i in range(first + 1, last):
+            d = _point_line_distance(points[i], points[first], points[last])
+            if d > worst_dist:
+                worst, worst_dist = i, d
+        if worst >= 0:
+            keep[worst] = True
+            stack.append((first, worst))
+            stack.append((worst, last))
+    return [p for p, k in zip(points, keep) if k]
+
+
+def _convex_hull(points: list[Point]) -> list[Point]:
+    pts = sorted({(p.x, p.y) for p in points})
+    if len(pts) < 3:
+        return [Point(x, y) for x, y in pts]
+
+    def cross(o, a, b) -> float:
+        return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
+
+    lower: list[tuple[float, float]] = []
+    for p in pts:
+        while len(lower) >= 2 and cross(lower[-2], lower[-1], p) <= 0:
+            lower.pop()
+        lower.append(p)
+    upper: list[tuple[float, float]] = []
+    for p in reversed(pts):
+        while len(upper) >= 2 and cross(upper[-2], upper[-1], p) <= 0:
+            upper.pop()
+        upper.append(p)
+    return [Point(x, y) for x, y in lower[:-1] + upper[:-1]]
+
+
+def _polylines(segments: list[Segment]) -> list[tuple[list[Point], Line]]:
+    """Chain consecutive connected segments that share a line style."""
+    chains: list[tuple[list[Point], Line]] = []
+    for seg in segments:
+        if chains:
+            pts, line = chains[-1]
+            if line == seg.line and pts[-1] == seg.start:
+                pts.append(seg.end)
+                continue
+        chains.append(([seg.start, seg.end], seg.line))
+    return chains
+
+
+def _simplify(frame: Frame, level: int) -> Frame:
+    tolerance = _TOLERANCES[level]
+    segments = [d for d in frame if isinstance(d, Segment)]
+    fills = [d for d in frame if isinstance(d, Fill)]
+
+    out: Frame = []
+    if level >= LOD_COARSE:
+        # Merge fills sharing a style into one hull
+        groups: dict[tuple, list[Fill]] = {}
+        for f in fills:
+            groups.setdefault((f.color, f.alpha, f.edgecolor), []).append(f)
+        for (color, alpha, edgecolor), group in groups.items():
+            pts = [p for f in group for p in f.points]
+            hull = _convex_hull(pts) if len(group) > 1 else group[0].points
+            hull = _decimate(hull + hull[:1], tolerance)[:-1] or hull
+            if len(hull) >= 3:
+                out.append(Fill(hull, color, alpha, edgecolor))
+    else:
+        for f in fills:
+            pts = _decimate(f.points + f.points[:1], tolerance)[:-1]
+            out.append(
+                Fill(pts if len(pts) >= 3 else f.points, f.color, f.alpha, f.edgecolor)
+            )
+
+    for pts, line in _polylines(segments):
+        pts = _decimate(pts, tolerance)
+        out.extend(Segment(a, b, line) for a, b in zip(pts, pts[1:]))
+    return out
+
+
+# ---------- Caches ---------- #
+# Keyed by id(); the source object is kept alive next to its derived geometry
+_SIMPLIFIED: dict[tuple[int, int], tuple[Frame, Frame]] = {}
+_BILLBOARDS: dict[int, tuple[Animation, Frame]] = {}
+
+
+def simplify_frame(frame: Frame, level: int) -> Frame:
+    """
+    Return `frame` at the given level of detail. Results are cached by
+    identity, so only pass long-lived asset frames, not per-tick copies.
+    """
+    if level <= LOD_FULL:
+        return frame
+    key = (id(frame), level)
+    cached = _SIMPLIFIED.get(key)
+    if cached is None:
+        cached = (frame, _simplify(frame, level))
+        _SIMPLIFIED[key] = cached
+    return cached[1]
+
+
+def billboard_frame(animation: Animation, bounds: Bounds) -> Frame:
+    """One box over `bounds`, coloured like the first drawable of the asset."""
+    cached = _BILLBOARDS.get(id(animation))
+    if cached is None:
+        color = "gray"
+        for fr in animation.frames:
+            for d in fr:
+                color = d.color if isinstance(d, Fill) else d.line.color
+                break
+            else:
+                continue
+            break
+        box = Fill(
+            [
+                Point(bounds.min_x, bounds.min_y),
+                Point(bounds.max_x, bounds.min_y),
+                Point(bounds.max_x, bounds.max_y),
+                Point(bounds.min_x, bounds.max_y),
+            ],
+            color,
+            edgecolor=None,
+        )
+        cached = (animation, [box])
+        _BILLBOARDS[id(animation)] = cached
+    return cached[1]
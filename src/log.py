@@ -0,0 +1,159 @@
+"""
+Structured, rate-limited logging.
+
+Modules log through the standard `logging` package under the ``src``
+logger and attach key/value fields with `event`. `configure_logging`
+routes records through a queue to a listener thread, so formatting and
+terminal I/O never run on the simulation or render loop. A
+`RateLimitFilter` drops repeats of the same message inside a window and
+reports how many it dropped, and `EventCounter` folds high-churn events
+(spawns, despawns) into one periodic summary line.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import logging
+import logging.handlers
+import queue
+import sys
+import time
+from collections import Counter
+from typing import Any
+
+ROOT_LOGGER = "src"
+
+_listener: logging.handlers.QueueListener | None = None
+
+
+def event(logger: logging.Logger, message: str, level: int = logging.INFO, **fields):
+    """Log `message` with structured `fields`; free when the level is disabled."""
+    if logger.isEnabledFor(level):
+        logger.log(level, message, extra={"fields": fields}, stacklevel=2)
+
+
+class RateLimitFilter(logging.Filter):
+    """Passes each distinct message at most once per `interval` seconds."""
+
+    def __init__(self, interval: float = 1.0) -> None:
+        super().__init__()
+        self.interval = interval
+        self._last: dict[tuple[str, str], float] = {}
+        self._dropped: Counter[tuple[str, str]] = Counter()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if getattr(record, "summary", False):
+            return True  # aggregates carry counts that must not be lost
+        key = (record.name, str(record.msg))
+        now = record.created
+        if now - self._last.get(key, -self.interval) < self.interval:
+            self._dropped[key] += 1
+            return False
+        self._last[key] = now
+        dropped = self._dropped.pop(key, 0)
+        if dropped:
+            record.fields = {**getattr(record, "fields", {}), "suppressed": dropped}
+        return True
+
+
+class StructuredFormatter(logging.Formatter):
+    """``time level logger message key=value ...``, or one JSON object per line."""
+
+    def __init__(self, as_json: bool = False) -> None:
+        super().__init__()
+        self.as_json = as_json
+
+    def format(self, record: logging.LogRecord) -> str:
+        fields: dict[str, Any] = getattr(record, "fields", {})
+        if self.as_json:
+            return json.dumps(
+                {
+                    "time": record.created,
+                    "level": record.levelname,
+                    "logger": record.name,
+                    "message": record.getMessage(),
+                    **fields,
+                },
+                default=str,
+            )
+        stamp = time.strftime("%H:%M:%S", time.localtime(record.created))
+        pairs = " ".join(f"{k}={_format_value(v)}" for k, v in fields.items())
+        line = f"{stamp} {record.levelname:<7} {record.name} {record.getMessage()}"
+        return f"{line} {pairs}" if pairs else line
+
+
+def _format_value(value: Any) -> str:
+    return f"{value:.3g}" if isinstance(value, float) else str(value)
+
+
+class EventCounter:
+    """Counts named events and logs their totals once per `interval` seconds."""
+
+    def __init__(
+        self, logger: logging.Logger, message: str, interval: float = 5.0
+    ) -> None:
+        self.logger = logger
+        self.message = message
+        self.interval = interval
+        self.totals: Counter[str] = Counter()
+        self._pending: Counter[str] = Counter()
+        self._next_flush = time.monotonic() + interval
+
+    def add(self, name: str, count: int = 1) -> None:
+        self._pending[name] += count
+        self.totals[name] += count
+
+    def maybe_flush(self) -> None:
+        now = time.monotonic()
+        if now >= self._next_flush:
+            self._next_flush = now + self.interval
+            self.flush()
+
+    def flush(self) -> None:
+        if self._pending and self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(
+                self.message, extra={"fields": dict(self._pending), "summary": True}
+            )
+        self._pending.clear()
+
+
+def configure_logging(
+    level: int | str = logging.INFO,
+    as_json: bool = False,
+    rate_limit: float = 1.0,
+    stream=None,
+) -> logging.handlers.QueueListener:
+    """
+    Send ``src`` logs through a queue to a background listener that writes
+    to `stream` (stderr by default). The listener is stopped, and the queue
+    drained, by `shutdown_logging` or at interpreter exit.
+    """
+    global _listener
+    shutdown_logging()
+    root = logging.getLogger(ROOT_LOGGER)
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.setLevel(level)
+    root.propagate = False
+
+    records: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    handler = logging.handlers.QueueHandler(records)
+    if rate_limit > 0:
+        handler.addFilter(RateLimitFilter(rate_limit))
+    root.addHandler(handler)
+
+    sink = logging.StreamHandler(sys.stderr if stream is None else stream)
+    sink.setFormatter(StructuredFormatter(as_json))
+    _listener = logging.handlers.QueueListener(records, sink)
+    _listener.start()
+    return _listener
+
+
+@atexit.register
+def shutdown_logging() -> None:
+    """Write out queued records and stop the listener thread."""
+    global _listener
+    if _listener is not None:
+        listener, _listener = _listener, None
+        listener.stop()
@@ -0,0 +1,136 @@
+"""
+Live metrics over local HTTP.
+
+The engine publishes a `MetricsSnapshot` into a `MetricsBuffer` a few times
+a second; `MetricsServer` serves the latest one from its own threads, as
+JSON at ``/metrics`` or as a Server-Sent Events stream at ``/stream``.
+The buffer is a `DoubleBuffer`, so requests never take a lock the
+simulation or render loop could wait on.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from dataclasses import asdict, dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from .snapshot import DoubleBuffer
+
+DEFAULT_PORT = 8765
+
+
+@dataclass(frozen=True, slots=True)
+class RideMetrics:
+    name: str
+    state: str
+    queue: int
+    capacity: int
+
+
+@dataclass(frozen=True, slots=True)
+class MetricsSnapshot:
+    seq: int
+    wall_time: float  # s since the epoch
+    sim_time: float
+    frame: int
+    fps: float
+    frame_ms: float
+    quality: int
+    time_scale: float
+    entities: int
+    guests: int
+    step_ms: float
+    rides: tuple[RideMetrics, ...]
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self))
+
+
+class MetricsBuffer(DoubleBuffer[MetricsSnapshot]):
+    """Double buffer of metrics snapshots; readers never lock."""
+
+    def publish(self, **values) -> MetricsSnapshot:
+        return self._publish(
+            lambda seq: MetricsSnapshot(seq=seq, wall_time=time.time(), **values)
+        )
+
+
+class MetricsServer:
+    """Threaded HTTP server for a `MetricsBuffer`, bound to localhost by default."""
+
+    def __init__(
+        self,
+        buffer: MetricsBuffer,
+        port: int = DEFAULT_PORT,
+        host: str = "127.0.0.1",
+        stream_interval: float = 0.5,
+    ) -> None:
+        self.buffer = buffer
+        self.stream_interval = stream_interval
+        self._stopped = threading.Event()
+        self._httpd = ThreadingHTTPServer((host, port), _handler(self))
+        self._httpd.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def address(self) -> tuple[str, int]:
+        host, port = self._httpd.server_address[:2]
+        return str(host), int(port)
+
+    def start(self) -> MetricsServer:
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, name="metrics-server", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+
+def _handler(server: MetricsServer) -> type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            if self.path == "/metrics":
+                self._send_latest()
+            elif self.path == "/stream":
+                self._stream()
+            else:
+                self.send_error(404, "Try /metrics or /stream")
+
+        def _send_latest(self) -> None:
+            snapshot = server.buffer.latest()
+            body = (snapshot.to_json() if snapshot else "{}").encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _stream(self) -> None:
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Cache-Control", "no-cache")
+            self.end_headers()
+            sent = 0
+            while not server._stopped.is_set():
+                snapshot = server.buffer.latest()
+                if snapshot is not None and snapshot.seq != sent:
+                    try:
+                        self.wfile.write(f"data: {snapshot.to_json()}\n\n".encode())
+                        self.wfile.flush()
+                    except OSError:
+                        return  # client went away
+                    sent = snapshot.seq
+                server._stopped.wait(server.stream_interval)
+
+        def log_message(self, format: str, *args) -> None:
+            pass  # keep request lines out of the console
+
+    return Handler
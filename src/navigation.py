@@ -0,0 +1,302 @@
+"""
+Guest navigation on a walkable grid.
+
+Ride footprints block cells of a `WalkableGrid`. For every ride entrance a
+`FlowField` is computed once by a breadth-first wavefront over the free
+cells (8-connected) and cached; each cell stores the unit direction
+towards its next cell on a shortest path. Guests then steer by one array
+lookup per tick, all at once. The cache is dropped whenever a ride is
+added, removed or moves onto different cells.
+"""
+
+from __future__ import annotations
+
+import random
+from typing import TYPE_CHECKING, Iterable, Sequence
+
+import numpy as np
+
+from .entity import EngineEntity
+from .topdown import footprint
+
+if TYPE_CHECKING:
+    from .assets import PersonBatch
+
+# (d_row, d_col); orthogonal first so ties prefer straight moves
+_OFFSETS = np.array(
+    [(1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (1, -1), (-1, 1), (-1, -1)],
+    dtype=np.intp,
+)
+_DIRECTIONS = _OFFSETS[:, ::-1] / np.hypot(_OFFSETS[:, 0], _OFFSETS[:, 1])[:, None]
+
+
+class WalkableGrid:
+    """Cells over world (x, y); rows follow y, columns follow x."""
+
+    def __init__(
+        self,
+        extent: tuple[float, float, float, float],
+        cell_size: float,
+        blocked: np.ndarray,
+    ) -> None:
+        self.extent = extent
+        self.cell_size = cell_size
+        self.blocked = blocked
+        self.shape = blocked.shape
+        self._origin = np.array([extent[0], extent[2]])
+
+    @classmethod
+    def from_rides(
+        cls, rides: Sequence[EngineEntity], cell_size: float = 1.0, margin: float = 10.0
+    ) -> WalkableGrid:
+        return cls.from_boxes(ride_boxes(rides), cell_size, margin)
+
+    @classmethod
+    def from_boxes(
+        cls, boxes: np.ndarray, cell_size: float = 1.0, margin: float = 10.0
+    ) -> WalkableGrid:
+        """
+        Grid around (N, 4) footprints. Its edges sit on multiples of
+        `cell_size`, so equal `cell_keys` always give the same grid.
+        """
+        if len(boxes):
+            xmin, xmax = boxes[:, 0].min() - margin, boxes[:, 1].max() + margin
+            ymin, ymax = boxes[:, 2].min() - margin, boxes[:, 3].max() + margin
+        else:
+            xmin, xmax, ymin, ymax = -margin, margin, -margin, margin
+        xmin = np.floor(xmin / cell_size) * cell_size
+        ymin = np.floor(ymin / cell_size) * cell_size
+        cols = max(1, int(np.ceil((xmax - xmin) / cell_size)))
+        rows = max(1, int(np.ceil((ymax - ymin) / cell_size)))
+        grid = cls((xmin, xmax, ymin, ymax), cell_size, np.zeros((rows, cols), bool))
+        for box in boxes:
+            (c0, r0), (c1, r1) = grid.cell_range(box)
+            grid.blocked[r0:r1, c0:c1] = True
+        return grid
+
+    @staticmethod
+    def cell_keys(boxes: np.ndarray, cell_size: float) -> np.ndarray:
+        """(N, 4) integer cell spans of footprints; the grid depends on nothing else."""
+        lo = np.floor(boxes[:, [0, 2]] / cell_size)
+        hi = np.ceil(boxes[:, [1, 3]] / cell_size)
+        return np.concatenate([lo, hi], axis=1).astype(np.int64)
+
+    def cells(self, xy: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(row, col) of world points clamped onto the grid, and the inside mask."""
+        ij = np.floor((xy - self._origin) / self.cell_size).astype(np.intp)
+        cols = np.clip(ij[:, 0], 0, self.shape[1] - 1)
+        rows = np.clip(ij[:, 1], 0, self.shape[0] - 1)
+        return rows, cols, (cols == ij[:, 0]) & (rows == ij[:, 1])
+
+    def cell_range(self, box: np.ndarray) -> tuple[tuple[int, int], tuple[int, int]]:
+        """((col0, row0), (col1, row1)) covering an [xmin, xmax, ymin, ymax] box."""
+        lo = np.floor((box[[0, 2]] - self._origin) / self.cell_size).astype(int)
+        hi = np.ceil((box[[1, 3]] - self._origin) / self.cell_size).astype(int)
+        limit = [self.shape[1], self.shape[0]]
+        return tuple(np.clip(lo, 0, limit)), tuple(np.clip(hi, 0, limit))
+
+    def centre(self, rows: np.ndarray, cols: np.ndarray) -> np.ndarray:
+        """World (x, y) of cell centres; scalars give a single point."""
+        return self._origin + (np.stack([cols, rows], axis=-1) + 0.5) * self.cell_size
+
+
+def ride_boxes(rides: Sequence[EngineEntity]) -> np.ndarray:
+    """(N, 4) [xmin, xmax, ymin, ymax] footprints of `rides`."""
+    return np.array([footprint(r) for r in rides], dtype=np.float64).reshape(-1, 4)
+
+
+class FlowField:
+    """Steps-to-target and next-step direction for every cell of a grid."""
+
+    def __init__(self, grid: WalkableGrid, target: tuple[int, int]) -> None:
+        self.grid = grid
+        self.target = target
+        self.target_xy = grid.centre(*target)
+        self.distance = _wavefront(grid.blocked, target)
+        self.directions = _descend(self.distance)
+
+    def steer(self, xy: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Unit directions for world points, and whether each has arrived."""
+        rows, cols, inside = self.grid.cells(xy)
+        distance = np.where(inside, self.distance[rows, cols], -1)
+        directions = self.directions[rows, cols]
+
+        # Off the grid: walk onto its nearest cell first
+        outside = ~inside
+        if outside.any():
+            goal = self.grid.centre(rows[outside], cols[outside])
+            directions[outside] = _unit(goal - xy[outside])
+
+        # Inside a footprint, or cut off: head straight for the entrance
+        lost = inside & (distance < 0)
+        if lost.any():
+            directions[lost] = _unit(self.target_xy - xy[lost])
+        return directions, distance == 0
+
+
+def _unit(vectors: np.ndarray) -> np.ndarray:
+    norm = np.maximum(np.hypot(vectors[:, 0], vectors[:, 1]), 1e-9)
+    return vectors / norm[:, None]
+
+
+def _wavefront(blocked: np.ndarray, target: tuple[int, int]) -> np.ndarray:
+    """
+    BFS steps from `target` over free cells; -1 where unreachable. Diagonal
+    steps need both cells beside them free, so paths never cut a corner.
+    """
+    rows, cols = blocked.shape
+    distance = np.full(blocked.shape, -1, dtype=np.int32)
+    distance[target] = 0
+    frontier = np.array([target], dtype=np.intp)
+    step = 0
+    while len(frontier):
+        step += 1
+        src = np.repeat(frontier, len(_OFFSETS), axis=0)
+        nb = src + np.tile(_OFFSETS, (len(frontier), 1))
+        inside = (
+            (nb[:, 0] >= 0) & (nb[:, 0] < rows) & (nb[:, 1] >= 0) & (nb[:, 1] < cols)
+        )
+        src, nb = src[inside], nb[inside]
+        fresh = (
+            ~blocked[nb[:, 0], nb[:, 1]]
+            & ~blocked[nb[:, 0], src[:, 1]]
+            & ~blocked[src[:, 0], nb[:, 1]]
+            & (distance[nb[:, 0], nb[:, 1]] < 0)
+        )
+        flat = np.unique(nb[fresh, 0] * cols + nb[fresh, 1])
+        frontier = np.stack([flat // cols, flat % cols], axis=1)
+        distance[frontier[:, 0], frontier[:, 1]] = step
+    return distance
+
+
+def _descend(distance: np.ndarray) -> np.ndarray:
+    """(rows, cols, 2) unit (dx, dy) towards the lowest-distance neighbour."""
+    rows, cols = distance.shape
+    cost = np.where(distance < 0, np.inf, distance.astype(np.float64))
+    padded = np.pad(cost, 1, constant_values=np.inf)
+
+    def shifted(dr: int, dc: int) -> np.ndarray:
+        return padded[1 + dr : 1 + dr + rows, 1 + dc : 1 + dc + cols]
+
+    neighbours = np.stack(
+        [
+            np.where(
+                np.isfinite(shifted(dr, 0)) & np.isfinite(shifted(0, dc)),
+                shifted(dr, dc),
+                np.inf,
+            )
+            for dr, dc in _OFFSETS
+        ]
+    )
+    best = np.argmin(neighbours, axis=0)
+    directions = _DIRECTIONS[best]
+    still = (distance <= 0) | ~np.isfinite(neighbours.min(axis=0))
+    directions[still] = 0.0
+    return directions
+
+
+class Navigator:
+    """
+    Flow fields to each ride's entrance. The grid and fields are rebuilt
+    when a ride is added, removed or moves onto different cells.
+    """
+
+    def __init__(self, rides: Sequence[EngineEntity], cell_size: float = 1.0) -> None:
+        self.rides = rides  # the engine's live list; targets index into it
+        self.cell_size = cell_size
+        self._cells: np.ndarray | None = None  # WalkableGrid.cell_keys of the grid
+        self._grid: WalkableGrid | None = None
+        self._fields: dict[int, FlowField] = {}
+
+    @property
+    def grid(self) -> WalkableGrid:
+        # Rides move (a spinning FerrisWheel drifts every tick), so compare the
+        # cells they cover; sub-cell motion leaves the grid unchanged
+        boxes = ride_boxes(self.rides)
+        cells = WalkableGrid.cell_keys(boxes, self.cell_size)
+        if (
+            self._grid is None
+            or self._cells is None
+            or not np.array_equal(cells, self._cells)
+        ):
+            self._grid = WalkableGrid.from_boxes(boxes, self.cell_size)
+            self._cells = cells
+            self._fields.clear()
+        return self._grid
+
+    def invalidate(self) -> None:
+        """Drop the grid and every field; the next use rebuilds them."""
+        self._grid = None
+        self._fields.clear()
+
+    def entrance(self, ride: EngineEntity) -> tuple[int, int]:
+        """Free cell just in front of (below) the ride's footprint."""
+        return self._entrance(ride, self.grid)
+
+    def field(self, target: int) -> FlowField:
+        """Cached flow field to the entrance of `rides[target]`."""
+        return self._field(target, self.grid)
+
+    @staticmethod
+    def _entrance(ride: EngineEntity, grid: WalkableGrid) -> tuple[int, int]:
+        xmin, xmax, ymin, _ = footprint(ride)
+        rows, cols, _ = grid.cells(
+            np.array([[(xmin + xmax) / 2, ymin - grid.cell_size / 2]])
+        )
+        return int(rows[0]), int(cols[0])
+
+    def _field(self, target: int, grid: WalkableGrid) -> FlowField:
+        flow = self._fields.get(target)
+        if flow is None:
+            flow = self._fields[target] = FlowField(
+                grid, self._entrance(self.rides[target], grid)
+            )
+        return flow
+
+    def steer(self, batch: PersonBatch, dt: float) -> None:
+        """
+        Move every walking guest with a target along its field. Arrivals stop
+        (IDLE) and keep their target: they are queueing for that ride.
+        """
+        from .assets import PersonState
+
+        a = batch.arrays
+        target = a["target"]
+        active = (target >= 0) & (
+            a["state"] == batch.code("state", PersonState.WALKING)
+        )
+        if not active.any() or not self.rides:
+            return
+        grid = self.grid  # once per tick; the fields below share it
+        xy = np.stack([a["_x"], a["_y"]], axis=1)
+        step = a["_speed"] * dt
+        for ride in np.unique(target[active]).astype(int):
+            if ride >= len(self.rides):
+                continue
+            mask = active & (target == ride)
+            directions, arrived = self._field(ride, grid).steer(xy[mask])
+            a["_x"][mask] += directions[:, 0] * step[mask]
+            a["_y"][mask] += directions[:, 1] * step[mask]
+
+            a["state"][np.flatnonzero(mask)[arrived]] = batch.code(
+                "state", PersonState.IDLE
+            )
+
+    def queue_lengths(self, batch: PersonBatch) -> np.ndarray:
+        """Guests waiting (arrived and idle) at each ride."""
+        from .assets import PersonState
+
+        a = batch.arrays
+        waiting = (a["target"] >= 0) & (
+            a["state"] == batch.code("state", PersonState.IDLE)
+        )
+        return np.bincount(
+            a["target"][waiting].astype(np.intp), minlength=len(self.rides)
+        )[: len(self.rides)]
+
+    def assign_random(self, guests: Iterable[EngineEntity], rng: random.Random) -> None:
+        """Give each guest a random ride to walk to."""
+        if not self.rides:
+            return
+        for guest in guests:
+            guest.target = float(rng.randrange(len(self.rides)))
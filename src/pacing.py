@@ -0,0 +1,140 @@
+"""
+Adaptive frame pacing.
+
+`FramePacer` keeps a fixed schedule of frame deadlines for a target rate and
+tracks moving averages of frame cost and frame interval. When a frame starts
+behind schedule it asks the loop to skip rendering (the simulation still
+steps), and when the average cost stays over or well under budget it moves
+between `QUALITY_LEVELS`.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from time import perf_counter
+
+
+@dataclass(frozen=True, slots=True)
+class RenderQuality:
+    lod_bias: float  # > 1 switches to coarser LOD levels sooner
+    side_walls: bool  # draw the extruded back plane and side walls
+
+
+# Best first; the pacer steps down this list under load and back up when idle
+QUALITY_LEVELS = (
+    RenderQuality(lod_bias=1.0, side_walls=True),
+    RenderQuality(lod_bias=1.75, side_walls=True),
+    RenderQuality(lod_bias=2.5, side_walls=False),
+    RenderQuality(lod_bias=4.0, side_walls=False),
+)
+
+
+class FramePacer:
+    """Frame scheduler for one render loop; `target_fps <= 0` means unpaced."""
+
+    def __init__(
+        self,
+        target_fps: float,
+        smoothing: float = 0.1,
+        max_skip: int = 2,
+        patience: int = 15,
+        late_slack: float = 0.5,
+    ) -> None:
+        self.target_dt = 1.0 / target_fps if target_fps > 0 else 0.0
+        self.smoothing = smoothing
+        self.max_skip = max_skip  # consecutive frames that may go unrendered
+        self.patience = patience  # frames over/under budget before changing quality
+        self.late_slack = late_slack  # frames a start may slip before it counts as late
+
+        self.quality = 0
+        self.skipped = 0
+        self._rendered = True  # whether the current frame was drawn
+        self._avg_cost = 0.0
+        self._avg_interval = 0.0
+        self._over = 0
+        self._under = 0
+        self._start = perf_counter()
+        self._previous_start: float | None = None
+
+        # `_due` is when the current frame was scheduled to start, `_deadline`
+        # when the next one is (the end of the current frame's budget)
+        self._due = self._start
+        self._deadline = self._due + self.target_dt
+
+    # ---------- Per frame ----------
+    def begin(self) -> None:
+        now = perf_counter()
+        if self._previous_start is not None:
+            self._avg_interval = self._average(
+                self._avg_interval, now - self._previous_start
+            )
+        self._previous_start = self._start = now
+
+    def should_render(self) -> bool:
+        """False when the last frame overran into this one, which may be dropped."""
+        late = self._start > self._due + self.late_slack * self.target_dt
+        if self.target_dt and late:
+            if self.skipped < self.max_skip:
+                self.skipped += 1
+                self._rendered = False
+                return False
+        self.skipped = 0
+        self._rendered = True
+        return True
+
+    def finish(self) -> float:
+        """Record the frame's cost; returns seconds to wait for the next deadline."""
+        now = perf_counter()
+        # Skipped frames cost next to nothing and would hide an overloaded renderer
+        if self._rendered:
+            self._avg_cost = self._average(self._avg_cost, now - self._start)
+        self._rendered = True
+        if not self.target_dt:
+            return 0.0
+        self._adapt()
+
+        wait = max(0.0, self._deadline - now)
+        if now > self._deadline + self.target_dt:
+            # More than a frame behind: drop the backlog instead of racing it
+            self._deadline = now
+        self._due = self._deadline
+        self._deadline += self.target_dt
+        return wait
+
+    def resync(self) -> None:
+        """Restart the schedule, e.g. after the loop waited idle."""
+        self._previous_start = None
+        self._due = perf_counter()
+        self._deadline = self._due + self.target_dt
+
+    # ---------- Stats ----------
+    @property
+    def fps(self) -> float:
+        """Moving-average frame rate."""
+        return 1.0 / self._avg_interval if self._avg_interval > 0 else 0.0
+
+    @property
+    def frame_cost(self) -> float:
+        """Moving-average seconds of work per rendered frame."""
+        return self._avg_cost
+
+    @property
+    def render_quality(self) -> RenderQuality:
+        return QUALITY_LEVELS[self.quality]
+
+    # ---------- Internals ----------
+    def _average(self, average: float, sample: float) -> float:
+        if average == 0.0:
+            return sample
+        return average + self.smoothing * (sample - average)
+
+    def _adapt(self) -> None:
+        load = self._avg_cost / self.target_dt
+        self._over = self._over + 1 if load > 0.9 else 0
+        self._under = self._under + 1 if load < 0.5 else 0
+        if self._over >= self.patience and self.quality < len(QUALITY_LEVELS) - 1:
+            self.quality += 1
+            self._over = 0
+        elif self._under >= 2 * self.patience and self.quality > 0:
+            self.quality -= 1
+            self._under = 0
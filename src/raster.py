@@ -0,0 +1,143 @@
+"""
+NumPy rasterizer for projected draw lists.
+
+An alternative to the matplotlib batching step for offline export and
+thumbnails: `RasterRenderer` paints `DrawLayer`s straight into an RGB array,
+filling polygons scanline by scanline and drawing lines with distance-based
+antialiasing. Pillow is only needed to write image files.
+"""
+
+from __future__ import annotations
+
+from typing import Sequence
+
+import numpy as np
+
+from .drawlist import DrawLayer
+
+POLYGON_EDGE_WIDTH = 1.0  # points, matplotlib's default patch line width
+
+
+class RasterRenderer:
+    """Renders layers covering the viewport [0, xlim] x [0, ylim] into pixels."""
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        xlim: float = 1.0,
+        ylim: float = 1.0,
+        dpi: float = 100.0,
+        background: Sequence[float] = (1.0, 1.0, 1.0),
+    ) -> None:
+        self.width = width
+        self.height = height
+        self._scale = np.array([width / xlim, -height / ylim])
+        self._offset = np.array([0.0, float(height)])
+        self._points_to_pixels = dpi / 72.0
+        self.background = np.asarray(background[:3], dtype=np.float32)
+        self.buffer = np.empty((height, width, 3), dtype=np.float32)
+
+    # ---------- Public ----------
+    def render(self, layers: Sequence[DrawLayer]) -> np.ndarray:
+        """Paint layers in order (polygons, then lines, per layer); returns RGBA uint8."""
+        self.buffer[:] = self.background
+        for layer in layers:
+            if layer.polygons:
+                faces, edges = layer.polygon_colors()
+                for polygon, face, edge in zip(layer.polygons, faces, edges):
+                    pixels = self._to_pixels(polygon)
+                    self._fill_polygon(pixels, face)
+                    closed = np.stack([pixels, np.roll(pixels, -1, axis=0)], axis=1)
+                    for a, b in closed:
+                        self._draw_line(a, b, POLYGON_EDGE_WIDTH, edge)
+
+            segments, widths, colors = layer.line_arrays()
+            for segment, width, color in zip(segments, widths, colors):
+                a, b = self._to_pixels(segment)
+                self._draw_line(a, b, width, color)
+        return self.to_rgba()
+
+    def to_rgba(self) -> np.ndarray:
+        rgb = np.clip(self.buffer * 255.0 + 0.5, 0, 255).astype(np.uint8)
+        alpha = np.full((self.height, self.width, 1), 255, dtype=np.uint8)
+        return np.concatenate([rgb, alpha], axis=2)
+
+    def save(self, path: str, layers: Sequence[DrawLayer]) -> None:
+        """Render and write an image file (format from the suffix); needs Pillow."""
+        try:
+            from PIL import Image
+        except ImportError as exc:
+            raise RuntimeError("Saving raster images requires Pillow") from exc
+        Image.fromarray(self.render(layers), mode="RGBA").save(path)
+
+    # ---------- Internals ----------
+    def _to_pixels(self, points: np.ndarray) -> np.ndarray:
+        return np.asarray(points, dtype=np.float64) * self._scale + self._offset
+
+    def _blend(
+        self, rows: slice, cols: slice, coverage: np.ndarray, rgba: np.ndarray
+    ) -> None:
+        alpha = (coverage * rgba[3]).astype(np.float32)[..., None]
+        region = self.buffer[rows, cols]
+        region += alpha * (rgba[:3].astype(np.float32) - region)
+
+    def _fill_polygon(self, pixels: np.ndarray, rgba: np.ndarray) -> None:
+        """Even-odd scanline fill, sampling pixel centres."""
+        if len(pixels) < 3 or rgba[3] <= 0:
+            return
+        y0 = max(int(np.floor(pixels[:, 1].min())), 0)
+        y1 = min(int(np.ceil(pixels[:, 1].max())), self.height)
+        x0 = max(int(np.floor(pixels[:, 0].min())), 0)
+        x1 = min(int(np.ceil(pixels[:, 0].max())), self.width)
+        if y0 >= y1 or x0 >= x1:
+            return
+
+        ys = np.arange(y0, y1, dtype=np.float64)[:, None] + 0.5  # (R, 1)
+        ax, ay = pixels[:, 0], pixels[:, 1]
+        bx, by = np.roll(ax, -1), np.roll(ay, -1)
+        crosses = (ay <= ys) != (by <= ys)  # (R, E)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            xs = ax + (ys - ay) * (bx - ax) / (by - ay)
+        xs = np.sort(np.where(crosses, xs, np.inf), axis=1)
+
+        # Spans between crossing pairs, as +1/-1 marks over the row, then summed
+        starts, ends = xs[:, 0::2], xs[:, 1::2]
+        span = min(starts.shape[1], ends.shape[1])
+        starts, ends = starts[:, :span], ends[:, :span]
+        valid = np.isfinite(ends)
+        row = np.broadcast_to(np.arange(y1 - y0)[:, None], starts.shape)[valid]
+        first = np.clip(np.ceil(starts[valid] - 0.5) - x0, 0, x1 - x0).astype(np.intp)
+        last = np.clip(np.ceil(ends[valid] - 0.5) - x0, 0, x1 - x0).astype(np.intp)
+        marks = np.zeros((y1 - y0, x1 - x0 + 1), dtype=np.int32)
+        np.add.at(marks, (row, first), 1)
+        np.add.at(marks, (row, last), -1)
+        inside = np.cumsum(marks, axis=1)[:, :-1] > 0
+        self._blend(slice(y0, y1), slice(x0, x1), inside, rgba)
+
+    def _draw_line(
+        self, a: np.ndarray, b: np.ndarray, width: float, rgba: np.ndarray
+    ) -> None:
+        """Antialiased thick line: coverage falls off over one pixel at the edge."""
+        if rgba[3] <= 0:
+            return
+        half = max(width * self._points_to_pixels, 1.0) / 2.0
+        reach = half + 1.0
+        x0 = max(int(np.floor(min(a[0], b[0]) - reach)), 0)
+        x1 = min(int(np.ceil(max(a[0], b[0]) + reach)), self.width)
+        y0 = max(int(np.floor(min(a[1], b[1]) - reach)), 0)
+        y1 = min(int(np.ceil(max(a[1], b[1]) + reach)), self.height)
+        if x0 >= x1 or y0 >= y1:
+            return
+
+        px = np.arange(x0, x1, dtype=np.float64)[None, :] + 0.5
+        py = np.arange(y0, y1, dtype=np.float64)[:, None] + 0.5
+        d = b - a
+        length2 = float(d @ d)
+        if length2 > 0.0:
+            t = np.clip(((px - a[0]) * d[0] + (py - a[1]) * d[1]) / length2, 0.0, 1.0)
+        else:
+            t = np.zeros((1, 1))
+        dist = np.hypot(px - (a[0] + t * d[0]), py - (a[1] + t * d[1]))
+        coverage = np.clip(half + 0.5 - dist, 0.0, 1.0)
+        self._blend(slice(y0, y1), slice(x0, x1), coverage, rgba)
@@ -0,0 +1,84 @@
+"""
+Input recording and replay.
+
+An `InputRecorder` logs the duration of every frame of the window loop and
+each key press/release, stamped with the frame it takes effect on, plus
+the run settings (seed, time scale, ...) needed to rebuild the same
+session. Played back through a `ReplayClock`, the engine sees the same
+frame times and the same input on the same frames, so the simulation and
+camera follow the recorded session exactly.
+"""
+
+from __future__ import annotations
+
+import json
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+PRESS = 0
+RELEASE = 1
+
+
+@dataclass(slots=True)
+class InputLog:
+    dts: list[float] = field(default_factory=list)  # s per frame, frame 1 first
+    events: list[tuple[int, int, str]] = field(default_factory=list)  # frame, kind, key
+    settings: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def frames(self) -> int:
+        return len(self.dts)
+
+    @property
+    def duration(self) -> float:
+        return float(sum(self.dts))
+
+    def events_by_frame(self) -> dict[int, list[tuple[int, str]]]:
+        by_frame: dict[int, list[tuple[int, str]]] = defaultdict(list)
+        for frame, kind, key in self.events:
+            by_frame[frame].append((kind, key))
+        return by_frame
+
+    def save(self, path: str | Path) -> None:
+        """Write a compressed .npz log."""
+        frames, kinds, keys = zip(*self.events) if self.events else ((), (), ())
+        with Path(path).open("wb") as out:
+            np.savez_compressed(
+                out,
+                dt=np.asarray(self.dts, dtype=np.float64),
+                event_frame=np.asarray(frames, dtype=np.int64),
+                event_kind=np.asarray(kinds, dtype=np.int8),
+                event_key=np.asarray(keys, dtype=str),
+                settings=np.asarray(json.dumps(self.settings)),
+            )
+
+    @classmethod
+    def load(cls, path: str | Path) -> InputLog:
+        with np.load(path) as data:
+            events = list(
+                zip(
+                    data["event_frame"].tolist(),
+                    data["event_kind"].tolist(),
+                    data["event_key"].tolist(),
+                )
+            )
+            return cls(data["dt"].tolist(), events, json.loads(data["settings"].item()))
+
+
+class InputRecorder:
+    """Builds an `InputLog` while the window loop runs."""
+
+    def __init__(self, **settings: Any) -> None:
+        self.log = InputLog(settings=settings)
+
+    def frame(self, dt: float) -> None:
+        """Call once per frame, after the clock ticked."""
+        self.log.dts.append(dt)
+
+    def key(self, kind: int, key: str) -> None:
+        """Call as a key event is applied, at the start of the current frame."""
+        self.log.events.append((len(self.log.dts), kind, key))
@@ -1,14 +1,19 @@
 # scenario_models.py
-from typing import List, Literal
+from collections import defaultdict
+from typing import Iterable, List, Literal, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 from src.animation import Point
 
+from .assets import Person
 from .assets.backgrounds import Day
-from .assets.rides import FerrisWheel, PirateShip
-from .assets.rides.drop_tower import DropTower
+from .assets.rides import RideSpec, get_ride_type, ride_type_names
+from .camera import Camera
+from .camera_path import CameraKeyframe, CameraPath
 from .entity import EngineEntity
+from .topdown import TopDownMap
+from .viewport import Viewport
 
 
 class MapPositionModel(BaseModel):
@@ -17,11 +22,28 @@ class MapPositionModel(BaseModel):
 
 
 class RideModel(BaseModel):
-    type: Literal["FerrisWheel", "PirateShip", "DropTower"]
+    type: str
     position: MapPositionModel
     max_capacity: int = Field(..., ge=0)
     ride_time: float = Field(..., ge=0)
 
+    @field_validator("type")
+    @classmethod
+    def _registered_type(cls, value: str) -> str:
+        if value not in ride_type_names():
+            raise ValueError(
+                f"Unknown ride type {value!r}; expected one of {ride_type_names()}"
+            )
+        return value
+
+
+GUEST_TYPE = "Guest"
+
+
+class GuestModel(BaseModel):
+    type: Literal["Guest"] = GUEST_TYPE
+    position: MapPositionModel
+
 
 class RulesModel(BaseModel):
     max_guests: int = Field(..., ge=0)
@@ -29,6 +51,44 @@ class RulesModel(BaseModel):
     target_fps: int = Field(..., ge=0)
 
 
+class CameraKeyframeModel(BaseModel):
+    time: float = Field(..., ge=0)
+    x: float
+    y: float
+    height: float = Field(1.0, gt=0)
+    zoom: float = Field(1.0, gt=0)
+
+
+class CameraPathModel(BaseModel):
+    keyframes: List[CameraKeyframeModel] = Field(..., min_length=1)
+    loop: bool = False
+
+    def build(self) -> CameraPath:
+        return CameraPath(
+            (CameraKeyframe(**k.model_dump()) for k in self.keyframes), self.loop
+        )
+
+
+class ViewportModel(BaseModel):
+    """An extra view next to the main camera (e.g. a ride close-up)."""
+
+    name: str = ""
+    kind: Literal["perspective", "map"] = "perspective"
+    position: MapPositionModel = MapPositionModel(x=0.0, y=-10.0)
+    height: float = Field(1.0, gt=0)
+    zoom: float = Field(1.0, gt=0)
+    camera_path: Optional[CameraPathModel] = None
+    map_resolution: int = Field(256, gt=0)
+
+    def build(self, entities: Iterable[EngineEntity] = ()) -> Viewport:
+        camera = Camera(Point(self.position.x, self.position.y), self.height, self.zoom)
+        path = self.camera_path.build() if self.camera_path else None
+        park_map = None
+        if self.kind == "map":
+            park_map = TopDownMap.fit(entities, resolution=self.map_resolution)
+        return Viewport(camera, camera_path=path, name=self.name, map=park_map)
+
+
 class Scenario:
     """Runtime scenario that holds all live objects."""
 
@@ -38,17 +98,56 @@ class Scenario:
         background: EngineEntity,
         rules: RulesModel,
         rides: list[EngineEntity],
+        guests: list[EngineEntity] | None = None,
+        camera_path: CameraPath | None = None,
+        viewports: list[Viewport] | None = None,
     ):
         self.name = name
         self.background = background
         self.rules = rules
         self.rides: list[EngineEntity] = rides
+        self.guests: list[EngineEntity] = [] if guests is None else guests
+        self.camera_path = camera_path
+        self.viewports: list[Viewport] = [] if viewports is None else viewports
 
     def add_ride(self, ride: EngineEntity) -> None:
         self.rides.append(ride)
 
     def __repr__(self) -> str:
-        return f"<Scenario {self.name!r}, rides={len(self.rides)}>"
+        return (
+            f"<Scenario {self.name!r}, rides={len(self.rides)}, "
+            f"guests={len(self.guests)}>"
+        )
+
+
+def build_rides(rides: Iterable[RideModel]) -> list[EngineEntity]:
+    """
+    Build rides per registered type, so shared geometry is loaded once per
+    type; the result keeps the order of `rides`.
+    """
+    specs_by_type: dict[str, list[tuple[int, RideSpec]]] = defaultdict(list)
+    for index, ride_data in enumerate(rides):
+        specs_by_type[ride_data.type].append(
+            (
+                index,
+                RideSpec(
+                    position=Point(ride_data.position.x, ride_data.position.y),
+                    max_capacity=ride_data.max_capacity,
+                    ride_time=ride_data.ride_time,
+                ),
+            )
+        )
+
+    indexed: list[tuple[int, EngineEntity]] = []
+    for ride_type, entries in specs_by_type.items():
+        built = get_ride_type(ride_type).create_many([spec for _, spec in entries])
+        indexed.extend(zip((index for index, _ in entries), built))
+    indexed.sort(key=lambda pair: pair[0])
+    return [ride for _, ride in indexed]
+
+
+def build_guests(guests: Iterable[GuestModel]) -> list[EngineEntity]:
+    return [Person(Point(g.position.x, g.position.y)) for g in guests]
 
 
 class ScenarioModel(BaseModel):
@@ -58,33 +157,14 @@ class ScenarioModel(BaseModel):
     background: Literal["Day", "Night"]
     rules: RulesModel
     rides: List[RideModel] = Field(default_factory=list)
+    guests: List[GuestModel] = Field(default_factory=list)
+    camera_path: Optional[CameraPathModel] = None
+    viewports: List[ViewportModel] = Field(default_factory=list)
 
     def build(self) -> Scenario:
-        engine_entity_rides: list[EngineEntity] = []
+        engine_entity_rides = build_rides(self.rides)
+        engine_entity_guests = build_guests(self.guests)
         engine_entity_background: EngineEntity
-        for ride_data in self.rides:
-            # TODO
-            if ride_data.type == "FerrisWheel":
-                engine_entity_rides.append(
-                    FerrisWheel(
-                        position=Point(ride_data.position.x, ride_data.position.y)
-                    )
-                )
-            elif ride_data.type == "PirateShip":
-                engine_entity_rides.append(
-                    PirateShip(
-                        position=Point(ride_data.position.x, ride_data.position.y)
-                    )
-                )
-            elif ride_data.type == "DropTower":
-                engine_entity_rides.append(
-                    DropTower(
-                        position=Point(ride_data.position.x, ride_data.position.y)
-                    )
-                )
-            else:
-                raise ValueError("Invalid ride")
-
         if self.background == "Day":
             engine_entity_background = Day()
         elif self.background == "Night":
@@ -98,6 +178,12 @@ class ScenarioModel(BaseModel):
             background=engine_entity_background,
             rules=self.rules,
             rides=engine_entity_rides,
+            guests=engine_entity_guests,
+            camera_path=self.camera_path.build() if self.camera_path else None,
+            viewports=[
+                view.build(engine_entity_rides + engine_entity_guests)
+                for view in self.viewports
+            ],
         )
 
         return scenario
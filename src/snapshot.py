@@ -0,0 +1,67 @@
+"""
+Immutable scene snapshots shared between a simulation thread and the renderer.
+
+The simulation publishes a `SceneSnapshot` whenever the scene's look changes;
+the renderer always draws the latest one. Snapshots hold detached copies of
+the entities (see `EngineEntity.snapshot`), so the simulation keeps mutating
+the live ones while a frame is being drawn.
+
+`DoubleBuffer` is the lock-free hand-off underneath; other one-writer,
+many-reader state (e.g. live metrics) builds on it too.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable
+
+if TYPE_CHECKING:
+    from .entity import EngineEntity
+
+
+@dataclass(frozen=True, slots=True)
+class SceneSnapshot:
+    seq: int
+    frame: int
+    time: float
+    entities: tuple[EngineEntity, ...]
+    background: EngineEntity | None
+
+
+class DoubleBuffer[T]:
+    """
+    One writer, many readers. The writer fills the back slot and then flips
+    the front index with a single assignment, so readers never take a lock.
+    """
+
+    def __init__(self) -> None:
+        self._slots: list[T | None] = [None, None]
+        self._front = 0
+        self._seq = 0
+
+    def _publish(self, build: Callable[[int], T]) -> T:
+        """Store `build(seq)` for the next sequence number and make it current."""
+        self._seq += 1
+        item = build(self._seq)
+        back = 1 - self._front
+        self._slots[back] = item
+        self._front = back
+        return item
+
+    def latest(self) -> T | None:
+        return self._slots[self._front]
+
+
+class SnapshotBuffer(DoubleBuffer[SceneSnapshot]):
+    """Double buffer of scene snapshots."""
+
+    def publish(
+        self,
+        frame: int,
+        time: float,
+        entities: tuple[EngineEntity, ...],
+        background: EngineEntity | None,
+    ) -> SceneSnapshot:
+        return self._publish(
+            lambda seq: SceneSnapshot(seq, frame, time, entities, background)
+        )
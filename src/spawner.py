@@ -1,9 +1,19 @@
 from __future__ import annotations
 
+import logging
+import random
+from dataclasses import dataclass
+from typing import Sequence
+
 from .animation import Animation, Line, Point, Segment
 from .assets.person import Person
+from .assets.rides import RideOperation
 from .engine import EngineProtocol
 from .entity import EngineEntity
+from .events import EventScheduler
+from .log import EventCounter, event
+
+log = logging.getLogger(__name__)
 
 
 class SpawnerEntity(EngineEntity):
@@ -27,6 +37,8 @@ class SpawnerEntity(EngineEntity):
         self.max_entities = max_entities
         self._time_since_last_spawn = 0.0
         self.spawned_entities: list[EngineEntity] = []
+        # Spawns/despawns are summed and logged periodically, not one by one
+        self.activity = EventCounter(log, "Spawner activity")
 
     def update(self, clock) -> None:
         """Called every frame by the engine."""
@@ -45,6 +57,7 @@ class SpawnerEntity(EngineEntity):
         for e in list(self.spawned_entities):
             if e.position.y > 20 or getattr(e, "dead", False):
                 self.despawn(e)
+        self.activity.maybe_flush()
 
     def spawn_person(self):
         """Example: spawns a random entity near the spawner."""
@@ -52,7 +65,8 @@ class SpawnerEntity(EngineEntity):
 
         self.engine.entities.append(new_entity)
         self.spawned_entities.append(new_entity)
-        print(f"[Spawner] Spawned entity at {new_entity.position}")
+        self.activity.add("spawned")
+        event(log, "Spawned", logging.DEBUG, position=new_entity.position)
 
     def despawn(self, entity: EngineEntity):
         """Remove an entity from the engine and this spawner’s list."""
@@ -60,4 +74,80 @@ class SpawnerEntity(EngineEntity):
             self.engine.entities.remove(entity)
         if entity in self.spawned_entities:
             self.spawned_entities.remove(entity)
-        print(f"[Spawner] Despawned entity {entity}")
+        self.activity.add("despawned")
+        event(log, "Despawned", logging.DEBUG, entity=type(entity).__name__)
+
+
+@dataclass(slots=True)
+class Visit:
+    """One guest's stay in the event-driven park."""
+
+    guest_id: int
+    arrived: float
+    rides_left: int
+
+
+class EventSpawner:
+    """
+    Event-driven variant of `SpawnerEntity`: guests arrive at random
+    (exponential gaps averaging `spawn_rate` seconds), ride `rides_per_guest`
+    randomly chosen rides with `walk_time` between them, then leave. Arrivals
+    while `max_guests` are in the park are turned away.
+    """
+
+    def __init__(
+        self,
+        scheduler: EventScheduler,
+        operations: Sequence[RideOperation],
+        spawn_rate: float,
+        max_guests: int,
+        rng: random.Random,
+        rides_per_guest: int = 3,
+        walk_time: float = 60.0,
+    ) -> None:
+        self.scheduler = scheduler
+        self.operations = list(operations)
+        self.spawn_rate = spawn_rate  # mean seconds between arrivals
+        self.max_guests = max_guests
+        self.rng = rng
+        self.rides_per_guest = rides_per_guest
+        self.walk_time = walk_time
+        for operation in self.operations:
+            operation.on_unload = self._unloaded
+
+        self.in_park = 0
+        self.arrivals = 0
+        self.rejected = 0
+        self.departures = 0
+
+    def start(self) -> None:
+        if self.spawn_rate > 0 and self.operations:
+            self._schedule_arrival()
+
+    def _schedule_arrival(self) -> None:
+        gap = self.rng.expovariate(1.0 / self.spawn_rate)
+        self.scheduler.schedule_in(gap, self._arrive)
+
+    def _arrive(self) -> None:
+        self._schedule_arrival()
+        if self.in_park >= self.max_guests:
+            self.rejected += 1
+            return
+        self.arrivals += 1
+        self.in_park += 1
+        visit = Visit(self.arrivals, self.scheduler.now, self.rides_per_guest)
+        self._next_ride(visit)
+
+    def _next_ride(self, visit: Visit) -> None:
+        if visit.rides_left <= 0:
+            self.in_park -= 1
+            self.departures += 1
+            return
+        self.rng.choice(self.operations).arrive(visit)
+
+    def _unloaded(self, visits: list[Visit]) -> None:
+        for visit in visits:
+            visit.rides_left -= 1
+            self.scheduler.schedule_in(
+                self.walk_time, lambda visit=visit: self._next_ride(visit)
+            )
@@ -0,0 +1,50 @@
+"""
+Resolved colour styles.
+
+Every distinct (colour, alpha) pair used by a drawable is resolved to RGBA
+once and given an index in the shared `STYLES` table. Draw lists carry the
+indices; renderers turn them into float RGBA arrays with one gather, so
+colour names are never parsed per frame and per-primitive alpha survives
+batching.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+from matplotlib.colors import to_rgba
+
+
+class StyleTable:
+    def __init__(self) -> None:
+        self._index: dict[tuple[str, float], int] = {}
+        self._rows: list[tuple[float, float, float, float]] = []
+        self._rgba = np.empty((0, 4))
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def intern(self, color: str, alpha: float = 1.0) -> int:
+        """Index of `color` with `alpha` baked in, resolving it on first use."""
+        key = (color, float(alpha))
+        index = self._index.get(key)
+        if index is None:
+            r, g, b, a = to_rgba(color)
+            index = len(self._rows)
+            self._rows.append((r, g, b, a * alpha))
+            self._index[key] = index
+        return index
+
+    def intern_many(self, colors: list[str], alphas: list[float]) -> np.ndarray:
+        return np.array(
+            [self.intern(c, a) for c, a in zip(colors, alphas)], dtype=np.intp
+        )
+
+    @property
+    def rgba(self) -> np.ndarray:
+        """(K, 4) float table; index it with style ids to get colours."""
+        if len(self._rgba) != len(self._rows):
+            self._rgba = np.array(self._rows, dtype=np.float64).reshape(-1, 4)
+        return self._rgba
+
+
+STYLES = StyleTable()
@@ -0,0 +1,153 @@
+"""
+Simulation telemetry.
+
+`TelemetryRecorder` samples per-tick metrics into preallocated chunk arrays
+and hands each full chunk to a background writer thread, so the simulation
+loop never waits on disk. Chunks are appended as ``.npy`` members of one
+zip file (the ``.npz`` layout); `load_telemetry` joins them back into one
+array per column.
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+import zipfile
+from pathlib import Path
+from typing import Sequence
+
+import numpy as np
+
+# Per-tick columns: name -> (dtype, per-ride)
+COLUMNS: dict[str, tuple[type, bool]] = {
+    "time": (np.float64, False),  # s of simulated time
+    "step_time": (np.float32, False),  # s of wall time spent on the step
+    "guests": (np.int32, False),
+    "queue": (np.int32, True),  # guests waiting at each ride
+    "utilisation": (np.float32, True),  # queue / max_capacity, clipped to 1
+}
+
+
+class _Chunk:
+    """One preallocated block of rows for every column."""
+
+    def __init__(self, rows: int, rides: int) -> None:
+        self.arrays = {
+            name: np.zeros((rows, rides) if per_ride else rows, dtype=dtype)
+            for name, (dtype, per_ride) in COLUMNS.items()
+        }
+        self.size = 0
+        self.index = 0
+
+
+class TelemetryRecorder:
+    """Buffers metrics in memory and streams full chunks to `path` off-thread."""
+
+    def __init__(
+        self,
+        path: str | Path,
+        ride_names: Sequence[str],
+        capacities: Sequence[int],
+        chunk_size: int = 4096,
+        spare_chunks: int = 3,
+    ) -> None:
+        self.path = Path(path)
+        self.chunk_size = chunk_size
+        self.rides = len(ride_names)
+        self.capacities = np.maximum(np.asarray(capacities, dtype=np.float32), 1.0)
+        self.rows = 0
+        self.chunks_written = 0
+
+        # Chunks cycle between the recorder and the writer; when the writer
+        # falls behind a new one is allocated rather than blocking a tick
+        self._free: queue.SimpleQueue[_Chunk] = queue.SimpleQueue()
+        for _ in range(spare_chunks):
+            self._free.put(_Chunk(chunk_size, self.rides))
+        self._pending: queue.SimpleQueue[_Chunk | None] = queue.SimpleQueue()
+        self._chunk = self._take()
+        self._handed = 0
+        self._error: BaseException | None = None
+
+        with zipfile.ZipFile(self.path, "w") as archive:
+            _write_member(archive, "rides", np.array(ride_names, dtype=str))
+            _write_member(archive, "capacity", np.asarray(capacities, np.int32))
+        self._writer = threading.Thread(
+            target=self._write_loop, name="telemetry-writer", daemon=True
+        )
+        self._writer.start()
+
+    def _take(self) -> _Chunk:
+        try:
+            chunk = self._free.get_nowait()
+        except queue.Empty:
+            chunk = _Chunk(self.chunk_size, self.rides)
+        chunk.size = 0
+        return chunk
+
+    def record(
+        self, time: float, step_time: float, guests: int, queue_lengths: np.ndarray
+    ) -> None:
+        """Append one row; `queue_lengths` has one entry per ride."""
+        chunk = self._chunk
+        row, a = chunk.size, chunk.arrays
+        a["time"][row] = time
+        a["step_time"][row] = step_time
+        a["guests"][row] = guests
+        a["queue"][row] = queue_lengths
+        np.minimum(queue_lengths / self.capacities, 1.0, out=a["utilisation"][row])
+        chunk.size += 1
+        self.rows += 1
+        if chunk.size == self.chunk_size:
+            self._hand_off()
+
+    def _hand_off(self) -> None:
+        chunk = self._chunk
+        chunk.index = self._handed
+        self._handed += 1
+        self._pending.put(chunk)
+        self._chunk = self._take()
+
+    def close(self) -> None:
+        """
+        Flush the partial chunk and wait for the writer to finish. A failed
+        write is raised here, also on every later call.
+        """
+        if self._writer.is_alive():
+            if self._chunk.size:
+                self._hand_off()
+            self._pending.put(None)
+            self._writer.join()
+        if self._error is not None:
+            raise OSError(f"Telemetry write to {self.path} failed") from self._error
+
+    def _write_loop(self) -> None:
+        while (chunk := self._pending.get()) is not None:
+            if self._error is not None:
+                continue  # keep draining so close() returns
+            try:
+                with zipfile.ZipFile(self.path, "a") as archive:
+                    for name, array in chunk.arrays.items():
+                        _write_member(
+                            archive, f"{name}_{chunk.index:05d}", array[: chunk.size]
+                        )
+                self.chunks_written += 1
+            except Exception as exc:  # kept for close(); the writer stays alive
+                self._error = exc
+            self._free.put(chunk)
+
+
+def _write_member(archive: zipfile.ZipFile, name: str, array: np.ndarray) -> None:
+    with archive.open(f"{name}.npy", "w", force_zip64=True) as member:
+        np.lib.format.write_array(member, np.ascontiguousarray(array))
+
+
+def load_telemetry(path: str | Path) -> dict[str, np.ndarray]:
+    """Every column of a telemetry file, chunks joined in order."""
+    with np.load(path) as data:
+        columns = {name: data[name] for name in ("rides", "capacity")}
+        for name in COLUMNS:
+            parts = sorted(k for k in data.files if k.startswith(f"{name}_"))
+            per_ride = COLUMNS[name][1]
+            empty = np.zeros((0, len(columns["rides"])) if per_ride else 0)
+            columns[name] = np.concatenate([data[k] for k in parts]) if parts else empty
+    return columns
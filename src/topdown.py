@@ -0,0 +1,153 @@
+"""
+Top-down park map.
+
+`TopDownMap` rasterizes the whole park into one RGBA image: ride footprints
+from their position and `target_size`, guests as single cells, and a
+crowd-density heatmap accumulated over simulated time. The engine shows it
+through a single image artist, so the cost depends on the map resolution
+rather than on the number of guests. In async mode the simulation thread
+accumulates while the GUI thread renders, so the density is only touched
+under the map's lock.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Iterable
+
+import numpy as np
+from matplotlib import colormaps
+from matplotlib.colors import to_rgba
+
+from .entity import EngineEntity
+
+GROUND_COLOR = "#3a7d44"
+FOOTPRINT_COLOR = "#b0b0b0"
+FOOTPRINT_EDGE_COLOR = "#404040"
+GUEST_COLOR = "#ffffff"
+HEAT_ALPHA = 0.85
+
+
+class TopDownMap:
+    """A grid over world (x, y) with a decaying guest-density accumulator."""
+
+    def __init__(
+        self,
+        extent: tuple[float, float, float, float],
+        resolution: int = 256,
+        half_life: float | None = 60.0,
+        cmap: str = "inferno",
+    ) -> None:
+        xmin, xmax, ymin, ymax = extent
+        if xmax <= xmin or ymax <= ymin:
+            raise ValueError(f"Empty map extent {extent}")
+        self.extent = extent
+        cols = resolution
+        rows = max(1, round(resolution * (ymax - ymin) / (xmax - xmin)))
+        self.shape = (rows, cols)
+        self.half_life = half_life  # s; None keeps all history
+        self.cmap = colormaps[cmap]
+        self.density = np.zeros(self.shape, dtype=np.float64)  # guest-seconds/cell
+        self._lock = threading.Lock()  # guards `density`
+        self._scale = np.array([cols / (xmax - xmin), rows / (ymax - ymin)])
+        self._origin = np.array([xmin, ymin])
+
+    @classmethod
+    def fit(
+        cls, entities: Iterable[EngineEntity], margin: float = 5.0, **kwargs
+    ) -> TopDownMap:
+        """A map whose extent covers every entity's footprint plus `margin`."""
+        boxes = [footprint(e) for e in entities]
+        if not boxes:
+            return cls((-margin, margin, -margin, margin), **kwargs)
+        b = np.array(boxes)
+        return cls(
+            (
+                b[:, 0].min() - margin,
+                b[:, 1].max() + margin,
+                b[:, 2].min() - margin,
+                b[:, 3].max() + margin,
+            ),
+            **kwargs,
+        )
+
+    # ---------- Heatmap ----------
+    def cells(self, points: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(row, col) for world points inside the map, and the inside mask."""
+        ij = np.floor((points - self._origin) * self._scale).astype(np.intp)
+        rows, cols = self.shape
+        inside = (
+            (ij[:, 0] >= 0) & (ij[:, 0] < cols) & (ij[:, 1] >= 0) & (ij[:, 1] < rows)
+        )
+        return ij[inside, 1], ij[inside, 0], inside
+
+    def accumulate(self, guests: np.ndarray, dt: float) -> None:
+        """Add `dt` seconds of presence for each (x, y) guest position."""
+        counts = None
+        if len(guests) and dt > 0:
+            rows, cols, _ = self.cells(guests)
+            flat = rows * self.shape[1] + cols
+            counts = np.bincount(flat, minlength=self.density.size)
+        with self._lock:
+            if self.half_life:
+                self.density *= 0.5 ** (dt / self.half_life)
+            if counts is not None:
+                self.density += counts.reshape(self.shape) * dt
+
+    def reset(self) -> None:
+        with self._lock:
+            self.density[:] = 0.0
+
+    # ---------- Rendering ----------
+    def render(self, footprints: np.ndarray, guests: np.ndarray) -> np.ndarray:
+        """
+        RGBA float image (row 0 at the bottom): ground, heatmap, ride footprints
+        given as (N, 4) [xmin, xmax, ymin, ymax] boxes, then guest cells.
+        """
+        image = np.empty(self.shape + (4,), dtype=np.float32)
+        image[:] = to_rgba(GROUND_COLOR)
+
+        with self._lock:
+            density = self.density.copy()
+        peak = density.max()
+        if peak > 0:
+            level = np.sqrt(density / peak)  # keep quiet areas visible
+            heat = self.cmap(level).astype(np.float32)
+            alpha = (level * HEAT_ALPHA)[..., None].astype(np.float32)
+            image[..., :3] += alpha * (heat[..., :3] - image[..., :3])
+
+        rows, cols = self.shape
+        fill, edge = to_rgba(FOOTPRINT_COLOR), to_rgba(FOOTPRINT_EDGE_COLOR)
+        for box in footprints:
+            lo = np.floor((box[[0, 2]] - self._origin) * self._scale).astype(int)
+            hi = np.ceil((box[[1, 3]] - self._origin) * self._scale).astype(int)
+            c0, r0 = np.clip(lo, 0, [cols, rows])
+            c1, r1 = np.clip(hi, 0, [cols, rows])
+            if c0 >= c1 or r0 >= r1:
+                continue
+            image[r0:r1, c0:c1] = edge
+            if c1 - c0 > 2 and r1 - r0 > 2:
+                image[r0 + 1 : r1 - 1, c0 + 1 : c1 - 1] = fill
+
+        if len(guests):
+            r, c, _ = self.cells(guests)
+            image[r, c] = to_rgba(GUEST_COLOR)
+        return image
+
+
+def footprint(entity: EngineEntity) -> tuple[float, float, float, float]:
+    """World box covered by an entity: `target_size` width by depth from its position."""
+    x, y = entity.position.x, entity.position.y
+    size = entity.target_size
+    return (x, x + size.width, y, y + size.depth)
+
+
+def map_inputs(
+    rides: Iterable[EngineEntity], guests: Iterable[EngineEntity]
+) -> tuple[np.ndarray, np.ndarray]:
+    """(N, 4) ride footprints and (M, 2) guest positions as arrays."""
+    footprints = np.array([footprint(r) for r in rides], dtype=np.float64)
+    positions = np.array(
+        [(g.position.x, g.position.y) for g in guests], dtype=np.float64
+    )
+    return footprints.reshape(-1, 4), positions.reshape(-1, 2)
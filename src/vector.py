@@ -0,0 +1,182 @@
+"""
+Vector frame dumps.
+
+Writes projected `DrawLayer`s as SVG or PDF, one primitive at a time, with
+no matplotlib artists in between. Layers are painted in order, polygons
+before lines, matching the on-screen collections.
+"""
+
+from __future__ import annotations
+
+import io
+from pathlib import Path
+from typing import IO, Sequence
+
+import numpy as np
+
+from .drawlist import DrawLayer
+
+VECTOR_SUFFIXES = (".svg", ".pdf")
+PAGE_SIZE = 480.0  # points, the longer side of the page
+POLYGON_EDGE_WIDTH = 1.0  # points, matplotlib's default patch line width
+
+
+def write_vector(
+    path: str | Path,
+    layers: Sequence[DrawLayer],
+    xlim: float = 1.0,
+    ylim: float = 1.0,
+    background: str = "#ffffff",
+) -> None:
+    """Write `layers` (viewport coordinates) to an .svg or .pdf file."""
+    path = Path(path)
+    suffix = path.suffix.lower()
+    scale = PAGE_SIZE / max(xlim, ylim)
+    width, height = xlim * scale, ylim * scale
+    if suffix == ".svg":
+        with path.open("w", encoding="utf-8") as out:
+            _write_svg(out, layers, width, height, scale, background)
+    elif suffix == ".pdf":
+        with path.open("wb") as out:
+            _write_pdf(out, layers, width, height, scale, background)
+    else:
+        raise ValueError(
+            f"Unsupported vector format {suffix!r}; use one of {VECTOR_SUFFIXES}"
+        )
+
+
+def _hex(rgba: np.ndarray) -> str:
+    r, g, b = (int(round(c * 255)) for c in rgba[:3])
+    return f"#{r:02x}{g:02x}{b:02x}"
+
+
+# ---------- SVG ----------
+def _write_svg(
+    out: IO[str],
+    layers: Sequence[DrawLayer],
+    width: float,
+    height: float,
+    scale: float,
+    background: str,
+) -> None:
+    out.write(
+        '<svg xmlns="http://www.w3.org/2000/svg" '
+        f'width="{width:g}pt" height="{height:g}pt" '
+        f'viewBox="0 0 {width:g} {height:g}">\n'
+        f'<rect width="100%" height="100%" fill="{background}"/>\n'
+    )
+    flip = np.array([scale, -scale])
+    offset = np.array([0.0, height])
+    for layer in layers:
+        if layer.polygons:
+            faces, edges = layer.polygon_colors()
+            for polygon, face, edge in zip(layer.polygons, faces, edges):
+                points = " ".join(
+                    f"{x:.2f},{y:.2f}" for x, y in np.asarray(polygon) * flip + offset
+                )
+                out.write(
+                    f'<polygon points="{points}" fill="{_hex(face)}" '
+                    f'fill-opacity="{face[3]:.3g}" stroke="{_hex(edge)}" '
+                    f'stroke-opacity="{edge[3]:.3g}" '
+                    f'stroke-width="{POLYGON_EDGE_WIDTH:g}"/>\n'
+                )
+
+        segments, widths, colors = layer.line_arrays()
+        for (a, b), lw, color in zip(segments * flip + offset, widths, colors):
+            out.write(
+                f'<line x1="{a[0]:.2f}" y1="{a[1]:.2f}" '
+                f'x2="{b[0]:.2f}" y2="{b[1]:.2f}" stroke="{_hex(color)}" '
+                f'stroke-opacity="{color[3]:.3g}" stroke-width="{lw:.3g}"/>\n'
+            )
+    out.write("</svg>\n")
+
+
+# ---------- PDF ----------
+class _PdfStates:
+    """Named ExtGState entries for the fill (ca) and stroke (CA) alphas in use."""
+
+    def __init__(self) -> None:
+        self.names: dict[tuple[str, float], str] = {}
+
+    def get(self, key: str, alpha: float) -> str:
+        entry = (key, round(float(alpha), 3))
+        if entry not in self.names:
+            self.names[entry] = f"G{len(self.names)}"
+        return self.names[entry]
+
+    def resources(self) -> str:
+        states = " ".join(
+            f"/{name} << /{key} {alpha:g} >>"
+            for (key, alpha), name in self.names.items()
+        )
+        return f"<< /ExtGState << {states} >> >>"
+
+
+def _rgb(rgba: np.ndarray) -> str:
+    return f"{rgba[0]:.3f} {rgba[1]:.3f} {rgba[2]:.3f}"
+
+
+def _write_pdf(
+    out: IO[bytes],
+    layers: Sequence[DrawLayer],
+    width: float,
+    height: float,
+    scale: float,
+    background: str,
+) -> None:
+    from matplotlib.colors import to_rgb
+
+    states = _PdfStates()
+    content = io.StringIO()
+    content.write(
+        f"{_rgb(np.array(to_rgb(background)))} rg 0 0 {width:g} {height:g} re f\n"
+    )
+    for layer in layers:
+        if layer.polygons:
+            faces, edges = layer.polygon_colors()
+            content.write(f"{POLYGON_EDGE_WIDTH:g} w\n")
+            for polygon, face, edge in zip(layer.polygons, faces, edges):
+                points = np.asarray(polygon) * scale
+                if not len(points):
+                    continue
+                content.write(
+                    f"/{states.get('ca', face[3])} gs /{states.get('CA', edge[3])} gs "
+                    f"{_rgb(face)} rg {_rgb(edge)} RG "
+                    f"{points[0, 0]:.2f} {points[0, 1]:.2f} m "
+                )
+                content.write(" ".join(f"{x:.2f} {y:.2f} l" for x, y in points[1:]))
+                content.write(" b*\n")
+
+        segments, widths, colors = layer.line_arrays()
+        for (a, b), lw, color in zip(segments * scale, widths, colors):
+            content.write(
+                f"/{states.get('CA', color[3])} gs {_rgb(color)} RG {lw:.3g} w "
+                f"{a[0]:.2f} {a[1]:.2f} m {b[0]:.2f} {b[1]:.2f} l S\n"
+            )
+
+    stream = content.getvalue().encode("ascii")
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        (
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {width:g} {height:g}] "
+            f"/Resources {states.resources()} /Contents 4 0 R >>"
+        ).encode("ascii"),
+        b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream",
+    ]
+
+    out.write(b"%PDF-1.4\n")
+    position = len(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        chunk = b"%d 0 obj\n" % number + body + b"\nendobj\n"
+        offsets.append(position)
+        out.write(chunk)
+        position += len(chunk)
+    out.write(b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1))
+    for offset in offsets:
+        out.write(b"%010d 00000 n \n" % offset)
+    out.write(
+        b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n"
+        % (len(objects) + 1, position)
+    )
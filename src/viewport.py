@@ -0,0 +1,49 @@
+"""
+Viewports: one camera and one matplotlib axes each, all showing the same
+simulation. The engine keeps per-view dirty state here so a view is only
+redrawn when its own camera moved or the scene changed.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from .camera import Camera
+from .camera_path import CameraPath
+from .topdown import TopDownMap
+
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+    from matplotlib.image import AxesImage
+
+
+@dataclass(slots=True, eq=False)
+class Viewport:
+    camera: Camera
+    ax: Axes | None = None  # None for headless engines
+    camera_path: CameraPath | None = None  # scripted views ignore the keyboard
+    name: str = ""
+
+    # Top-down map views draw `map` through one image artist instead
+    map: TopDownMap | None = None
+    image: AxesImage | None = None
+
+    # Dirty tracking
+    moving: bool = False
+    last_pose: tuple[float, ...] | None = None
+
+    def pose_changed(self) -> bool:
+        """Refresh the stored pose; True when the camera moved since last asked."""
+        pose = self.camera.pose()
+        previous = self.last_pose
+        self.moving = previous is not None and pose[:2] != previous[:2]
+        self.last_pose = pose
+        return pose != previous
+
+
+def grid_shape(count: int) -> tuple[int, int]:
+    """(rows, cols) of the most square grid holding `count` views."""
+    cols = max(1, math.ceil(math.sqrt(count)))
+    return max(1, math.ceil(count / cols)), cols
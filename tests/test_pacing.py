@@ -0,0 +1,52 @@
+import pytest
+
+from src import pacing
+from src.pacing import FramePacer
+
+
+class FakeTime:
+    """Stands in for `perf_counter`; waits overshoot like a real event loop."""
+
+    def __init__(self, overshoot: float = 0.001) -> None:
+        self.now = 100.0
+        self.overshoot = overshoot
+
+    def __call__(self) -> float:
+        return self.now
+
+    def wait(self, seconds: float) -> None:
+        if seconds > 0:
+            self.now += seconds + self.overshoot
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeTime:
+    fake = FakeTime()
+    monkeypatch.setattr(pacing, "perf_counter", fake)
+    return fake
+
+
+def run_frames(pacer: FramePacer, clock: FakeTime, cost: float, frames: int) -> int:
+    """Drive a game loop; returns how many frames were rendered."""
+    rendered = 0
+    for _ in range(frames):
+        pacer.begin()
+        if pacer.should_render():
+            rendered += 1
+            clock.now += cost
+        clock.wait(pacer.finish())
+    return rendered
+
+
+def test_unloaded_pacer_never_skips(clock: FakeTime) -> None:
+    pacer = FramePacer(30)
+    assert run_frames(pacer, clock, cost=0.005, frames=300) == 300
+    assert pacer.quality == 0
+    assert pacer.fps == pytest.approx(30, rel=0.05)
+
+
+def test_overloaded_pacer_skips_and_lowers_quality(clock: FakeTime) -> None:
+    pacer = FramePacer(30)
+    rendered = run_frames(pacer, clock, cost=0.05, frames=300)
+    assert rendered < 300
+    assert pacer.quality > 0